@@ -8,6 +8,7 @@ from datetime import timedelta
 from typing import Any, Optional, cast
 
 import jwt
+from lru import LRU  # pylint: disable=no-name-in-module
 
 from homeassistant import data_entry_flow
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
@@ -23,6 +24,12 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+# Maximum number of verified access tokens to keep cached
+MAX_CACHED_ACCESS_TOKENS = 512
+
+# Leeway in seconds when verifying the expiration of access tokens
+ACCESS_TOKEN_LEEWAY = 10
+
 _MfaModuleDict = dict[str, MultiFactorAuthModule]
 _ProviderKey = tuple[str, Optional[str]]
 _ProviderDict = dict[_ProviderKey, AuthProvider]
@@ -158,6 +165,10 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        # Verified access tokens mapped to their refresh token and expiration
+        self._access_tokens: LRU = LRU(MAX_CACHED_ACCESS_TOKENS)
+        self._access_token_hits = 0
+        self._access_token_misses = 0
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -310,6 +321,7 @@ class AuthManager:
             await asyncio.gather(*tasks)
 
         await self._store.async_remove_user(user)
+        self._async_forget_access_tokens(user=user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -350,6 +362,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_forget_access_tokens(user=user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -474,6 +487,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_access_tokens(refresh_token=refresh_token)
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, [])
         for revoke_callback in callbacks:
@@ -554,6 +568,17 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        if (cached := self._access_tokens.get(token)) is not None:
+            refresh_token, expiration = cached
+            if (
+                dt_util.utcnow().timestamp() <= expiration + ACCESS_TOKEN_LEEWAY
+                and refresh_token.user.is_active
+            ):
+                self._access_token_hits += 1
+                return cast(models.RefreshToken, refresh_token)
+            del self._access_tokens[token]
+
+        self._access_token_misses += 1
         try:
             unverif_claims = jwt.decode(
                 token, algorithms=["HS256"], options={"verify_signature": False}
@@ -573,15 +598,48 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if isinstance(expiration := claims.get("exp"), int):
+            self._access_tokens[token] = (refresh_token, expiration)
         return refresh_token
 
+    @callback
+    def _async_forget_access_tokens(
+        self,
+        refresh_token: models.RefreshToken | None = None,
+        user: models.User | None = None,
+    ) -> None:
+        """Forget the verified access tokens of a refresh token or user."""
+        for token, (cached_refresh_token, _) in self._access_tokens.items():
+            if (
+                cached_refresh_token is refresh_token
+                or cached_refresh_token.user is user
+            ):
+                del self._access_tokens[token]
+
+    @callback
+    def async_access_token_cache_info(self) -> dict[str, Any]:
+        """Return the hit rate of the verified access token cache."""
+        lookups = self._access_token_hits + self._access_token_misses
+        return {
+            "hits": self._access_token_hits,
+            "misses": self._access_token_misses,
+            "hit_rate": self._access_token_hits / lookups if lookups else None,
+            "size": len(self._access_tokens),
+        }
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -12,6 +12,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     MATCH_ALL,
     URL_API,
@@ -28,7 +29,7 @@ import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceNotFound, TemplateError, Unauthorized
 from homeassistant.helpers import template
-from homeassistant.helpers.json import json_dumps, json_loads
+from homeassistant.helpers.json import JSON_ENCODE_EXCEPTIONS, json_dumps, json_loads
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 
@@ -175,7 +176,11 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        try:
+            body = b"[" + b",".join([state.as_dict_json() for state in states]) + b"]"
+        except JSON_ENCODE_EXCEPTIONS:
+            return self.json(states)
+        return _json_response(body)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -192,7 +197,10 @@ class APIEntityStateView(HomeAssistantView):
             raise Unauthorized(entity_id=entity_id)
 
         if state := request.app["hass"].states.get(entity_id):
-            return self.json(state)
+            try:
+                return _json_response(state.as_dict_json())
+            except JSON_ENCODE_EXCEPTIONS:
+                return self.json(state)
         return self.json_message("Entity not found.", HTTPStatus.NOT_FOUND)
 
     async def post(self, request, entity_id):
@@ -382,6 +390,13 @@ class APIErrorLog(HomeAssistantView):
         return web.FileResponse(request.app["hass"].data[DATA_LOGGING])
 
 
+def _json_response(body: bytes) -> web.Response:
+    """Return a response with JSON encoded states."""
+    response = web.Response(body=body, content_type=CONTENT_TYPE_JSON)
+    response.enable_compression()
+    return response
+
+
 async def async_services_json(hass):
     """Generate services data to JSONify."""
     descriptions = await async_get_all_descriptions(hass)
@@ -184,6 +184,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_current_user)
     websocket_api.async_register_command(hass, websocket_create_long_lived_access_token)
     websocket_api.async_register_command(hass, websocket_refresh_tokens)
+    websocket_api.async_register_command(hass, websocket_access_token_cache_info)
     websocket_api.async_register_command(hass, websocket_delete_refresh_token)
     websocket_api.async_register_command(hass, websocket_sign_path)
 
@@ -572,6 +573,16 @@ def websocket_refresh_tokens(
     connection.send_result(msg["id"], tokens)
 
 
+@websocket_api.websocket_command({vol.Required("type"): "auth/access_token_cache_info"})
+@websocket_api.require_admin
+@callback
+def websocket_access_token_cache_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the hit rate of the verified access token cache."""
+    connection.send_result(msg["id"], hass.auth.async_access_token_cache_info())
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "auth/delete_refresh_token",
@@ -26,6 +26,7 @@ from .const import (
     CONF_ADAPTER,
     CONF_DETAILS,
     CONF_PASSIVE,
+    CONF_RSSI_CHANGE_THRESHOLD,
     DATA_MANAGER,
     DEFAULT_ADDRESS,
     DOMAIN,
@@ -344,6 +345,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except ScannerStartError as err:
         raise ConfigEntryNotReady from err
     entry.async_on_unload(async_register_scanner(hass, scanner, True))
+    if (threshold := entry.options.get(CONF_RSSI_CHANGE_THRESHOLD)) is not None:
+        entry.async_on_unload(
+            _get_manager(hass).async_set_rssi_change_threshold(
+                scanner.source, threshold
+            )
+        )
     await async_update_device(hass, entry, adapter)
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = scanner
     entry.async_on_unload(entry.add_update_listener(async_update_listener))
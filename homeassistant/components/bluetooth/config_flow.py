@@ -16,6 +16,7 @@ from .const import (
     CONF_ADAPTER,
     CONF_DETAILS,
     CONF_PASSIVE,
+    CONF_RSSI_CHANGE_THRESHOLD,
     DOMAIN,
     AdapterDetails,
 )
@@ -157,6 +158,14 @@ class OptionsFlowHandler(OptionsFlow):
                     CONF_PASSIVE,
                     default=self.config_entry.options.get(CONF_PASSIVE, False),
                 ): bool,
+                vol.Optional(
+                    CONF_RSSI_CHANGE_THRESHOLD,
+                    description={
+                        "suggested_value": self.config_entry.options.get(
+                            CONF_RSSI_CHANGE_THRESHOLD
+                        )
+                    },
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
             }
         )
         return self.async_show_form(step_id="init", data_schema=data_schema)
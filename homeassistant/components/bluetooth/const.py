@@ -9,6 +9,7 @@ DOMAIN = "bluetooth"
 CONF_ADAPTER = "adapter"
 CONF_DETAILS = "details"
 CONF_PASSIVE = "passive"
+CONF_RSSI_CHANGE_THRESHOLD = "rssi_change_threshold"
 
 WINDOWS_DEFAULT_BLUETOOTH_ADAPTER = "bluetooth"
 MACOS_DEFAULT_BLUETOOTH_ADAPTER = "Core Bluetooth"
@@ -65,6 +65,9 @@ APPLE_START_BYTES_WANTED: Final = {
 }
 
 RSSI_SWITCH_THRESHOLD = 6
+# Unchanged advertisements are still dispatched this often so subscribers
+# that act on every advertisement (ex. polling) keep seeing the device
+UNCHANGED_ADVERTISEMENT_DISPATCH_SECONDS: Final = 60
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -109,6 +112,26 @@ def _prefer_previous_adv(
     return old.source != new.source
 
 
+def _advertisement_unchanged(
+    old: BluetoothServiceInfoBleak,
+    new: BluetoothServiceInfoBleak,
+    rssi_change_threshold: int,
+) -> bool:
+    """Return if the new advertisement does not need to be dispatched."""
+    if new.time - old.time > UNCHANGED_ADVERTISEMENT_DISPATCH_SECONDS:
+        return False
+    if abs(new.device.rssi - old.device.rssi) >= rssi_change_threshold:
+        return False
+    return (
+        old.source == new.source
+        and old.connectable == new.connectable
+        and old.manufacturer_data == new.manufacturer_data
+        and old.service_data == new.service_data
+        and old.service_uuids == new.service_uuids
+        and old.name == new.name
+    )
+
+
 def _dispatch_bleak_callback(
     callback: AdvertisementDataCallback,
     filters: dict[str, set[str]],
@@ -152,10 +175,19 @@ class BluetoothManager:
             tuple[AdvertisementDataCallback, dict[str, set[str]]]
         ] = []
         self._history: dict[str, BluetoothServiceInfoBleak] = {}
+        self._dispatched: dict[str, BluetoothServiceInfoBleak] = {}
         self._connectable_history: dict[str, BluetoothServiceInfoBleak] = {}
         self._non_connectable_scanners: list[BaseHaScanner] = []
         self._connectable_scanners: list[BaseHaScanner] = []
         self._adapters: dict[str, AdapterDetails] = {}
+        # Advertisements from a source with a threshold set that have an
+        # unchanged payload are only dispatched when the RSSI changed at
+        # least this much since the last dispatched advertisement.
+        # Subscribers like the bleak scanner wrappers expect every
+        # advertisement, so this is off unless the scanner options set it.
+        self._rssi_change_thresholds: dict[str, int] = {}
+        self._processed_advertisements = 0
+        self._skipped_advertisements = 0
 
     @property
     def supports_passive_scan(self) -> bool:
@@ -188,6 +220,10 @@ class BluetoothManager:
             "history": [
                 asdict(service_info) for service_info in self._history.values()
             ],
+            "advertisements": {
+                "processed": self._processed_advertisements,
+                "skipped": self._skipped_advertisements,
+            },
         }
 
     def _find_adapter_by_address(self, address: str) -> str | None:
@@ -270,6 +306,8 @@ class BluetoothManager:
             disappeared = history_set.difference(active_addresses)
             for address in disappeared:
                 del history[address]
+                # Make sure the device is dispatched again when it comes back
+                self._dispatched.pop(address, None)
                 if not (callbacks := unavailable_callbacks.get(address)):
                     continue
                 for callback in callbacks:
@@ -321,10 +359,27 @@ class BluetoothManager:
             return
 
         self._history[address] = service_info
+        if connectable:
+            self._connectable_history[address] = service_info
+
+        # The history must always be updated so the device stays available,
+        # but with an RSSI change threshold set, an advertisement with the
+        # same payload as the one that was last dispatched is not matched
+        # and dispatched again.
+        if (
+            threshold := self._rssi_change_thresholds.get(service_info.source)
+        ) is not None:
+            dispatched = self._dispatched.get(address)
+            if dispatched and _advertisement_unchanged(
+                dispatched, service_info, threshold
+            ):
+                self._skipped_advertisements += 1
+                return
+            self._dispatched[address] = service_info
+        self._processed_advertisements += 1
         source = service_info.source
 
         if connectable:
-            self._connectable_history[address] = service_info
             # Bleak callbacks must get a connectable device
 
             for callback_filters in self._bleak_callbacks:
@@ -390,6 +445,11 @@ class BluetoothManager:
 
         connectable = callback_matcher[CONNECTABLE]
         self._callback_index.add_with_address(callback_matcher)
+        if ADDRESS not in callback_matcher:
+            # There is no history to replay for callbacks that match
+            # any address, dispatch the next advertisement of every
+            # device again so the subscriber gets to see them.
+            self._dispatched.clear()
 
         @hass_callback
         def _async_remove_callback() -> None:
@@ -437,6 +497,7 @@ class BluetoothManager:
     def async_rediscover_address(self, address: str) -> None:
         """Trigger discovery of devices which have already been seen."""
         self._integration_matcher.async_clear_address(address)
+        self._dispatched.pop(address, None)
 
     def _get_scanners_by_type(self, connectable: bool) -> list[BaseHaScanner]:
         """Return the scanners by type."""
@@ -470,10 +531,26 @@ class BluetoothManager:
 
         def _unregister_scanner() -> None:
             scanners.remove(scanner)
+            self._dispatched.clear()
 
         scanners.append(scanner)
+        self._dispatched.clear()
         return _unregister_scanner
 
+    @hass_callback
+    def async_set_rssi_change_threshold(
+        self, source: str, threshold: int
+    ) -> CALLBACK_TYPE:
+        """Skip unchanged advertisements of a source unless the RSSI changed."""
+
+        def _clear_rssi_change_threshold() -> None:
+            del self._rssi_change_thresholds[source]
+            self._dispatched.clear()
+
+        self._rssi_change_thresholds[source] = threshold
+        self._dispatched.clear()
+        return _clear_rssi_change_threshold
+
     @hass_callback
     def async_register_bleak_callback(
         self, callback: AdvertisementDataCallback, filters: dict[str, set[str]]
@@ -34,6 +34,8 @@ MANUFACTURER_DATA_START: Final = "manufacturer_data_start"
 
 LOCAL_NAME_MIN_MATCH_LENGTH = 3
 
+_LOCAL_NAME_PATTERN_CHARS = re.compile(r"[*?\[]")
+
 
 class BluetoothCallbackMatcherOptional(TypedDict, total=False):
     """Matcher for the bluetooth integration for callback optional fields."""
@@ -159,16 +161,22 @@ class BluetoothMatcherIndexBase(Generic[_T]):
     likely to match. This allows us to only check the service infos
     against each bucket to see if we should match against the data.
 
+    Local name matchers are bucketed by the first characters of their
+    pattern and then by the literal prefix of the pattern, so only the
+    matchers whose literal prefix matches the name have to be evaluated.
+    Manufacturer id matchers are bucketed by the first byte of their
+    manufacturer_data_start in the same way.
+
     This is optimized for cases when no service infos will be matched in
     any bucket and we can quickly reject the service info as not matching.
     """
 
     def __init__(self) -> None:
         """Initialize the matcher index."""
-        self.local_name: dict[str, list[_T]] = {}
+        self.local_name: dict[str, dict[str, list[_T]]] = {}
         self.service_uuid: dict[str, list[_T]] = {}
         self.service_data_uuid: dict[str, list[_T]] = {}
-        self.manufacturer_id: dict[int, list[_T]] = {}
+        self.manufacturer_id: dict[int, dict[int | None, list[_T]]] = {}
         self.service_uuid_set: set[str] = set()
         self.service_data_uuid_set: set[str] = set()
         self.manufacturer_id_set: set[int] = set()
@@ -182,16 +190,17 @@ class BluetoothMatcherIndexBase(Generic[_T]):
         """
         # Local name is the cheapest to match since its just a dict lookup
         if LOCAL_NAME in matcher:
+            prefix = _local_name_literal_prefix(matcher[LOCAL_NAME])
             self.local_name.setdefault(
-                _local_name_to_index_key(matcher[LOCAL_NAME]), []
-            ).append(matcher)
+                prefix[:LOCAL_NAME_MIN_MATCH_LENGTH], {}
+            ).setdefault(prefix, []).append(matcher)
             return
 
         # Manufacturer data is 2nd cheapest since its all ints
         if MANUFACTURER_ID in matcher:
-            self.manufacturer_id.setdefault(matcher[MANUFACTURER_ID], []).append(
-                matcher
-            )
+            self.manufacturer_id.setdefault(matcher[MANUFACTURER_ID], {}).setdefault(
+                _manufacturer_data_start_byte(matcher), []
+            ).append(matcher)
             return
 
         if SERVICE_UUID in matcher:
@@ -211,13 +220,19 @@ class BluetoothMatcherIndexBase(Generic[_T]):
         removed one, we are done.
         """
         if LOCAL_NAME in matcher:
-            self.local_name[_local_name_to_index_key(matcher[LOCAL_NAME])].remove(
-                matcher
-            )
+            prefix = _local_name_literal_prefix(matcher[LOCAL_NAME])
+            prefixes = self.local_name[prefix[:LOCAL_NAME_MIN_MATCH_LENGTH]]
+            prefixes[prefix].remove(matcher)
+            if not prefixes[prefix]:
+                del prefixes[prefix]
             return
 
         if MANUFACTURER_ID in matcher:
-            self.manufacturer_id[matcher[MANUFACTURER_ID]].remove(matcher)
+            start_bytes = self.manufacturer_id[matcher[MANUFACTURER_ID]]
+            start_byte = _manufacturer_data_start_byte(matcher)
+            start_bytes[start_byte].remove(matcher)
+            if not start_bytes[start_byte]:
+                del start_bytes[start_byte]
             return
 
         if SERVICE_UUID in matcher:
@@ -237,14 +252,19 @@ class BluetoothMatcherIndexBase(Generic[_T]):
     def match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
         """Check for a match."""
         matches = []
-        if service_info.name and len(service_info.name) >= LOCAL_NAME_MIN_MATCH_LENGTH:
-            for matcher in self.local_name.get(
-                service_info.name[:LOCAL_NAME_MIN_MATCH_LENGTH], []
-            ):
-                if ble_device_matches(matcher, service_info):
-                    matches.append(matcher)
+        if (
+            (name := service_info.name)
+            and len(name) >= LOCAL_NAME_MIN_MATCH_LENGTH
+            and (prefixes := self.local_name.get(name[:LOCAL_NAME_MIN_MATCH_LENGTH]))
+        ):
+            for prefix, matchers in prefixes.items():
+                if not name.startswith(prefix):
+                    continue
+                for matcher in matchers:
+                    if ble_device_matches(matcher, service_info):
+                        matches.append(matcher)
 
-        if self.service_data_uuid_set and service_info.service_data:
+        if not self.service_data_uuid_set.isdisjoint(service_info.service_data):
             for service_data_uuid in self.service_data_uuid_set.intersection(
                 service_info.service_data
             ):
@@ -252,15 +272,23 @@ class BluetoothMatcherIndexBase(Generic[_T]):
                     if ble_device_matches(matcher, service_info):
                         matches.append(matcher)
 
-        if self.manufacturer_id_set and service_info.manufacturer_data:
+        manufacturer_data = service_info.manufacturer_data
+        if not self.manufacturer_id_set.isdisjoint(manufacturer_data):
+            start_bytes = {data[0] for data in manufacturer_data.values() if data}
+            start_bytes.add(None)
             for manufacturer_id in self.manufacturer_id_set.intersection(
-                service_info.manufacturer_data
+                manufacturer_data
             ):
-                for matcher in self.manufacturer_id[manufacturer_id]:
-                    if ble_device_matches(matcher, service_info):
-                        matches.append(matcher)
-
-        if self.service_uuid_set and service_info.service_uuids:
+                for start_byte, matchers in self.manufacturer_id[
+                    manufacturer_id
+                ].items():
+                    if start_byte not in start_bytes:
+                        continue
+                    for matcher in matchers:
+                        if ble_device_matches(matcher, service_info):
+                            matches.append(matcher)
+
+        if not self.service_uuid_set.isdisjoint(service_info.service_uuids):
             for service_uuid in self.service_uuid_set.intersection(
                 service_info.service_uuids
             ):
@@ -325,8 +353,11 @@ class BluetoothCallbackMatcherIndex(
         return matches
 
 
-def _local_name_to_index_key(local_name: str) -> str:
-    """Convert a local name to an index.
+def _local_name_literal_prefix(local_name: str) -> str:
+    """Convert a local name to the literal prefix used to index it.
+
+    The prefix is the part of the local name before the first pattern
+    character.
 
     We check the local name matchers here and raise a ValueError
     if they try to setup a matcher that will is overly broad
@@ -344,7 +375,14 @@ def _local_name_to_index_key(local_name: str) -> str:
             f"{LOCAL_NAME_MIN_MATCH_LENGTH} characters because they "
             f"would match too broadly ({local_name})"
         )
-    return match_part
+    return _LOCAL_NAME_PATTERN_CHARS.split(local_name, 1)[0]
+
+
+def _manufacturer_data_start_byte(matcher: BluetoothMatcherOptional) -> int | None:
+    """Return the first byte a matcher requires the manufacturer data to start with."""
+    if manufacturer_data_start := matcher.get(MANUFACTURER_DATA_START):
+        return manufacturer_data_start[0]
+    return None
 
 
 def ble_device_matches(
@@ -0,0 +1,280 @@
+"""Cache of pre-aggregated energy statistics."""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, Literal
+
+from lru import LRU  # pylint: disable=no-name-in-module
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.const import (
+    SIGNAL_HOURLY_STATISTICS_COMPILED,
+    SIGNAL_STATISTICS_UPDATED,
+)
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.singleton import singleton
+
+from .const import DOMAIN
+
+# Maximum number of combinations of energy and CO2 statistics to keep cached
+MAX_CACHED_FOSSIL_ENERGY = 8
+
+FossilEnergyKey = tuple[tuple[str, ...], str]
+
+
+class FossilEnergyStatistics:
+    """Hourly fossil energy for one set of energy and CO2 statistics.
+
+    Holds the combined hourly sums of the energy statistics from the first
+    requested hour onwards, the fossil energy delta of every hour and the daily
+    and monthly totals of those deltas. The totals are extended incrementally
+    when new hourly statistics are compiled, so requests only need to look at
+    the hourly deltas of the periods at the edges of the requested window.
+    """
+
+    def __init__(self, energy_statistic_ids: list[str], co2_statistic_id: str) -> None:
+        """Initialize the fossil energy statistics."""
+        self.energy_statistic_ids = energy_statistic_ids
+        self.co2_statistic_id = co2_statistic_id
+        self.start: datetime | None = None
+        self.stale = False
+        self.lock = asyncio.Lock()
+        self._sums: dict[datetime, float] = {}
+        self._co2: dict[datetime, float] = {}
+        self._hours: list[datetime] = []
+        self._fossil: dict[datetime, float] = {}
+        self._periods: dict[
+            Literal["day", "month"],
+            tuple[Callable[[datetime], tuple[datetime, datetime]], list[datetime]],
+        ] = {
+            "day": (recorder.statistics.day_start_end, []),
+            "month": (recorder.statistics.month_start_end, []),
+        }
+        self._totals: dict[Literal["day", "month"], dict[datetime, float]] = {
+            "day": {},
+            "month": {},
+        }
+
+    def _fetch(
+        self, hass: HomeAssistant, start_time: datetime, end_time: datetime | None
+    ) -> tuple[dict[datetime, float], dict[datetime, float]]:
+        """Fetch combined energy sums and CO2 ratios from the database."""
+        statistics = recorder.statistics.statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            [*self.energy_statistic_ids, self.co2_statistic_id],
+            "hour",
+            True,
+        )
+        sums: defaultdict[datetime, float] = defaultdict(float)
+        for statistic_id, stat in statistics.items():
+            if statistic_id not in self.energy_statistic_ids:
+                continue
+            for period in stat:
+                if period["sum"] is None:
+                    continue
+                sums[period["start"]] += period["sum"]
+        co2 = {
+            period["start"]: period["mean"]
+            for period in statistics.get(self.co2_statistic_id, {})
+        }
+        return {key: sums[key] for key in sorted(sums)}, co2
+
+    async def async_update(self, hass: HomeAssistant, start_time: datetime) -> None:
+        """Make sure the cache covers start_time and is up to date."""
+        instance = recorder.get_instance(hass)
+        if self.start is None or start_time < self.start:
+            sums, co2 = await instance.async_add_executor_job(
+                self._fetch, hass, start_time, self.start
+            )
+            self._sums = {**sums, **self._sums}
+            self._co2 = {**co2, **self._co2}
+            self.start = start_time
+            self._rebuild()
+        if not self.stale:
+            return
+        # The most recent hour is fetched again since it may not have been
+        # compiled for all statistics when it was fetched last time
+        self.stale = False
+        last_hour = self._hours[-1] if self._hours else self.start
+        sums, co2 = await instance.async_add_executor_job(
+            self._fetch, hass, last_hour, None
+        )
+        if self._hours:
+            self._remove_last_hour()
+        self._co2.update(co2)
+        for hour, sum_ in sums.items():
+            self._append(hour, sum_)
+
+    def _rebuild(self) -> None:
+        """Rebuild the hourly deltas and period totals from the sums."""
+        sums = self._sums
+        self._sums = {}
+        self._hours = []
+        self._fossil = {}
+        for starts in self._periods.values():
+            starts[1].clear()
+        for totals in self._totals.values():
+            totals.clear()
+        for hour, sum_ in sums.items():
+            self._append(hour, sum_)
+
+    def _append(self, hour: datetime, sum_: float) -> None:
+        """Append the combined energy sum of an hour."""
+        if self._hours:
+            prev_sum = self._sums[self._hours[-1]]
+            fossil = (sum_ - prev_sum) * self._co2.get(hour, 100) / 100
+            self._fossil[hour] = fossil
+            for period, (period_start_end, starts) in self._periods.items():
+                start, _ = period_start_end(hour)
+                totals = self._totals[period]
+                if start not in totals:
+                    starts.append(start)
+                    totals[start] = 0
+                totals[start] += fossil
+        self._sums[hour] = sum_
+        self._hours.append(hour)
+
+    def _remove_last_hour(self) -> None:
+        """Remove the most recent hour, undoing its contribution to the totals."""
+        hour = self._hours.pop()
+        del self._sums[hour]
+        if (fossil := self._fossil.pop(hour, None)) is None:
+            return
+        for period, (period_start_end, starts) in self._periods.items():
+            start, _ = period_start_end(hour)
+            totals = self._totals[period]
+            if self._hours and period_start_end(self._hours[-1])[0] == start:
+                totals[start] -= fossil
+                continue
+            starts.pop()
+            del totals[start]
+
+    @callback
+    def async_fossil_energy(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        period: Literal["5minute", "hour", "day", "month"],
+    ) -> dict[str, float]:
+        """Return fossil energy deltas per period in the window."""
+        # The first hour in the window has no delta
+        first = bisect_left(self._hours, start_time) + 1
+        last = bisect_left(self._hours, end_time)
+        hours = self._hours
+        fossil = self._fossil
+        if first >= last:
+            return {}
+
+        if period == "hour":
+            return {
+                hours[idx].isoformat(): fossil[hours[idx]] for idx in range(first, last)
+            }
+
+        reduce_to: Literal["day", "month"] = "day" if period == "day" else "month"
+        period_start_end, starts = self._periods[reduce_to]
+        totals = self._totals[reduce_to]
+        first_start, first_end = period_start_end(hours[first])
+        last_start, _ = period_start_end(hours[last - 1])
+
+        if first_start == last_start:
+            return {
+                first_start.isoformat(): sum(
+                    fossil[hours[idx]] for idx in range(first, last)
+                )
+            }
+
+        # Periods at the edges of the window are only partly covered, the
+        # periods in between are read from the cached totals
+        first_end_idx = bisect_left(hours, first_end, first, last)
+        last_start_idx = bisect_left(hours, last_start, first, last)
+        result = {
+            first_start.isoformat(): sum(
+                fossil[hours[idx]] for idx in range(first, first_end_idx)
+            )
+        }
+        for idx in range(
+            bisect_left(starts, first_end), bisect_left(starts, last_start)
+        ):
+            result[starts[idx].isoformat()] = totals[starts[idx]]
+        result[last_start.isoformat()] = sum(
+            fossil[hours[idx]] for idx in range(last_start_idx, last)
+        )
+        return result
+
+
+class EnergyStatisticsCache:
+    """Cache of pre-aggregated energy statistics used by the energy dashboard."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._fossil_energy: LRU = LRU(MAX_CACHED_FOSSIL_ENERGY)
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen for changes of the statistics."""
+        async_dispatcher_connect(
+            self.hass, SIGNAL_HOURLY_STATISTICS_COMPILED, self._async_hour_compiled
+        )
+        async_dispatcher_connect(
+            self.hass, SIGNAL_STATISTICS_UPDATED, self._async_statistics_updated
+        )
+        self.hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._async_clear)
+
+    @callback
+    def _async_hour_compiled(self, _hour: datetime) -> None:
+        """Mark cached statistics as needing an update."""
+        for fossil_energy in self._fossil_energy.values():
+            fossil_energy.stale = True
+
+    @callback
+    def _async_statistics_updated(self, statistic_ids: list[str]) -> None:
+        """Drop cached statistics depending on changed statistics."""
+        updated = set(statistic_ids)
+        for key in list(self._fossil_energy.keys()):
+            energy_statistic_ids, co2_statistic_id = key
+            if co2_statistic_id in updated or updated.intersection(
+                energy_statistic_ids
+            ):
+                del self._fossil_energy[key]
+
+    @callback
+    def _async_clear(self, _event: Event | None = None) -> None:
+        """Drop all cached statistics."""
+        self._fossil_energy.clear()
+
+    async def async_get_fossil_energy_consumption(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        energy_statistic_ids: list[str],
+        co2_statistic_id: str,
+        period: Literal["5minute", "hour", "day", "month"],
+    ) -> dict[str, Any]:
+        """Return the fossil energy consumption per period."""
+        key: FossilEnergyKey = (tuple(energy_statistic_ids), co2_statistic_id)
+        if (fossil_energy := self._fossil_energy.get(key)) is None:
+            fossil_energy = FossilEnergyStatistics(
+                energy_statistic_ids, co2_statistic_id
+            )
+            self._fossil_energy[key] = fossil_energy
+        async with fossil_energy.lock:
+            await fossil_energy.async_update(self.hass, start_time)
+            return fossil_energy.async_fossil_energy(start_time, end_time, period)
+
+
+@callback
+@singleton(f"{DOMAIN}_statistics_cache")
+def async_get_statistics_cache(hass: HomeAssistant) -> EnergyStatisticsCache:
+    """Return the energy statistics cache."""
+    cache = EnergyStatisticsCache(hass)
+    cache.async_setup()
+    return cache
@@ -2,17 +2,14 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Awaitable, Callable
-from datetime import datetime, timedelta
 import functools
-from itertools import chain
 from types import ModuleType
 from typing import Any, cast
 
 import voluptuous as vol
 
-from homeassistant.components import recorder, websocket_api
+from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
@@ -28,6 +25,7 @@ from .data import (
     EnergyPreferencesUpdate,
     async_get_manager,
 )
+from .statistics_cache import async_get_statistics_cache
 from .types import EnergyPlatform, GetSolarForecastType
 from .validate import async_validate
 
@@ -256,113 +254,11 @@ async def ws_get_fossil_energy_consumption(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
-    statistic_ids = list(msg["energy_statistic_ids"])
-    statistic_ids.append(msg["co2_statistic_id"])
-
-    # Fetch energy + CO2 statistics
-    statistics = await recorder.get_instance(hass).async_add_executor_job(
-        recorder.statistics.statistics_during_period,
-        hass,
+    result = await async_get_statistics_cache(hass).async_get_fossil_energy_consumption(
         start_time,
         end_time,
-        statistic_ids,
-        "hour",
-        True,
-    )
-
-    def _combine_sum_statistics(
-        stats: dict[str, list[dict[str, Any]]], statistic_ids: list[str]
-    ) -> dict[datetime, float]:
-        """Combine multiple statistics, returns a dict indexed by start time."""
-        result: defaultdict[datetime, float] = defaultdict(float)
-
-        for statistics_id, stat in stats.items():
-            if statistics_id not in statistic_ids:
-                continue
-            for period in stat:
-                if period["sum"] is None:
-                    continue
-                result[period["start"]] += period["sum"]
-
-        return {key: result[key] for key in sorted(result)}
-
-    def _calculate_deltas(sums: dict[datetime, float]) -> dict[datetime, float]:
-        prev: float | None = None
-        result: dict[datetime, float] = {}
-        for period, sum_ in sums.items():
-            if prev is not None:
-                result[period] = sum_ - prev
-            prev = sum_
-        return result
-
-    def _reduce_deltas(
-        stat_list: list[dict[str, Any]],
-        same_period: Callable[[datetime, datetime], bool],
-        period_start_end: Callable[[datetime], tuple[datetime, datetime]],
-        period: timedelta,
-    ) -> list[dict[str, Any]]:
-        """Reduce hourly deltas to daily or monthly deltas."""
-        result: list[dict[str, Any]] = []
-        deltas: list[float] = []
-        if not stat_list:
-            return result
-        prev_stat: dict[str, Any] = stat_list[0]
-
-        # Loop over the hourly deltas + a fake entry to end the period
-        for statistic in chain(
-            stat_list, ({"start": stat_list[-1]["start"] + period},)
-        ):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, _ = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                result.append(
-                    {
-                        "start": start.isoformat(),
-                        "delta": sum(deltas),
-                    }
-                )
-                deltas = []
-            if statistic.get("delta") is not None:
-                deltas.append(statistic["delta"])
-            prev_stat = statistic
-
-        return result
-
-    merged_energy_statistics = _combine_sum_statistics(
-        statistics, msg["energy_statistic_ids"]
+        msg["energy_statistic_ids"],
+        msg["co2_statistic_id"],
+        msg["period"],
     )
-    energy_deltas = _calculate_deltas(merged_energy_statistics)
-    indexed_co2_statistics = {
-        period["start"]: period["mean"]
-        for period in statistics.get(msg["co2_statistic_id"], {})
-    }
-
-    # Calculate amount of fossil based energy, assume 100% fossil if missing
-    fossil_energy = [
-        {"start": start, "delta": delta * indexed_co2_statistics.get(start, 100) / 100}
-        for start, delta in energy_deltas.items()
-    ]
-
-    if msg["period"] == "hour":
-        reduced_fossil_energy = [
-            {"start": period["start"].isoformat(), "delta": period["delta"]}
-            for period in fossil_energy
-        ]
-
-    elif msg["period"] == "day":
-        reduced_fossil_energy = _reduce_deltas(
-            fossil_energy,
-            recorder.statistics.same_day,
-            recorder.statistics.day_start_end,
-            timedelta(days=1),
-        )
-    else:
-        reduced_fossil_energy = _reduce_deltas(
-            fossil_energy,
-            recorder.statistics.same_month,
-            recorder.statistics.month_start_end,
-            timedelta(days=1),
-        )
-
-    result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
     connection.send_result(msg["id"], result)
@@ -119,6 +119,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    resolution: int | None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
     states = history.get_significant_states(
@@ -132,6 +133,7 @@ def _ws_get_significant_states(
         minimal_response,
         no_attributes,
         True,
+        resolution,
     )
 
     if not use_include_order or not filters:
@@ -160,6 +162,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("resolution"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -218,6 +221,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("resolution"),
         )
     )
 
@@ -271,6 +275,14 @@ class HistoryPeriodView(HomeAssistantView):
 
         minimal_response = "minimal_response" in request.query
         no_attributes = "no_attributes" in request.query
+        resolution = None
+        if resolution_str := request.query.get("resolution"):
+            try:
+                resolution = int(resolution_str)
+            except ValueError:
+                resolution = 0
+            if resolution < 1:
+                return self.json_message("Invalid resolution", HTTPStatus.BAD_REQUEST)
 
         hass = request.app["hass"]
 
@@ -293,6 +305,7 @@ class HistoryPeriodView(HomeAssistantView):
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
+                resolution,
             ),
         )
 
@@ -306,6 +319,7 @@ class HistoryPeriodView(HomeAssistantView):
         significant_changes_only: bool,
         minimal_response: bool,
         no_attributes: bool,
+        resolution: int | None,
     ) -> web.Response:
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
@@ -322,6 +336,7 @@ class HistoryPeriodView(HomeAssistantView):
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
+                resolution=resolution,
             )
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
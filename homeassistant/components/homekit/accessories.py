@@ -1,7 +1,9 @@
 """Extend the basic Accessory and Bridge functions."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from time import monotonic
 from typing import Any, cast
 from uuid import UUID
 
@@ -64,7 +66,9 @@ from .const import (
     CONF_LOW_BATTERY_THRESHOLD,
     DEFAULT_LOW_BATTERY_THRESHOLD,
     DOMAIN,
+    EVENT_COALESCE_WINDOW,
     EVENT_HOMEKIT_CHANGED,
+    EVENT_RATE_WINDOW,
     HK_CHARGING,
     HK_NOT_CHARGABLE,
     HK_NOT_CHARGING,
@@ -606,6 +610,97 @@ class HomeDriver(AccessoryDriver):  # type: ignore[misc]
         self._entry_id = entry_id
         self._bridge_name = bridge_name
         self._entry_title = entry_title
+        self._pending_events: dict[str, tuple[dict[str, Any], str | None]] = {}
+        self._send_events_handle: asyncio.TimerHandle | None = None
+        self.events_sent = 0
+        self.notifications_sent = 0
+        # The rate is taken over the current and the previous window
+        self._rate_window_start = self._previous_rate_window_start = monotonic()
+        self._rate_window_notifications = self._previous_rate_window_notifications = 0
+
+    def async_send_event(
+        self,
+        topic: str,
+        data: dict[str, Any],
+        sender_client_addr: str | None,
+        immediate: bool,
+    ) -> None:
+        """Gather characteristic changes of all accessories of the bridge.
+
+        Changes are sent together once the window expires, or right away with
+        the next change that has to be sent immediately, like a button press.
+        """
+        self._pending_events[topic] = (data, sender_client_addr)
+        if immediate:
+            self._async_send_pending_events()
+        elif self._send_events_handle is None:
+            self._send_events_handle = self.hass.loop.call_later(
+                EVENT_COALESCE_WINDOW, self._async_send_pending_events
+            )
+
+    @ha_callback
+    def _async_send_pending_events(self) -> None:
+        """Send the gathered characteristic changes to the subscribed clients."""
+        if self._send_events_handle is not None:
+            self._send_events_handle.cancel()
+            self._send_events_handle = None
+        pending = self._pending_events
+        self._pending_events = {}
+        clients: set[str] = set()
+        for topic, (data, sender_client_addr) in pending.items():
+            clients.update(
+                client_addr
+                for client_addr in self.topics.get(topic, ())
+                if client_addr != sender_client_addr
+            )
+            # Events pushed immediately within the same loop iteration are
+            # written to each client in a single notification
+            super().async_send_event(topic, data, sender_client_addr, True)
+
+        self.events_sent += len(pending)
+        self.notifications_sent += len(clients)
+        self._async_roll_rate_window(monotonic())
+        self._rate_window_notifications += len(clients)
+
+    @ha_callback
+    def _async_roll_rate_window(self, now: float) -> None:
+        """Start a new rate window once the current one has ended."""
+        if (elapsed := now - self._rate_window_start) < EVENT_RATE_WINDOW:
+            return
+        if elapsed < 2 * EVENT_RATE_WINDOW:
+            self._previous_rate_window_start = self._rate_window_start
+            self._previous_rate_window_notifications = self._rate_window_notifications
+        else:
+            # Nothing was sent during the last window
+            self._previous_rate_window_start = now - EVENT_RATE_WINDOW
+            self._previous_rate_window_notifications = 0
+        self._rate_window_start = now
+        self._rate_window_notifications = 0
+
+    async def async_stop(self) -> None:
+        """Stop the driver and drop the gathered characteristic changes."""
+        if self._send_events_handle is not None:
+            self._send_events_handle.cancel()
+            self._send_events_handle = None
+        self._pending_events.clear()
+        await super().async_stop()
+
+    @property
+    def event_stats(self) -> dict[str, Any]:
+        """Return counters of the sent characteristic changes."""
+        now = monotonic()
+        self._async_roll_rate_window(now)
+        notifications_per_second = 0.0
+        if elapsed := now - self._previous_rate_window_start:
+            notifications_per_second = (
+                self._previous_rate_window_notifications
+                + self._rate_window_notifications
+            ) / elapsed
+        return {
+            "events_sent": self.events_sent,
+            "notifications_sent": self.notifications_sent,
+            "notifications_per_second": round(notifications_per_second, 2),
+        }
 
     @pyhap_callback  # type: ignore[misc]
     def pair(
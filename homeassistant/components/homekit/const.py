@@ -4,6 +4,10 @@ from homeassistant.const import CONF_DEVICES
 
 # #### Misc ####
 DEBOUNCE_TIMEOUT = 0.5
+# Seconds during which characteristic changes are gathered into one event
+EVENT_COALESCE_WINDOW = 0.5
+# Seconds over which the rate of sent event notifications is measured
+EVENT_RATE_WINDOW = 10
 DEVICE_PRECISION_LEEWAY = 6
 DOMAIN = "homekit"
 HOMEKIT_FILE = ".homekit.state"
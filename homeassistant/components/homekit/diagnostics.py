@@ -3,13 +3,13 @@ from __future__ import annotations
 
 from typing import Any
 
-from pyhap.accessory_driver import AccessoryDriver
 from pyhap.state import State
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from . import HomeKit
+from .accessories import HomeDriver
 from .const import DOMAIN, HOMEKIT
 
 
@@ -29,7 +29,7 @@ async def async_get_config_entry_diagnostics(
     }
     if not hasattr(homekit, "driver"):
         return data
-    driver: AccessoryDriver = homekit.driver
+    driver: HomeDriver = homekit.driver
     data.update(driver.get_accessories())
     state: State = driver.state
     data.update(
@@ -38,6 +38,7 @@ async def async_get_config_entry_diagnostics(
                 str(client): props for client, props in state.client_properties.items()
             },
             "config_version": state.config_version,
+            "events": driver.event_stats,
             "pairing_id": state.mac,
         }
     )
@@ -1,12 +1,17 @@
 """Static file handling for HTTP component."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass
+import gzip
+import mimetypes
 from pathlib import Path
+from time import monotonic
 from typing import Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU  # pylint: disable=no-name-in-module
@@ -21,6 +26,90 @@ CACHE_HEADERS: Final[Mapping[str, str]] = {
 }
 PATH_CACHE = LRU(512)
 
+# Files up to this size are kept in memory with their compressed variants
+MAX_CACHED_ASSET_SIZE: Final = 128 * 1024
+# Total size of the assets kept in memory
+MAX_ASSET_CACHE_BYTES: Final = 8 * 1024 * 1024
+# Seconds after which a cached asset is checked for changes on disk
+ASSET_RECHECK_INTERVAL: Final = 10
+
+COMPRESSIBLE_TYPES: Final = (
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+)
+ENCODINGS: Final = (("br", ".br"), ("gzip", ".gz"))
+
+
+@dataclass
+class StaticAsset:
+    """A static file and its compressed variants kept in memory."""
+
+    mtime_ns: int
+    size: int
+    etag: str
+    content_type: str | None
+    # None when the file is too large to be kept in memory
+    body: bytes | None
+    encoded: dict[str, bytes]
+    compressible: bool
+    checked: float
+
+    @property
+    def mtime(self) -> float:
+        """Return the modification time of the file in seconds."""
+        return self.mtime_ns / 1e9
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes kept in memory for the asset."""
+        return len(self.body or b"") + sum(len(body) for body in self.encoded.values())
+
+
+class AssetCache:
+    """Keep the most recently used assets up to a total size in bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize the cache."""
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._assets: OrderedDict[Path, tuple[StaticAsset, int]] = OrderedDict()
+
+    def __getitem__(self, filepath: Path) -> StaticAsset:
+        """Return a cached asset."""
+        return self._assets[filepath][0]
+
+    def __setitem__(self, filepath: Path, asset: StaticAsset) -> None:
+        """Cache an asset and drop the least recently used ones over the limit.
+
+        Store an asset again after changing its encoded variants to
+        account for their size.
+        """
+        if (cached := self._assets.pop(filepath, None)) is not None:
+            self.total_bytes -= cached[1]
+        nbytes = asset.nbytes
+        self._assets[filepath] = (asset, nbytes)
+        self.total_bytes += nbytes
+        while self.total_bytes > self.max_bytes:
+            _, (_, dropped) = self._assets.popitem(last=False)
+            self.total_bytes -= dropped
+
+    def __len__(self) -> int:
+        """Return the number of cached assets."""
+        return len(self._assets)
+
+    def get(self, filepath: Path) -> StaticAsset | None:
+        """Return a cached asset and mark it as recently used."""
+        if (cached := self._assets.get(filepath)) is None:
+            return None
+        self._assets.move_to_end(filepath)
+        return cached[0]
+
+
+ASSET_CACHE = AssetCache(MAX_ASSET_CACHE_BYTES)
+
 
 def _get_file_path(
     filename: str | Path, directory: Path, follow_symlinks: bool
@@ -36,6 +125,49 @@ def _get_file_path(
     raise FileNotFoundError
 
 
+def _load_asset(filepath: Path, cached: StaticAsset | None) -> StaticAsset:
+    """Load a static file and its precompressed variants."""
+    stat = filepath.stat()
+    if (
+        cached is not None
+        and cached.mtime_ns == stat.st_mtime_ns
+        and cached.size == stat.st_size
+    ):
+        cached.checked = monotonic()
+        return cached
+
+    content_type, _ = mimetypes.guess_type(str(filepath))
+    body: bytes | None = None
+    encoded: dict[str, bytes] = {}
+    if stat.st_size <= MAX_CACHED_ASSET_SIZE:
+        body = filepath.read_bytes()
+        for encoding, suffix in ENCODINGS:
+            variant = filepath.with_name(filepath.name + suffix)
+            if variant.is_file() and variant.stat().st_mtime_ns >= stat.st_mtime_ns:
+                encoded[encoding] = variant.read_bytes()
+    return StaticAsset(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        etag=f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+        content_type=content_type,
+        body=body,
+        encoded=encoded,
+        compressible=content_type is not None
+        and (content_type.startswith("text/") or content_type in COMPRESSIBLE_TYPES),
+        checked=monotonic(),
+    )
+
+
+def _gzip_asset(asset: StaticAsset) -> None:
+    """Compress a cached asset if that makes it smaller."""
+    assert asset.body is not None
+    compressed = gzip.compress(asset.body, mtime=0)
+    if len(compressed) < len(asset.body):
+        asset.encoded["gzip"] = compressed
+    else:
+        asset.compressible = False
+
+
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
@@ -54,8 +186,16 @@ class CachingStaticResource(StaticResource):
                 filepath = PATH_CACHE[key] = await hass.async_add_executor_job(
                     _get_file_path, filename, self._directory, self._follow_symlinks
                 )
+            if filepath and (
+                (asset := ASSET_CACHE.get(filepath)) is None
+                or monotonic() - asset.checked > ASSET_RECHECK_INTERVAL
+            ):
+                asset = ASSET_CACHE[filepath] = await hass.async_add_executor_job(
+                    _load_asset, filepath, asset
+                )
         except (ValueError, FileNotFoundError) as error:
             # relatively safe
+            PATH_CACHE.pop(key, None)
             raise HTTPNotFound() from error
         except Exception as error:
             # perm error or other kind!
@@ -63,9 +203,63 @@ class CachingStaticResource(StaticResource):
             raise HTTPNotFound() from error
 
         if filepath:
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                headers=CACHE_HEADERS,
-            )
+            if asset.body is None or hdrs.RANGE in request.headers:
+                return FileResponse(
+                    filepath,
+                    chunk_size=self._chunk_size,
+                    headers=CACHE_HEADERS,
+                )
+            return await self._async_asset_response(hass, request, filepath, asset)
         return await super()._handle(request)
+
+    async def _async_asset_response(
+        self,
+        hass: HomeAssistant,
+        request: Request,
+        filepath: Path,
+        asset: StaticAsset,
+    ) -> Response:
+        """Return a cached asset, compressed if the client accepts it."""
+        headers = {
+            **CACHE_HEADERS,
+            hdrs.ETAG: asset.etag,
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+        }
+        # If-Modified-Since is only used without If-None-Match, see RFC 7232
+        if (if_none_match := request.headers.get(hdrs.IF_NONE_MATCH)) is not None:
+            not_modified = if_none_match.strip() == "*" or asset.etag in (
+                etag.strip() for etag in if_none_match.split(",")
+            )
+        else:
+            not_modified = (
+                if_modified_since := request.if_modified_since
+            ) is not None and asset.mtime <= if_modified_since.timestamp()
+        if not_modified:
+            response = Response(status=304, headers=headers)
+            response.last_modified = asset.mtime
+            return response
+
+        body = asset.body
+        accept_encoding = {
+            coding.partition(";")[0].strip()
+            for coding in request.headers.get(hdrs.ACCEPT_ENCODING, "")
+            .lower()
+            .split(",")
+        }
+        if (
+            "gzip" in accept_encoding
+            and asset.compressible
+            and "gzip" not in asset.encoded
+        ):
+            await hass.async_add_executor_job(_gzip_asset, asset)
+            # Account for the size of the compressed variant
+            if ASSET_CACHE.get(filepath) is asset:
+                ASSET_CACHE[filepath] = asset
+        for encoding, _ in ENCODINGS:
+            if encoding in asset.encoded and encoding in accept_encoding:
+                body = asset.encoded[encoding]
+                headers[hdrs.CONTENT_ENCODING] = encoding
+                break
+        response = Response(body=body, content_type=asset.content_type, headers=headers)
+        response.last_modified = asset.mtime
+        return response
@@ -47,3 +47,4 @@ BUILT_IN_EVENTS = {EVENT_LOGBOOK_ENTRY, EVENT_CALL_SERVICE}
 
 LOGBOOK_FILTERS = "logbook_filters"
 LOGBOOK_ENTITIES_FILTER = "entities_filter"
+LOGBOOK_LIVE_PIPELINES = "logbook_live_pipelines"
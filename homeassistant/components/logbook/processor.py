@@ -1,18 +1,23 @@
 """Event parser and human readable log generator."""
 from __future__ import annotations
 
-from collections.abc import Callable, Generator
+import base64
+import binascii
+from collections.abc import Callable, Generator, Iterable, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
 from typing import Any
 
+from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 from sqlalchemy.orm.query import Query
 
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
     process_datetime_to_timestamp,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -26,8 +31,9 @@ from homeassistant.const import (
     EVENT_CALL_SERVICE,
     EVENT_LOGBOOK_ENTRY,
 )
-from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.core import Event, HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import json_dumps, json_loads
 import homeassistant.util.dt as dt_util
 
 from .const import (
@@ -55,9 +61,19 @@ from .const import (
 )
 from .helpers import is_sensor_continuous
 from .models import EventAsRow, LazyEventPartialState, async_event_to_row
-from .queries import statement_for_request
+from .queries import (
+    context_statement_for_request,
+    page_statement_for_request,
+    statement_for_request,
+)
 from .queries.common import PSUEDO_EVENT_STATE_CHANGED
 
+# Maximum number of live context origins to keep converted
+MAX_CONTEXT_ORIGIN_ROWS = 2048
+
+# Number of rows fetched from the database at a time for a logbook page
+PAGE_ROWS_BUFFER = 1024
+
 
 @dataclass
 class LogbookRun:
@@ -73,6 +89,67 @@ class LogbookRun:
     format_time: Callable[[Row], Any]
 
 
+@dataclass
+class LogbookCursor:
+    """Page key of the last row of a logbook page.
+
+    Rows are ordered by the time they were fired and their ids,
+    the next page starts after the row with this key.
+    """
+
+    time_fired: dt
+    event_id: int
+    state_id: int
+    context_only: str = "0"
+
+    @property
+    def page_key(self) -> tuple[dt, int, int, str]:
+        """Return the page key of the row."""
+        return (self.time_fired, self.event_id, self.state_id, self.context_only)
+
+    def as_token(self) -> str:
+        """Return the cursor as an opaque continuation token."""
+        return base64.urlsafe_b64encode(
+            json_dumps(
+                [
+                    self.time_fired.isoformat(),
+                    self.event_id,
+                    self.state_id,
+                    self.context_only,
+                ]
+            ).encode()
+        ).decode()
+
+    @classmethod
+    def from_token(cls, token: str) -> LogbookCursor:
+        """Create a cursor from a continuation token."""
+        try:
+            time_fired_str, event_id, state_id, context_only = json_loads(
+                base64.urlsafe_b64decode(token)
+            )
+        except (binascii.Error, ValueError, TypeError) as err:
+            raise ValueError(f"Invalid cursor: {token}") from err
+        if (
+            not isinstance(time_fired_str, str)
+            or (time_fired := dt_util.parse_datetime(time_fired_str)) is None
+            or not isinstance(event_id, int)
+            or not isinstance(state_id, int)
+            or context_only not in ("0", "1")
+        ):
+            raise ValueError(f"Invalid cursor: {token}")
+        return cls(dt_util.as_utc(time_fired), event_id, state_id, context_only)
+
+    @classmethod
+    def from_row(cls, row: Row) -> LogbookCursor:
+        """Create a cursor after a row of the logbook query."""
+        return cls(
+            process_timestamp(row.time_fired),
+            row.event_id or 0,
+            row.state_id or 0,
+            row.context_only or "0",
+        )
+
+
 class EventProcessor:
     """Stream into logbook format."""
 
@@ -163,6 +240,120 @@ class EventProcessor:
         with session_scope(hass=self.hass) as session:
             return self.humanify(yield_rows(session.execute(stmt)))
 
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int | None,
+        cursor: LogbookCursor | None = None,
+    ) -> tuple[list[dict[str, Any]], LogbookCursor | None]:
+        """Get a page of events for a period of time.
+
+        The page starts after the cursor and holds at most limit entries.
+        Rows are selected after the cursor with a LIMIT of one more than
+        the page, rows that only link contexts or do not make an entry
+        are read past by selecting the rows after the last one read
+        until the page is full. The rows that started the contexts of
+        the page on earlier pages are read as well to describe the
+        entries. Returns the cursor of the next page or None if this was
+        the last page.
+        """
+        rows_limit = None if limit is None else limit + 1
+        events: list[dict[str, Any]] = []
+        next_cursor: LogbookCursor | None = None
+        current_row: list[Row] = []
+
+        def yield_rows(
+            session: Session,
+            after: LogbookCursor | None,
+            batches: Iterable[Sequence[Row]],
+        ) -> Generator[Row, None, None]:
+            """Yield rows and remember the current one."""
+            for rows in batches:
+                if after is not None:
+                    self._memorize_context_origins(
+                        session, start_day, end_day, after, rows
+                    )
+                for row in rows:
+                    current_row[:] = (row,)
+                    yield row
+
+        with session_scope(hass=self.hass) as session:
+            while True:
+                stmt = page_statement_for_request(
+                    start_day,
+                    end_day,
+                    self.event_types,
+                    self.entity_ids,
+                    self.device_ids,
+                    self.filters,
+                    self.context_id,
+                    cursor.page_key if cursor else None,
+                    rows_limit,
+                )
+                # The page selects from the union as a subquery which
+                # the ORM can not set up the result of, these are plain rows
+                result = session.connection().execute(stmt)
+                if rows_limit is None:
+                    return (
+                        self.humanify(
+                            yield_rows(
+                                session,
+                                cursor,
+                                result.yield_per(PAGE_ROWS_BUFFER).partitions(),
+                            )
+                        ),
+                        None,
+                    )
+                rows = result.all()
+                for event in _humanify(
+                    yield_rows(session, cursor, (rows,)),
+                    self.ent_reg,
+                    self.logbook_run,
+                    self.context_augmenter,
+                ):
+                    # The next page is only announced when an entry
+                    # after the full page was found
+                    if len(events) == limit:
+                        return events, next_cursor
+                    events.append(event)
+                    next_cursor = LogbookCursor.from_row(current_row[0])
+                if len(rows) < rows_limit:
+                    return events, None
+                cursor = LogbookCursor.from_row(rows[-1])
+
+    def _memorize_context_origins(
+        self,
+        session: Session,
+        start_day: dt,
+        end_day: dt,
+        cursor: LogbookCursor,
+        rows: Sequence[Row],
+    ) -> None:
+        """Memorize the context origins of rows that were on earlier pages."""
+        context_lookup = self.logbook_run.context_lookup
+        context_ids = {
+            context_id
+            for row in rows
+            for context_id in (row.context_id, row.context_parent_id)
+            if context_id and context_lookup.get(context_id) is None
+        }
+        if not context_ids:
+            return
+        stmt = context_statement_for_request(
+            start_day,
+            end_day,
+            self.event_types,
+            self.entity_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+            cursor.page_key,
+            list(context_ids),
+        )
+        for row in session.connection().execute(stmt):
+            context_lookup.memorize(row)
+
     def humanify(
         self, row_generator: Generator[Row | EventAsRow, None, None]
     ) -> list[dict[str, str]]:
@@ -262,6 +453,7 @@ class ContextLookup:
         self.hass = hass
         self._memorize_new = True
         self._lookup: dict[str | None, Row | EventAsRow | None] = {None: None}
+        self._origin_rows: LRU = LRU(MAX_CONTEXT_ORIGIN_ROWS)
 
     def memorize(self, row: Row) -> str | None:
         """Memorize a context from the database."""
@@ -280,6 +472,17 @@ class ContextLookup:
         """Get the context origin."""
         return self._lookup.get(context_id)
 
+    def get_origin_row(self, origin_event: Event) -> EventAsRow:
+        """Get the row of a live context origin event.
+
+        Events sharing a context are usually streamed close together, so the
+        converted origins are kept in a bounded cache.
+        """
+        context_id = origin_event.context.id
+        if (row := self._origin_rows.get(context_id)) is None:
+            row = self._origin_rows[context_id] = async_event_to_row(origin_event)
+        return row
+
 
 class ContextAugmenter:
     """Augment data with context trace."""
@@ -301,7 +504,7 @@ class ContextAugmenter:
         if (context := getattr(row, "context", None)) is not None and (
             origin_event := context.origin_event
         ) is not None:
-            return async_event_to_row(origin_event)
+            return self.context_lookup.get_origin_row(origin_event)
         return None
 
     def augment(
@@ -3,12 +3,14 @@ from __future__ import annotations
 
 from datetime import datetime as dt
 
+from sqlalchemy import tuple_
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.helpers.json import json_dumps
 
 from .all import all_stmt
+from .common import page_key, select_by_page_key
 from .devices import devices_stmt
 from .entities import entities_stmt
 from .entities_and_devices import entities_devices_stmt
@@ -77,3 +79,78 @@ def statement_for_request(
         event_types,
         json_quoted_device_ids,
     )
+
+
+def page_statement_for_request(
+    start_day: dt,
+    end_day: dt,
+    event_types: tuple[str, ...],
+    entity_ids: list[str] | None = None,
+    device_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    context_id: str | None = None,
+    after: tuple[dt, int, int, str] | None = None,
+    limit: int | None = None,
+) -> StatementLambdaElement:
+    """Generate the logbook statement for a page of a logbook request.
+
+    The rows of the page follow the page key passed as after and
+    at most limit rows are selected.
+    """
+    stmt = statement_for_request(
+        start_day,
+        end_day,
+        event_types,
+        entity_ids,
+        device_ids,
+        filters,
+        context_id,
+    )
+    stmt += lambda s: select_by_page_key(s)
+    if after is not None:
+        after_time_fired, after_event_id, after_state_id, after_context_only = after
+        stmt += lambda s: s.where(
+            page_key(s.selected_columns)
+            > tuple_(
+                after_time_fired, after_event_id, after_state_id, after_context_only
+            )
+        )
+    if limit is not None:
+        stmt += lambda s: s.limit(limit)
+    return stmt
+
+
+def context_statement_for_request(
+    start_day: dt,
+    end_day: dt,
+    event_types: tuple[str, ...],
+    entity_ids: list[str] | None,
+    device_ids: list[str] | None,
+    filters: Filters | None,
+    context_id: str | None,
+    before: tuple[dt, int, int, str],
+    context_ids: list[str],
+) -> StatementLambdaElement:
+    """Generate the statement for the rows of contexts up to a page key.
+
+    The first rows of the contexts of a page can be on an earlier page,
+    they are selected from the rows up to the page key passed as before.
+    """
+    stmt = statement_for_request(
+        start_day,
+        end_day,
+        event_types,
+        entity_ids,
+        device_ids,
+        filters,
+        context_id,
+    )
+    stmt += lambda s: select_by_page_key(s)
+    before_time_fired, before_event_id, before_state_id, before_context_only = before
+    stmt += lambda s: s.where(
+        page_key(s.selected_columns)
+        <= tuple_(
+            before_time_fired, before_event_id, before_state_id, before_context_only
+        )
+    ).where(s.selected_columns.context_id.in_(context_ids))
+    return stmt
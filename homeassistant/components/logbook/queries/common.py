@@ -4,11 +4,12 @@ from __future__ import annotations
 from datetime import datetime as dt
 
 import sqlalchemy
-from sqlalchemy import select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Query
-from sqlalchemy.sql.elements import ClauseList
+from sqlalchemy.sql.base import ColumnCollection
+from sqlalchemy.sql.elements import ClauseList, Tuple
 from sqlalchemy.sql.expression import literal
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import CompoundSelect, Select
 
 from homeassistant.components.recorder.db_schema import (
     EVENTS_CONTEXT_ID_INDEX,
@@ -285,3 +286,32 @@ def apply_events_context_hints(query: Query) -> Query:
     return query.with_hint(
         Events, f"FORCE INDEX ({EVENTS_CONTEXT_ID_INDEX})", dialect_name="mysql"
     )
+
+
+def select_by_page_key(query: CompoundSelect) -> Select:
+    """Select the rows of a logbook query ordered by their page key.
+
+    The outer joins of the context only selects return empty rows
+    for contexts without rows, they have no key and are left out.
+    """
+    rows = query.order_by(None).subquery()
+    return (
+        select(rows)
+        .where(rows.c.time_fired.isnot(None))
+        .order_by(*page_key(rows.c).clauses)
+    )
+
+
+def page_key(columns: ColumnCollection) -> Tuple:
+    """Generate the key of a row that orders the rows of a logbook page.
+
+    Events have no state_id and states have no event_id, the time the
+    row was fired is only unique together with them. The same row can
+    be selected again to only link contexts.
+    """
+    return tuple_(
+        columns.time_fired,
+        func.coalesce(columns.event_id, 0),
+        func.coalesce(columns.state_id, 0),
+        func.coalesce(columns.context_only, "0"),
+    )
@@ -19,7 +19,7 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from .helpers import async_determine_event_types
-from .processor import EventProcessor
+from .processor import EventProcessor, LogbookCursor
 
 
 @callback
@@ -86,6 +86,22 @@ class LogbookView(HomeAssistantView):
                 return self.json_message("Invalid end_time", HTTPStatus.BAD_REQUEST)
             end_day = end_day_dt
 
+        limit: int | None = None
+        if (limit_str := request.query.get("limit")) is not None:
+            try:
+                limit = int(limit_str)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                return self.json_message("Invalid limit", HTTPStatus.BAD_REQUEST)
+
+        cursor: LogbookCursor | None = None
+        if cursor_token := request.query.get("cursor"):
+            try:
+                cursor = LogbookCursor.from_token(cursor_token)
+            except ValueError:
+                return self.json_message("Invalid cursor", HTTPStatus.BAD_REQUEST)
+
         hass = request.app["hass"]
 
         context_id = request.query.get("context_id")
@@ -108,6 +124,16 @@ class LogbookView(HomeAssistantView):
 
         def json_events() -> web.Response:
             """Fetch events and generate JSON."""
+            if limit is not None or cursor is not None:
+                events, next_cursor = event_processor.get_events_page(
+                    start_day, end_day, limit, cursor
+                )
+                return self.json(
+                    {
+                        "events": events,
+                        "next_cursor": next_cursor.as_token() if next_cursor else None,
+                    }
+                )
             return self.json(
                 event_processor.get_events(
                     start_day,
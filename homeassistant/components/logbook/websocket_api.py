@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime as dt, timedelta
 import logging
 from typing import Any
@@ -15,19 +15,20 @@ from homeassistant.components.recorder import get_instance
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entityfilter import EntityFilter
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import JSON_DUMP
 import homeassistant.util.dt as dt_util
 
-from .const import LOGBOOK_ENTITIES_FILTER
+from .const import LOGBOOK_ENTITIES_FILTER, LOGBOOK_ENTRY_WHEN, LOGBOOK_LIVE_PIPELINES
 from .helpers import (
     async_determine_event_types,
     async_filter_entities,
     async_subscribe_events,
 )
 from .models import async_event_to_row
-from .processor import EventProcessor
+from .processor import EventProcessor, LogbookCursor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
 EVENT_COALESCE_TIME = 0.35
@@ -39,20 +40,233 @@ BIG_QUERY_RECENT_HOURS = 24
 _LOGGER = logging.getLogger(__name__)
 
 
+LivePipelineKey = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
+
+
 @dataclass
 class LogbookLiveStream:
     """Track a logbook live stream."""
 
-    stream_queue: asyncio.Queue[Event]
-    subscriptions: list[CALLBACK_TYPE]
+    connection: ActiveConnection
+    msg_id: int
+    unsub: CALLBACK_TYPE
+    subscriptions_setup_complete_time: float | None = None
+    pending: list[list[dict[str, Any]]] | None = field(default_factory=list)
+    pending_count: int = 0
     end_time_unsub: CALLBACK_TYPE | None = None
-    task: asyncio.Task | None = None
     wait_sync_task: asyncio.Task | None = None
 
 
+class LogbookLivePipeline:
+    """Humanify live logbook events once for all streams with the same filters.
+
+    Streams subscribing with the same event types, entity ids and device ids
+    share the event subscriptions, the event processor with its context
+    lookup and the encoded websocket messages.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: LivePipelineKey,
+        event_types: tuple[str, ...],
+        entity_ids: list[str] | None,
+        device_ids: list[str] | None,
+    ) -> None:
+        """Initialize the pipeline."""
+        self.hass = hass
+        self.key = key
+        self.event_processor = EventProcessor(
+            hass,
+            event_types,
+            entity_ids,
+            device_ids,
+            None,
+            timestamp=True,
+            include_entity_name=False,
+        )
+        self.event_processor.switch_to_live()
+        self.stream_queue: asyncio.Queue[Event] = asyncio.Queue(
+            MAX_PENDING_LOGBOOK_EVENTS
+        )
+        self.streams: list[LogbookLiveStream] = []
+        self.subscriptions: list[CALLBACK_TYPE] = []
+        self.task: asyncio.Task | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Subscribe to the events and start consuming them."""
+        event_processor = self.event_processor
+        entities_filter: EntityFilter | None = None
+        if not event_processor.limited_select:
+            entities_filter = self.hass.data[LOGBOOK_ENTITIES_FILTER]
+        async_subscribe_events(
+            self.hass,
+            self.subscriptions,
+            self._async_queue_or_cancel,
+            event_processor.event_types,
+            entities_filter,
+            event_processor.entity_ids,
+            event_processor.device_ids,
+        )
+        self.task = asyncio.create_task(_async_events_consumer(self))
+
+    @callback
+    def async_stop(self) -> None:
+        """Unsubscribe from the events and stop consuming them."""
+        for subscription in self.subscriptions:
+            subscription()
+        self.subscriptions.clear()
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        pipelines: dict[LivePipelineKey, LogbookLivePipeline] = self.hass.data[
+            LOGBOOK_LIVE_PIPELINES
+        ]
+        if pipelines.get(self.key) is self:
+            del pipelines[self.key]
+
+    @callback
+    def async_add_stream(self, stream: LogbookLiveStream) -> None:
+        """Add a stream to the pipeline."""
+        self.streams.append(stream)
+
+    @callback
+    def async_remove_stream(self, stream: LogbookLiveStream) -> None:
+        """Remove a stream and stop the pipeline once it has no streams left."""
+        if stream not in self.streams:
+            return
+        self.streams.remove(stream)
+        if not self.streams:
+            self.async_stop()
+
+    @callback
+    def _async_queue_or_cancel(self, event: Event) -> None:
+        """Queue an event to be processed or cancel all streams."""
+        try:
+            self.stream_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            _LOGGER.debug(
+                "Client exceeded max pending messages of %s",
+                MAX_PENDING_LOGBOOK_EVENTS,
+            )
+            for stream in list(self.streams):
+                stream.unsub()
+
+    @callback
+    def async_send_events(self, logbook_events: list[dict[str, Any]]) -> None:
+        """Encode the events once and send them to all streams."""
+        message = JSON_DUMP(
+            messages.event_message(messages.IDEN_TEMPLATE, {"events": logbook_events})
+        )
+        for stream in list(self.streams):
+            if stream.pending is not None:
+                _async_queue_stream_events(stream, logbook_events)
+            else:
+                _async_send_stream_events(stream, logbook_events, message)
+
+
+@callback
+def _async_get_live_pipeline(
+    hass: HomeAssistant,
+    event_types: tuple[str, ...],
+    entity_ids: list[str] | None,
+    device_ids: list[str] | None,
+) -> LogbookLivePipeline:
+    """Get or create the live pipeline for a set of filters.
+
+    The entities of the devices are part of the key so a device that
+    gained or lost entities since a pipeline was created gets a new one.
+    """
+    ent_reg = er.async_get(hass)
+    key: LivePipelineKey = (
+        frozenset(event_types),
+        frozenset(entity_ids or ()),
+        frozenset(device_ids or ()),
+        frozenset(
+            entry.entity_id
+            for device_id in device_ids or ()
+            for entry in er.async_entries_for_device(ent_reg, device_id)
+        ),
+    )
+    pipelines: dict[LivePipelineKey, LogbookLivePipeline] = hass.data[
+        LOGBOOK_LIVE_PIPELINES
+    ]
+    if (pipeline := pipelines.get(key)) is None:
+        pipeline = pipelines[key] = LogbookLivePipeline(
+            hass, key, event_types, entity_ids, device_ids
+        )
+        pipeline.async_start()
+    return pipeline
+
+
+@callback
+def _async_queue_stream_events(
+    stream: LogbookLiveStream, logbook_events: list[dict[str, Any]]
+) -> None:
+    """Hold back live events while historical events are being sent."""
+    assert stream.pending is not None
+    stream.pending_count += len(logbook_events)
+    if stream.pending_count > MAX_PENDING_LOGBOOK_EVENTS:
+        _LOGGER.debug(
+            "Client exceeded max pending messages of %s",
+            MAX_PENDING_LOGBOOK_EVENTS,
+        )
+        stream.unsub()
+        return
+    stream.pending.append(logbook_events)
+
+
+@callback
+def _async_send_stream_events(
+    stream: LogbookLiveStream,
+    logbook_events: list[dict[str, Any]],
+    message: str | None = None,
+) -> None:
+    """Send live events to a stream.
+
+    Events that are not newer than the subscription setup were already
+    sent from the database, so they are dropped.
+    """
+    if (setup_complete_time := stream.subscriptions_setup_complete_time) is not None:
+        if all(
+            event[LOGBOOK_ENTRY_WHEN] > setup_complete_time for event in logbook_events
+        ):
+            stream.subscriptions_setup_complete_time = None
+        else:
+            logbook_events = [
+                event
+                for event in logbook_events
+                if event[LOGBOOK_ENTRY_WHEN] > setup_complete_time
+            ]
+            message = None
+            if not logbook_events:
+                return
+    if message is None:
+        stream.connection.send_message(
+            JSON_DUMP(messages.event_message(stream.msg_id, {"events": logbook_events}))
+        )
+        return
+    stream.connection.send_message(
+        message.replace(messages.IDEN_JSON_TEMPLATE, str(stream.msg_id), 1)
+    )
+
+
+@callback
+def _async_stream_go_live(stream: LogbookLiveStream) -> None:
+    """Send the held back events and stream future events as they arrive."""
+    if (pending := stream.pending) is None:
+        return
+    stream.pending = None
+    stream.pending_count = 0
+    for logbook_events in pending:
+        _async_send_stream_events(stream, logbook_events)
+
+
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the logbook websocket API."""
+    hass.data[LOGBOOK_LIVE_PIPELINES] = {}
     websocket_api.async_register_command(hass, ws_get_events)
     websocket_api.async_register_command(hass, ws_event_stream)
 
@@ -212,22 +426,13 @@ def _ws_stream_get_events(
     return JSON_DUMP(formatter(msg_id, message)), last_time
 
 
-async def _async_events_consumer(
-    subscriptions_setup_complete_time: dt,
-    connection: ActiveConnection,
-    msg_id: int,
-    stream_queue: asyncio.Queue[Event],
-    event_processor: EventProcessor,
-) -> None:
-    """Stream events from the queue."""
-    event_processor.switch_to_live()
+async def _async_events_consumer(pipeline: LogbookLivePipeline) -> None:
+    """Stream events from the queue to all streams of the pipeline."""
+    stream_queue = pipeline.stream_queue
+    event_processor = pipeline.event_processor
 
     while True:
         events: list[Event] = [await stream_queue.get()]
-        # If the event is older than the last db
-        # event we already sent it so we skip it.
-        if events[0].time_fired <= subscriptions_setup_complete_time:
-            continue
         # We sleep for the EVENT_COALESCE_TIME so
         # we can group events together to minimize
         # the number of websocket messages when the
@@ -239,14 +444,7 @@ async def _async_events_consumer(
         if logbook_events := event_processor.humanify(
             async_event_to_row(e) for e in events
         ):
-            connection.send_message(
-                JSON_DUMP(
-                    messages.event_message(
-                        msg_id,
-                        {"events": logbook_events},
-                    )
-                )
-            )
+            pipeline.async_send_events(logbook_events)
 
 
 @websocket_api.websocket_command(
@@ -321,57 +519,30 @@ async def ws_event_stream(
         )
         return
 
-    subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_LOGBOOK_EVENTS)
-    live_stream = LogbookLiveStream(
-        subscriptions=subscriptions, stream_queue=stream_queue
-    )
+    pipeline = _async_get_live_pipeline(hass, event_types, entity_ids, device_ids)
 
     @callback
     def _unsub(*time: Any) -> None:
         """Unsubscribe from all events."""
-        for subscription in subscriptions:
-            subscription()
-        subscriptions.clear()
-        if live_stream.task:
-            live_stream.task.cancel()
+        pipeline.async_remove_stream(live_stream)
         if live_stream.wait_sync_task:
             live_stream.wait_sync_task.cancel()
         if live_stream.end_time_unsub:
             live_stream.end_time_unsub()
             live_stream.end_time_unsub = None
 
+    live_stream = LogbookLiveStream(connection=connection, msg_id=msg_id, unsub=_unsub)
+
     if end_time:
         live_stream.end_time_unsub = async_track_point_in_utc_time(
             hass, _unsub, end_time
         )
 
-    @callback
-    def _queue_or_cancel(event: Event) -> None:
-        """Queue an event to be processed or cancel."""
-        try:
-            stream_queue.put_nowait(event)
-        except asyncio.QueueFull:
-            _LOGGER.debug(
-                "Client exceeded max pending messages of %s",
-                MAX_PENDING_LOGBOOK_EVENTS,
-            )
-            _unsub()
-
-    entities_filter: EntityFilter | None = None
-    if not event_processor.limited_select:
-        entities_filter = hass.data[LOGBOOK_ENTITIES_FILTER]
-
-    async_subscribe_events(
-        hass,
-        subscriptions,
-        _queue_or_cancel,
-        event_types,
-        entities_filter,
-        entity_ids,
-        device_ids,
-    )
+    pipeline.async_add_stream(live_stream)
     subscriptions_setup_complete_time = dt_util.utcnow()
+    live_stream.subscriptions_setup_complete_time = dt_util.utc_to_timestamp(
+        subscriptions_setup_complete_time
+    )
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
     # Fetch everything from history
@@ -386,20 +557,14 @@ async def ws_event_stream(
         partial=True,
     )
 
-    live_stream.task = asyncio.create_task(
-        _async_events_consumer(
-            subscriptions_setup_complete_time,
-            connection,
-            msg_id,
-            stream_queue,
-            event_processor,
-        )
-    )
+    event_processor.switch_to_live()
 
     if msg_id not in connection.subscriptions:
         # Unsubscribe happened while sending historical events
         return
 
+    _async_stream_go_live(live_stream)
+
     live_stream.wait_sync_task = asyncio.create_task(
         get_instance(hass).async_block_till_done()
     )
@@ -439,6 +604,29 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    limit: int | None,
+    cursor: LogbookCursor | None,
+) -> str:
+    """Fetch a page of events and convert it to json in the executor."""
+    events, next_cursor = event_processor.get_events_page(
+        start_time, end_time, limit, cursor
+    )
+    return JSON_DUMP(
+        messages.result_message(
+            msg_id,
+            {
+                "events": events,
+                "next_cursor": next_cursor.as_token() if next_cursor else None,
+            },
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -447,6 +635,8 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("cursor"): str,
     }
 )
 @websocket_api.async_response
@@ -472,8 +662,20 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    paginate = "limit" in msg or "cursor" in msg
+    limit: int | None = msg.get("limit")
+    cursor: LogbookCursor | None = None
+    if cursor_token := msg.get("cursor"):
+        try:
+            cursor = LogbookCursor.from_token(cursor_token)
+        except ValueError:
+            connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+            return
+
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        connection.send_result(
+            msg["id"], {"events": [], "next_cursor": None} if paginate else []
+        )
         return
 
     device_ids = msg.get("device_ids")
@@ -483,7 +685,9 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            connection.send_result(
+                msg["id"], {"events": [], "next_cursor": None} if paginate else []
+            )
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -498,6 +702,20 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if paginate:
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                event_processor,
+                limit,
+                cursor,
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_formatted_get_events,
@@ -6,6 +6,7 @@ import voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.logging import get_queue_handler
 
 DOMAIN = "logger"
 
@@ -28,6 +29,7 @@ DEFAULT_LOGSEVERITY = "DEBUG"
 LOGGER_DEFAULT = "default"
 LOGGER_LOGS = "logs"
 LOGGER_FILTERS = "filters"
+LOGGER_RATE_LIMITS = "rate_limits"
 
 ATTR_LEVEL = "level"
 
@@ -43,6 +45,13 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(LOGGER_DEFAULT): _VALID_LOG_LEVEL,
                 vol.Optional(LOGGER_LOGS): vol.Schema({cv.string: _VALID_LOG_LEVEL}),
                 vol.Optional(LOGGER_FILTERS): vol.Schema({cv.string: [cv.is_regex]}),
+                vol.Optional(LOGGER_RATE_LIMITS): vol.Schema(
+                    {
+                        cv.string: vol.All(
+                            vol.Coerce(float), vol.Range(min=0, min_included=False)
+                        )
+                    }
+                ),
             }
         )
     },
@@ -78,6 +87,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             logger = logging.getLogger(key)
             _add_log_filter(logger, value)
 
+    if LOGGER_RATE_LIMITS in config[DOMAIN] and (queue_handler := get_queue_handler()):
+        queue_handler.set_rate_limits(config[DOMAIN][LOGGER_RATE_LIMITS])
+
     @callback
     def async_service_handler(service: ServiceCall) -> None:
         """Handle logger services."""
@@ -1,10 +1,16 @@
 """Support for Prometheus metrics export."""
+from __future__ import annotations
+
 from contextlib import suppress
+from dataclasses import dataclass
+import gzip
 import logging
 import string
+from time import monotonic
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -46,6 +52,10 @@ _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
 
+# Seconds a rendered exposition is reused while no state changed, so the
+# metrics of the process collectors stay reasonably current
+PAYLOAD_MAX_AGE = 5
+
 DOMAIN = "prometheus"
 CONF_FILTER = "filter"
 CONF_PROM_NAMESPACE = "namespace"
@@ -86,8 +96,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -109,6 +117,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    hass.http.register_view(PrometheusView(prometheus_client, metrics))
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed)
     hass.bus.listen(
@@ -149,7 +158,10 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics = {}
+        self._labelsets = {}
         self._climate_units = climate_units
+        # Incremented whenever metrics may have changed
+        self.version = 0
 
     def handle_state_changed(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
@@ -158,6 +170,7 @@ class PrometheusMetrics:
 
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
+        self.version += 1
         domain, _ = hacore.split_entity_id(entity_id)
 
         if not self._filter(state.entity_id):
@@ -216,7 +229,9 @@ class PrometheusMetrics:
                 metrics_entity_id = entity_id
 
         if metrics_entity_id:
+            self._labelsets.pop(metrics_entity_id, None)
             self._remove_labelsets(metrics_entity_id)
+            self.version += 1
 
     def _remove_labelsets(self, entity_id, friendly_name=None):
         """Remove labelsets matching the given entity id from all metrics."""
@@ -292,13 +307,17 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state):
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
+    def _labels(self, state):
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        if (labels := self._labelsets.get(state.entity_id)) is None or labels[
+            "friendly_name"
+        ] != friendly_name:
+            labels = self._labelsets[state.entity_id] = {
+                "entity": state.entity_id,
+                "domain": state.domain,
+                "friendly_name": friendly_name,
+            }
+        return labels
 
     def _battery(self, state):
         if "battery_level" in state.attributes:
@@ -598,21 +617,95 @@ class PrometheusMetrics:
         metric.labels(**self._labels(state)).set(self.state_as_number(state))
 
 
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return if an Accept-Encoding header accepts gzip.
+
+    A coding with a quality value of zero is not acceptable, a wildcard
+    applies when gzip is not listed.
+    """
+    accepted = False
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        if (name := name.strip()) not in ("gzip", "*"):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0
+        if name == "gzip":
+            return quality > 0
+        accepted = quality > 0
+    return accepted
+
+
+@dataclass
+class PrometheusPayload:
+    """A rendered exposition of the metrics."""
+
+    version: int
+    rendered: float
+    body: bytes
+    compressed: bytes | None = None
+
+
 class PrometheusView(HomeAssistantView):
     """Handle Prometheus requests."""
 
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, metrics):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
+        self._payloads = {}
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
+        hass = request.app["hass"]
+        openmetrics = "application/openmetrics-text" in request.headers.get(
+            hdrs.ACCEPT, ""
+        )
+        compress = _accepts_gzip(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+
+        payload = self._payloads.get(openmetrics)
+        if (
+            payload is None
+            or payload.version != self.metrics.version
+            or monotonic() - payload.rendered > PAYLOAD_MAX_AGE
+        ):
+            payload = self._payloads[openmetrics] = await hass.async_add_executor_job(
+                self._render, openmetrics
+            )
+        if compress and payload.compressed is None:
+            payload.compressed = await hass.async_add_executor_job(
+                gzip.compress, payload.body
+            )
 
-        return web.Response(
-            body=self.prometheus_cli.generate_latest(self.prometheus_cli.REGISTRY),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+        headers = {
+            hdrs.CONTENT_TYPE: openmetrics_exposition.CONTENT_TYPE_LATEST
+            if openmetrics
+            else CONTENT_TYPE_TEXT_PLAIN,
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+        }
+        if compress:
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+            return web.Response(body=payload.compressed, headers=headers)
+        return web.Response(body=payload.body, headers=headers)
+
+    def _render(self, openmetrics):
+        """Render the exposition of the metrics."""
+        version = self.metrics.version
+        generate_latest = (
+            openmetrics_exposition.generate_latest
+            if openmetrics
+            else self.prometheus_cli.generate_latest
+        )
+        return PrometheusPayload(
+            version, monotonic(), generate_latest(self.prometheus_cli.REGISTRY)
         )
@@ -6,10 +6,11 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EXCLUDE, EVENT_STATE_CHANGED
+from homeassistant.const import CONF_ENTITIES, CONF_EXCLUDE, EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
+    CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER,
     convert_include_exclude_filter,
@@ -23,12 +24,18 @@ from homeassistant.loader import bind_hass
 from . import statistics, websocket_api
 from .const import (
     CONF_DB_INTEGRITY_CHECK,
+    CONF_DEADBAND,
+    CONF_DEADBAND_PERCENT,
+    CONF_MAX_ROWS_PER_HOUR,
+    CONF_MIN_INTERVAL,
+    CONF_SAMPLING,
     DATA_INSTANCE,
     DOMAIN,
     EXCLUDE_ATTRIBUTES,
     SQLITE_URL_PREFIX,
 )
 from .core import Recorder
+from .sampling import RecorderSampler
 from .services import async_register_services
 from .tasks import AddRecorderPlatformTask
 from .util import get_instance
@@ -62,6 +69,24 @@ FILTER_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {vol.Optional(CONF_EXCLUDE, default=EXCLUDE_SCHEMA({})): EXCLUDE_SCHEMA}
 )
 
+SAMPLING_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(CONF_ENTITIES): cv.entity_ids,
+            vol.Optional(CONF_ENTITY_GLOBS): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(CONF_DEADBAND): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional(CONF_DEADBAND_PERCENT): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+            vol.Optional(CONF_MIN_INTERVAL): cv.positive_time_period,
+            vol.Optional(CONF_MAX_ROWS_PER_HOUR): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ENTITIES, CONF_ENTITY_GLOBS),
+)
+
 
 ALLOW_IN_MEMORY_DB = False
 
@@ -101,6 +126,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_SAMPLING, default=list): vol.All(
+                        cv.ensure_list, [SAMPLING_SCHEMA]
+                    ),
                 }
             ),
         )
@@ -155,6 +183,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         entity_filter=entity_filter,
         exclude_t=exclude_t,
         exclude_attributes_by_domain=exclude_attributes_by_domain,
+        sampler=RecorderSampler(conf[CONF_SAMPLING]),
     )
     instance.async_initialize()
     instance.async_register()
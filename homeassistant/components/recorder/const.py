@@ -12,6 +12,11 @@ MYSQLDB_URL_PREFIX = "mysql://"
 DOMAIN = "recorder"
 
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
+CONF_SAMPLING = "sampling"
+CONF_DEADBAND = "deadband"
+CONF_DEADBAND_PERCENT = "deadband_percent"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_ROWS_PER_HOUR = "max_rows_per_hour"
 
 MAX_QUEUE_BACKLOG = 40000
 
@@ -36,6 +41,11 @@ KEEPALIVE_TIME = 30
 
 EXCLUDE_ATTRIBUTES = f"{DOMAIN}_exclude_attributes_by_domain"
 
+# Sent from the recorder thread when a full hour of statistics was compiled
+SIGNAL_HOURLY_STATISTICS_COMPILED = f"{DOMAIN}_hourly_statistics_compiled"
+# Sent from the recorder thread when existing statistics were changed
+SIGNAL_STATISTICS_UPDATED = f"{DOMAIN}_statistics_updated"
+
 
 class SupportedDialect(StrEnum):
     """Supported dialects."""
@@ -7,7 +7,6 @@ from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
 import logging
-import queue
 import sqlite3
 import threading
 import time
@@ -15,7 +14,14 @@ from typing import Any, TypeVar, cast
 
 from awesomeversion import AwesomeVersion
 from lru import LRU  # pylint: disable=no-name-in-module
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    func,
+    insert,
+    select,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
@@ -69,6 +75,8 @@ from .models import (
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import find_shared_attributes_id, find_shared_data_id
 from .run_history import RunHistory
+from .sampling import RecorderSampler
+from .task_queue import RecorderQueue
 from .tasks import (
     AdjustStatisticsTask,
     ClearStatisticsTask,
@@ -108,6 +116,12 @@ DEFAULT_URL = "sqlite:///{hass_config_path}"
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The commit interval is stretched by one interval for each
+# COMMIT_BACKLOG_STEP queued tasks so a large backlog is written
+# in fewer, larger transactions
+COMMIT_BACKLOG_STEP = 1000
+MAX_COMMIT_INTERVAL_FACTOR = 5
+
 # The number of attribute ids to cache in memory
 #
 # Based on:
@@ -152,6 +166,7 @@ class Recorder(threading.Thread):
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
         exclude_attributes_by_domain: dict[str, set[str]],
+        sampler: RecorderSampler,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -162,7 +177,9 @@ class Recorder(threading.Thread):
         self.keep_days = keep_days
         self._hass_started: asyncio.Future[object] = asyncio.Future()
         self.commit_interval = commit_interval
-        self._queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
+        self._queue = RecorderQueue()
+        self._commit_ticks = 0
+        self._commit_latency: float | None = None
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
@@ -180,6 +197,7 @@ class Recorder(threading.Thread):
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
+        self.sampler = sampler
 
         self.schema_version = 0
         self._commits_without_expire = 0
@@ -188,7 +206,8 @@ class Recorder(threading.Thread):
         self._event_data_ids: LRU = LRU(EVENT_DATA_ID_CACHE_SIZE)
         self._pending_state_attributes: dict[str, StateAttributes] = {}
         self._pending_event_data: dict[str, EventData] = {}
-        self._pending_expunge: list[States] = []
+        self._pending_events: list[Events] = []
+        self._pending_states: list[States] = []
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
@@ -212,6 +231,20 @@ class Recorder(threading.Thread):
         """Return the number of items in the recorder backlog."""
         return self._queue.qsize()
 
+    @property
+    def commit_interval_factor(self) -> int:
+        """Return how many commit intervals the backlog stretches a commit over."""
+        return min(1 + self.backlog // COMMIT_BACKLOG_STEP, MAX_COMMIT_INTERVAL_FACTOR)
+
+    @property
+    def queue_stats(self) -> dict[str, Any]:
+        """Return stats about the recorder queue and commits."""
+        return {
+            **self._queue.stats(),
+            "commit_interval": self.commit_interval * self.commit_interval_factor,
+            "commit_latency": self._commit_latency,
+        }
+
     @property
     def dialect_name(self) -> SupportedDialect | None:
         """Return the dialect the recorder uses."""
@@ -285,6 +318,10 @@ class Recorder(threading.Thread):
             and not self._database_lock_task
             and self._event_session_has_pending_writes()
         ):
+            self._commit_ticks += 1
+            if self._commit_ticks < self.commit_interval_factor:
+                return
+            self._commit_ticks = 0
             self.queue_task(COMMIT_TASK)
 
     @callback
@@ -384,11 +421,7 @@ class Recorder(threading.Thread):
         # We drain all the events in the queue and then insert
         # an empty one to ensure the next thing the recorder sees
         # is a request to shutdown.
-        while True:
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
+        self._queue.clear()
         self.queue_task(StopTask())
 
     async def _async_shutdown(self, event: Event) -> None:
@@ -741,8 +774,13 @@ class Recorder(threading.Thread):
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
-        # Commit if the commit interval is zero
-        if not self.commit_interval:
+        # Commit if the commit interval is zero, events queued
+        # in a backlog are committed in batches while it is worked off
+        if not self.commit_interval and (
+            self.backlog < COMMIT_BACKLOG_STEP
+            or len(self._pending_events) + len(self._pending_states)
+            >= COMMIT_BACKLOG_STEP
+        ):
             self._commit_event_session_or_retry()
 
     def _find_shared_attr_in_db(self, attr_hash: int, shared_attrs: str) -> int | None:
@@ -786,7 +824,7 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         dbevent = Events.from_event(event)
         if not event.data:
-            self.event_session.add(dbevent)
+            self._pending_events.append(dbevent)
             return
 
         try:
@@ -815,7 +853,7 @@ class Recorder(threading.Thread):
                 ] = dbevent_data
                 self.event_session.add(dbevent_data)
 
-        self.event_session.add(dbevent)
+        self._pending_events.append(dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
@@ -863,10 +901,9 @@ class Recorder(threading.Thread):
                 dbstate.old_state = old_state
         if event.data.get("new_state"):
             self._old_states[dbstate.entity_id] = dbstate
-            self._pending_expunge.append(dbstate)
         else:
             dbstate.state = None
-        self.event_session.add(dbstate)
+        self._pending_states.append(dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -880,7 +917,12 @@ class Recorder(threading.Thread):
 
     def _event_session_has_pending_writes(self) -> bool:
         return bool(
-            self.event_session and (self.event_session.new or self.event_session.dirty)
+            self._pending_events
+            or self._pending_states
+            or (
+                self.event_session
+                and (self.event_session.new or self.event_session.dirty)
+            )
         )
 
     def _commit_event_session_or_retry(self) -> None:
@@ -908,15 +950,27 @@ class Recorder(threading.Thread):
     def _commit_event_session(self) -> None:
         assert self.event_session is not None
         self._commits_without_expire += 1
-
+        start = time.monotonic()
+
+        if self._pending_events or self._pending_states:
+            # Flush the pending state attributes and event data
+            # first so their ids are known when inserting the rows
+            self.event_session.flush()
+            if self._pending_events:
+                self._insert_pending_events()
+            if self._pending_states:
+                self._insert_pending_states()
         self.event_session.commit()
-        if self._pending_expunge:
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
+        for dbstate in self._pending_states:
+            # Expunge the state so its not expired
+            # until we use it later for dbstate.old_state
+            if dbstate in self.event_session:
+                self.event_session.expunge(dbstate)
+        # The rows are only forgotten once committed
+        # so they are inserted again if the commit is retried
+        self._pending_events = []
+        self._pending_states = []
+        self._commit_latency = time.monotonic() - start
 
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -938,6 +992,93 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             self.event_session.expire_all()
 
+    def _insert_pending_events(self) -> None:
+        """Insert the pending events with a single executemany."""
+        assert self.event_session is not None
+        rows = []
+        for dbevent in self._pending_events:
+            if (data_id := dbevent.data_id) is None and (
+                event_data := dbevent.event_data_rel
+            ) is not None:
+                data_id = event_data.data_id
+            rows.append(
+                {
+                    "event_type": dbevent.event_type,
+                    "event_data": dbevent.event_data,
+                    "origin_idx": dbevent.origin_idx,
+                    "time_fired": dbevent.time_fired,
+                    "context_id": dbevent.context_id,
+                    "context_user_id": dbevent.context_user_id,
+                    "context_parent_id": dbevent.context_parent_id,
+                    "data_id": data_id,
+                }
+            )
+        self.event_session.execute(insert(Events), rows)
+
+    def _insert_pending_states(self) -> None:
+        """Insert the pending states with as few executemany as possible.
+
+        A state refers to the previous state of its entity with old_state_id,
+        so states of an entity that changed more than once since the last
+        commit are inserted in rounds holding at most one state per entity.
+        The state_ids of a round are returned by the insert.
+
+        Dialects that cannot return rows from an executemany (SQLite and
+        MySQL with SQLAlchemy 1.4) leave the states to the unit of work.
+        """
+        session = self.event_session
+        assert session is not None and self.engine is not None
+        if not self.engine.dialect.insert_executemany_returning:
+            session.add_all(self._pending_states)
+            session.flush()
+            return
+
+        rounds: list[list[States]] = []
+        round_by_entity_id: dict[str, int] = {}
+        for dbstate in self._pending_states:
+            index = round_by_entity_id.get(dbstate.entity_id, -1) + 1
+            round_by_entity_id[dbstate.entity_id] = index
+            if index == len(rounds):
+                rounds.append([])
+            rounds[index].append(dbstate)
+
+        for dbstates in rounds:
+            rows = []
+            for dbstate in dbstates:
+                if (old_state_id := dbstate.old_state_id) is None and (
+                    old_state := dbstate.old_state
+                ) is not None:
+                    old_state_id = old_state.state_id
+                if (attributes_id := dbstate.attributes_id) is None and (
+                    state_attributes := dbstate.state_attributes
+                ) is not None:
+                    attributes_id = state_attributes.attributes_id
+                rows.append(
+                    {
+                        "entity_id": dbstate.entity_id,
+                        "state": dbstate.state,
+                        "attributes": dbstate.attributes,
+                        "last_changed": dbstate.last_changed,
+                        "last_updated": dbstate.last_updated,
+                        "old_state_id": old_state_id,
+                        "attributes_id": attributes_id,
+                        "context_id": dbstate.context_id,
+                        "context_user_id": dbstate.context_user_id,
+                        "context_parent_id": dbstate.context_parent_id,
+                        "origin_idx": dbstate.origin_idx,
+                    }
+                )
+            # A round holds one state per entity so the returned
+            # rows are matched by entity_id regardless of their order
+            state_ids: dict[str, int] = dict(
+                session.execute(
+                    insert(States).returning(States.entity_id, States.state_id),
+                    rows,
+                ).all()
+            )
+            for dbstate in dbstates:
+                dbstate.state_id = state_ids[dbstate.entity_id]
+
     def _handle_sqlite_corruption(self) -> None:
         """Handle the sqlite3 database being corrupt."""
         self._close_event_session()
@@ -954,6 +1095,8 @@ class Recorder(threading.Thread):
         self._event_data_ids = {}
         self._pending_state_attributes = {}
         self._pending_event_data = {}
+        self._pending_events = []
+        self._pending_states = []
 
         if not self.event_session:
             return
@@ -985,8 +1128,15 @@ class Recorder(threading.Thread):
     @callback
     def event_listener(self, event: Event) -> None:
         """Listen for new events and put them in the process queue."""
-        if self._async_event_filter(event):
-            self.queue_task(EventTask(event))
+        if not self._async_event_filter(event):
+            return
+        if (
+            self.sampler.enabled
+            and event.event_type == EVENT_STATE_CHANGED
+            and not self.sampler.async_should_record(event)
+        ):
+            return
+        self.queue_task(EventTask(event))
 
     async def async_block_till_done(self) -> None:
         """Async version of block_till_done."""
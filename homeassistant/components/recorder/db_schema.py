@@ -402,6 +402,9 @@ class StateAttributes(Base):  # type: ignore[misc,valid-type]
         exclude_attrs = (
             exclude_attrs_by_domain.get(domain, set()) | ALL_DOMAIN_EXCLUDE_ATTRS
         )
+        if exclude_attrs.isdisjoint(state.attributes):
+            # Share the encoded attributes with the other users of the state
+            return state.attributes_json()
         return json_bytes(
             {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
         )
@@ -3,11 +3,11 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
-from datetime import datetime
+from datetime import datetime, timedelta
 from itertools import groupby
 import logging
 import time
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 from sqlalchemy import Column, Text, and_, func, lambda_stmt, or_, select
 from sqlalchemy.engine.row import Row
@@ -21,10 +21,13 @@ from homeassistant.components.websocket_api import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
+from . import statistics
 from .. import recorder
+from .const import DOMAIN
 from .db_schema import RecorderRuns, StateAttributes, States
 from .filters import Filters
 from .models import (
@@ -59,6 +62,12 @@ NEED_ATTRIBUTE_DOMAINS = {
     "water_heater",
 }
 
+# Statistics periods history can be downsampled to, from the widest
+DOWNSAMPLE_PERIODS: tuple[tuple[Literal["5minute", "hour"], timedelta], ...] = (
+    ("hour", timedelta(hours=1)),
+    ("5minute", timedelta(minutes=5)),
+)
+
 BASE_STATES = [
     States.entity_id,
     States.state,
@@ -162,6 +171,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    resolution: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass) as session:
@@ -177,6 +187,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            resolution,
         )
 
 
@@ -262,6 +273,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    resolution: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """
     Return states changes during UTC period start_time - end_time.
@@ -274,7 +286,46 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    resolution is an optional number of data points wanted per entity. When
+    given together with minimal_response and entity_ids, the history of
+    entities with mean statistics is downsampled from the statistics tables.
     """
+    if minimal_response and resolution and entity_ids:
+        if downsampled := _get_downsampled_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            resolution,
+            significant_changes_only,
+            no_attributes,
+            compressed_state_format,
+        ):
+            raw: MutableMapping[str, list[State | dict[str, Any]]] = {}
+            if raw_entity_ids := [
+                entity_id for entity_id in entity_ids if entity_id not in downsampled
+            ]:
+                raw = get_significant_states_with_session(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    raw_entity_ids,
+                    filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    compressed_state_format,
+                )
+            return {
+                entity_id: entity_states
+                for entity_id in entity_ids
+                if (entity_states := downsampled.get(entity_id) or raw.get(entity_id))
+            }
+
     stmt = _significant_states_stmt(
         _schema_version(hass),
         start_time,
@@ -301,6 +352,145 @@ def get_significant_states_with_session(
     )
 
 
+def _get_downsampled_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    resolution: int,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Return minimal responses downsampled from statistics.
+
+    The widest statistics period not exceeding the bucket width implied by the
+    resolution is used for the part of the window statistics have been compiled
+    for. Statistics rows are merged into buckets of that width, every bucket
+    providing the mean as state together with the min and the max. States
+    recorded after the last compiled period are returned as is.
+
+    Only entities with mean statistics in the unit of their current state are
+    downsampled, other entities are left out of the result.
+    """
+    end = end_time or dt_util.utcnow()
+    bucket_width = (end - start_time) / resolution
+    for period, duration in DOWNSAMPLE_PERIODS:
+        if bucket_width >= duration:
+            break
+    else:
+        return {}
+
+    compiled_end = statistics.compiled_statistics_end_with_session(session, period)
+    if compiled_end is None or (compiled_end := min(compiled_end, end)) <= start_time:
+        return {}
+
+    entity_id_by_metadata_id: dict[int, str] = {}
+    for entity_id, (metadata_id, metadata) in statistics.get_metadata_with_session(
+        hass, session, statistic_ids=entity_ids, statistic_source=DOMAIN
+    ).items():
+        if (
+            metadata["has_mean"]
+            and (state := hass.states.get(entity_id)) is not None
+            and state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            == metadata["unit_of_measurement"]
+        ):
+            entity_id_by_metadata_id[metadata_id] = entity_id
+    if not entity_id_by_metadata_id:
+        return {}
+
+    # The first response must be a native State to provide the attributes
+    initial_states = {
+        row.entity_id: row
+        for row in _get_rows_with_session(
+            hass,
+            session,
+            start_time,
+            list(entity_id_by_metadata_id.values()),
+            no_attributes=no_attributes,
+        )
+    }
+    if compressed_state_format:
+        state_class = row_to_compressed_state
+        _process_timestamp: Callable[
+            [datetime], float | str
+        ] = process_datetime_to_timestamp
+        attr_time = COMPRESSED_STATE_LAST_UPDATED
+        attr_state = COMPRESSED_STATE_STATE
+    else:
+        state_class = LazyState  # type: ignore[assignment]
+        _process_timestamp = process_timestamp_to_utc_isoformat
+        attr_time = LAST_CHANGED_KEY
+        attr_state = STATE_KEY
+
+    result: dict[str, list[State | dict[str, Any]]] = {}
+    for metadata_id, group in groupby(
+        statistics.statistic_rows_during_period_with_session(
+            session, start_time, compiled_end, list(entity_id_by_metadata_id), period
+        ),
+        lambda stat: stat.metadata_id,  # type: ignore[no-any-return]
+    ):
+        entity_id = entity_id_by_metadata_id[metadata_id]
+        if (initial_state := initial_states.get(entity_id)) is None:
+            continue
+        ent_results: list[State | dict[str, Any]] = [
+            state_class(initial_state, {}, start_time)
+        ]
+        # Buckets of [start, sum of means, number of rows, min, max]
+        buckets: dict[int, list[Any]] = {}
+        for stat in group:
+            if stat.mean is None:
+                continue
+            start = process_timestamp(stat.start)
+            index = int((start - start_time) / bucket_width)
+            if (bucket := buckets.get(index)) is None:
+                buckets[index] = [start, stat.mean, 1, stat.min, stat.max]
+                continue
+            bucket[1] += stat.mean
+            bucket[2] += 1
+            bucket[3] = min(bucket[3], stat.min)
+            bucket[4] = max(bucket[4], stat.max)
+        for start, mean_sum, count, min_, max_ in buckets.values():
+            ent_results.append(
+                {
+                    attr_state: str(mean_sum / count),
+                    attr_time: _process_timestamp(max(start, start_time)),
+                    "min": min_,
+                    "max": max_,
+                }
+            )
+        result[entity_id] = ent_results
+
+    if result and compiled_end < end:
+        # The states after the compiled statistics are added in the same
+        # format as the buckets, the start state is already provided
+        stmt = _significant_states_stmt(
+            _schema_version(hass),
+            compiled_end,
+            end_time,
+            list(result),
+            None,
+            significant_changes_only,
+            True,
+        )
+        for entity_id, group in groupby(
+            execute_stmt_lambda_element(session, stmt, None, end_time),
+            lambda state: state.entity_id,  # type: ignore[no-any-return]
+        ):
+            ent_results = result[entity_id]
+            prev_state = None
+            for row in group:
+                if (state := row.state) == prev_state:
+                    continue
+                ent_results.append(
+                    {attr_state: state, attr_time: _process_timestamp(row.last_updated)}
+                )
+                prev_state = state
+
+    return result
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -0,0 +1,176 @@
+"""Limit the states recorded for high frequency entities."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import fnmatch
+import re
+from typing import Any
+
+from homeassistant.const import CONF_ENTITIES
+from homeassistant.core import Event, State, callback
+from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_PERCENT,
+    CONF_MAX_ROWS_PER_HOUR,
+    CONF_MIN_INTERVAL,
+)
+
+SUPPRESSED_DEADBAND = "deadband"
+SUPPRESSED_MIN_INTERVAL = "min_interval"
+SUPPRESSED_MAX_ROWS_PER_HOUR = "max_rows_per_hour"
+SUPPRESSED_REASONS = (
+    SUPPRESSED_DEADBAND,
+    SUPPRESSED_MIN_INTERVAL,
+    SUPPRESSED_MAX_ROWS_PER_HOUR,
+)
+
+
+@dataclass
+class RecordedState:
+    """The last state recorded for an entity."""
+
+    value: float | None
+    attributes: Any
+    timestamp: float
+    hour: int
+    rows_in_hour: int
+
+
+@dataclass
+class SamplingPolicy:
+    """Limits on the states recorded for matching entities."""
+
+    deadband: float | None = None
+    deadband_percent: float | None = None
+    min_interval: float | None = None
+    max_rows_per_hour: int | None = None
+
+    @classmethod
+    def from_config(cls, conf: ConfigType) -> SamplingPolicy:
+        """Create a policy from configuration."""
+        min_interval = conf.get(CONF_MIN_INTERVAL)
+        return cls(
+            deadband=conf.get(CONF_DEADBAND),
+            deadband_percent=conf.get(CONF_DEADBAND_PERCENT),
+            min_interval=min_interval.total_seconds() if min_interval else None,
+            max_rows_per_hour=conf.get(CONF_MAX_ROWS_PER_HOUR),
+        )
+
+    def suppress_reason(
+        self,
+        last: RecordedState,
+        value: float | None,
+        new_state: State,
+        timestamp: float,
+        hour: int,
+    ) -> str | None:
+        """Return why a state should not be recorded, None to record it."""
+        # Non numeric states and attribute changes are always recorded
+        if (
+            value is None
+            or last.value is None
+            or (
+                new_state.attributes is not last.attributes
+                and new_state.attributes != last.attributes
+            )
+        ):
+            return None
+        if (
+            self.min_interval is not None
+            and timestamp - last.timestamp < self.min_interval
+        ):
+            return SUPPRESSED_MIN_INTERVAL
+        if (
+            self.max_rows_per_hour is not None
+            and hour == last.hour
+            and last.rows_in_hour >= self.max_rows_per_hour
+        ):
+            return SUPPRESSED_MAX_ROWS_PER_HOUR
+        change = abs(value - last.value)
+        if self.deadband is not None and change < self.deadband:
+            return SUPPRESSED_DEADBAND
+        if (
+            self.deadband_percent is not None
+            and change < abs(last.value) * self.deadband_percent / 100
+        ):
+            return SUPPRESSED_DEADBAND
+        return None
+
+
+def _as_float(state: str) -> float | None:
+    """Return a state as a float or None if it is not numeric."""
+    try:
+        return float(state)
+    except ValueError:
+        return None
+
+
+class RecorderSampler:
+    """Decide which state changes are recorded according to sampling policies."""
+
+    def __init__(self, conf: list[ConfigType]) -> None:
+        """Initialize the sampler."""
+        self._entity_policies: dict[str, SamplingPolicy] = {}
+        self._glob_policies: list[tuple[re.Pattern[str], SamplingPolicy]] = []
+        for policy_conf in conf:
+            policy = SamplingPolicy.from_config(policy_conf)
+            for entity_id in policy_conf.get(CONF_ENTITIES, []):
+                self._entity_policies.setdefault(entity_id, policy)
+            for glob in policy_conf.get(CONF_ENTITY_GLOBS, []):
+                self._glob_policies.append(
+                    (re.compile(fnmatch.translate(glob)), policy)
+                )
+        self.enabled = bool(self._entity_policies or self._glob_policies)
+        self._policies: dict[str, SamplingPolicy | None] = {}
+        self._recorded: dict[str, RecordedState] = {}
+        self.suppressed = dict.fromkeys(SUPPRESSED_REASONS, 0)
+
+    @callback
+    def _async_get_policy(self, entity_id: str) -> SamplingPolicy | None:
+        """Return the policy for an entity, exact entity ids win over globs."""
+        if entity_id in self._policies:
+            return self._policies[entity_id]
+        policy = self._entity_policies.get(entity_id)
+        if policy is None:
+            policy = next(
+                (
+                    glob_policy
+                    for pattern, glob_policy in self._glob_policies
+                    if pattern.match(entity_id)
+                ),
+                None,
+            )
+        self._policies[entity_id] = policy
+        return policy
+
+    @callback
+    def async_should_record(self, event: Event) -> bool:
+        """Return if a state_changed event should be recorded."""
+        entity_id: str = event.data["entity_id"]
+        if (policy := self._async_get_policy(entity_id)) is None:
+            return True
+        new_state: State | None = event.data.get("new_state")
+        if new_state is None:
+            self._recorded.pop(entity_id, None)
+            return True
+
+        value = _as_float(new_state.state)
+        timestamp = new_state.last_updated.timestamp()
+        hour = int(timestamp // 3600)
+        rows_in_hour = 1
+        if (last := self._recorded.get(entity_id)) is not None:
+            if reason := policy.suppress_reason(
+                last, value, new_state, timestamp, hour
+            ):
+                self.suppressed[reason] += 1
+                return False
+            if last.hour == hour:
+                rows_in_hour = last.rows_in_hour + 1
+
+        self._recorded[entity_id] = RecordedState(
+            value, new_state.attributes, timestamp, hour, rows_in_hour
+        )
+        return True
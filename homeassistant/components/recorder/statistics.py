@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import Event, HomeAssistant, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
@@ -41,7 +42,13 @@ import homeassistant.util.temperature as temperature_util
 from homeassistant.util.unit_system import UnitSystem
 import homeassistant.util.volume as volume_util
 
-from .const import DOMAIN, MAX_ROWS_TO_PURGE, SupportedDialect
+from .const import (
+    DOMAIN,
+    MAX_ROWS_TO_PURGE,
+    SIGNAL_HOURLY_STATISTICS_COMPILED,
+    SIGNAL_STATISTICS_UPDATED,
+    SupportedDialect,
+)
 from .db_schema import Statistics, StatisticsMeta, StatisticsRuns, StatisticsShortTerm
 from .models import (
     StatisticData,
@@ -622,6 +629,13 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
 
         session.add(StatisticsRuns(start=start))
 
+    if start.minute == 55:
+        dispatcher_send(
+            instance.hass,
+            SIGNAL_HOURLY_STATISTICS_COMPILED,
+            start.replace(minute=0),
+        )
+
     return True
 
 
@@ -797,6 +811,8 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
             StatisticsMeta.statistic_id.in_(statistic_ids)
         ).delete(synchronize_session=False)
 
+    dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED, statistic_ids)
+
 
 def update_statistics_metadata(
     instance: Recorder,
@@ -820,6 +836,8 @@ def update_statistics_metadata(
                 & (StatisticsMeta.source == DOMAIN)
             ).update({StatisticsMeta.statistic_id: new_statistic_id})
 
+    dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED, [statistic_id])
+
 
 def list_statistic_ids(
     hass: HomeAssistant,
@@ -1098,6 +1116,39 @@ def statistics_during_period(
         return _reduce_statistics_per_month(result)
 
 
+def statistic_rows_during_period_with_session(
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    metadata_ids: list[int],
+    period: Literal["5minute", "hour"],
+) -> Iterable[Row]:
+    """Return unconverted statistics rows during UTC period start_time - end_time.
+
+    The rows are ordered by metadata_id and start.
+    """
+    if period == "5minute":
+        stmt = _statistics_during_period_stmt_short_term(
+            start_time, end_time, metadata_ids
+        )
+    else:
+        stmt = _statistics_during_period_stmt(start_time, end_time, metadata_ids)
+    return execute_stmt_lambda_element(session, stmt)
+
+
+def compiled_statistics_end_with_session(
+    session: Session, period: Literal["5minute", "hour"]
+) -> datetime | None:
+    """Return the end of the last period statistics have been compiled for."""
+    if not (last_run := session.query(func.max(StatisticsRuns.start)).scalar()):
+        return None
+    end = process_timestamp(last_run) + timedelta(minutes=5)
+    if period == "hour":
+        # Hourly statistics are compiled together with the last 5-minute period
+        end = end.replace(minute=0, second=0, microsecond=0)
+    return end
+
+
 def _get_last_statistics_stmt(
     metadata_id: int,
     number_of_stats: int,
@@ -1510,6 +1561,9 @@ def import_statistics(
             else:
                 _insert_statistics(session, Statistics, metadata_id, stat)
 
+    dispatcher_send(
+        instance.hass, SIGNAL_STATISTICS_UPDATED, [metadata["statistic_id"]]
+    )
     return True
 
 
@@ -1551,4 +1605,5 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED, [statistic_id])
     return True
@@ -0,0 +1,68 @@
+"""Queue the recorder tasks in lanes."""
+from __future__ import annotations
+
+from collections import Counter, deque
+import threading
+import time
+from typing import Any
+
+from .tasks import RecorderTask
+
+
+class RecorderQueue:
+    """A queue of recorder tasks with a lane for priority tasks.
+
+    Priority tasks are processed before the other queued tasks so
+    they are not stuck behind a flood of events. The other tasks
+    are processed in the order they were queued.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        self._not_empty = threading.Condition(threading.Lock())
+        self._priority_lane: deque[tuple[float, RecorderTask]] = deque()
+        self._lane: deque[tuple[float, RecorderTask]] = deque()
+        self._depth: Counter[str] = Counter()
+
+    def qsize(self) -> int:
+        """Return the number of queued tasks."""
+        return len(self._priority_lane) + len(self._lane)
+
+    def put(self, task: RecorderTask) -> None:
+        """Queue a task in its lane."""
+        with self._not_empty:
+            if task.priority:
+                self._priority_lane.append((time.monotonic(), task))
+            else:
+                self._lane.append((time.monotonic(), task))
+            self._depth[type(task).__name__] += 1
+            self._not_empty.notify()
+
+    def get(self) -> RecorderTask:
+        """Remove and return the next task, waiting until one is queued."""
+        with self._not_empty:
+            while not self._priority_lane and not self._lane:
+                self._not_empty.wait()
+            _, task = (self._priority_lane or self._lane).popleft()
+            name = type(task).__name__
+            if self._depth[name] == 1:
+                del self._depth[name]
+            else:
+                self._depth[name] -= 1
+            return task
+
+    def clear(self) -> None:
+        """Remove all the queued tasks."""
+        with self._not_empty:
+            self._priority_lane.clear()
+            self._lane.clear()
+            self._depth.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return the depth per task type and the age of the oldest task."""
+        with self._not_empty:
+            queued = [lane[0][0] for lane in (self._priority_lane, self._lane) if lane]
+            return {
+                "depth": dict(self._depth),
+                "oldest_task_age": time.monotonic() - min(queued) if queued else None,
+            }
@@ -25,6 +25,9 @@ class RecorderTask(abc.ABC):
     """ABC for recorder tasks."""
 
     commit_before = True
+    # Priority tasks are processed before the queued events. All the
+    # tasks changing statistics are priority tasks so they keep their order.
+    priority = False
 
     @abc.abstractmethod
     def run(self, instance: Recorder) -> None:
@@ -36,6 +39,7 @@ class ClearStatisticsTask(RecorderTask):
     """Object to store statistics_ids which for which to remove statistics."""
 
     statistic_ids: list[str]
+    priority = True
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -49,6 +53,7 @@ class UpdateStatisticsMetadataTask(RecorderTask):
     statistic_id: str
     new_statistic_id: str | None | UndefinedType
     new_unit_of_measurement: str | None | UndefinedType
+    priority = True
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -129,6 +134,7 @@ class ImportStatisticsTask(RecorderTask):
 
     metadata: StatisticMetaData
     statistics: Iterable[StatisticData]
+    priority = True
 
     def run(self, instance: Recorder) -> None:
         """Run statistics task."""
@@ -145,6 +151,7 @@ class AdjustStatisticsTask(RecorderTask):
     statistic_id: str
     start_time: datetime
     sum_adjustment: float
+    priority = True
 
     def run(self, instance: Recorder) -> None:
         """Run statistics task."""
@@ -216,6 +223,7 @@ class KeepAliveTask(RecorderTask):
     """A keep alive to be sent."""
 
     commit_before = False
+    priority = True
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -228,6 +236,7 @@ class CommitTask(RecorderTask):
     """Commit the event session."""
 
     commit_before = False
+    priority = True
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -311,13 +311,17 @@ def ws_info(
     migration_is_live = async_migration_is_live(hass)
     recording = instance.recording if instance else False
     thread_alive = instance.is_alive() if instance else False
+    suppressed_states = dict(instance.sampler.suppressed) if instance else None
+    queue_stats = instance.queue_stats if instance else None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": MAX_QUEUE_BACKLOG,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "queue": queue_stats,
         "recording": recording,
+        "suppressed_states": suppressed_states,
         "thread_running": thread_alive,
     }
     connection.send_result(msg["id"], recorder_info)
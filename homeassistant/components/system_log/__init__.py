@@ -12,6 +12,7 @@ from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.logging import get_queue_handler
 
 CONF_MAX_ENTRIES = "max_entries"
 CONF_FIRE_EVENT = "fire_event"
@@ -213,6 +214,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     logging.root.addHandler(handler)
 
     websocket_api.async_register_command(hass, list_errors)
+    websocket_api.async_register_command(hass, list_logger_stats)
 
     async def async_service_handler(service: ServiceCall) -> None:
         """Handle logger services."""
@@ -247,3 +249,17 @@ def list_errors(
         msg["id"],
         hass.data[DOMAIN].records.to_list(),
     )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "system_log/logger_stats"})
+@callback
+def list_logger_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+):
+    """List the number of emitted and dropped log records per logger."""
+    queue_handler = get_queue_handler()
+    connection.send_result(
+        msg["id"],
+        queue_handler.diagnostics() if queue_handler else {},
+    )
@@ -22,15 +22,27 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.generated import supported_brands
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity,
+    refresh_scheduler,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_track_template_result,
 )
-from homeassistant.helpers.json import JSON_DUMP, ExtendedJSONEncoder
-from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.json import (
+    JSON_DUMP,
+    JSON_ENCODE_EXCEPTIONS,
+    ExtendedJSONEncoder,
+)
+from homeassistant.helpers.service import (
+    async_get_all_descriptions,
+    async_get_target_resolution_cache,
+)
 from homeassistant.loader import (
     Integration,
     IntegrationNotFound,
@@ -60,12 +72,15 @@ def async_register_commands(
     async_reg(hass, handle_fire_event)
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_get_services)
+    async_reg(hass, handle_get_services_target_info)
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_refresh_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_render_template_cache_info)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -245,7 +260,20 @@ def handle_get_states(
 
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
+    # to succeed for the UI to show. States are encoded once and their JSON
+    # is shared with the other connections and the API.
+    try:
+        joined_states = b",".join([state.as_dict_json() for state in states])
+    except JSON_ENCODE_EXCEPTIONS:
+        pass
+    else:
+        connection.send_message(
+            JSON_DUMP(messages.result_message(msg["id"], ["TO_REPLACE"])).replace(
+                '"TO_REPLACE"', joined_states.decode(), 1
+            )
+        )
+        return
+
     response = messages.result_message(msg["id"], states)
     try:
         connection.send_message(JSON_DUMP(response))
@@ -357,6 +385,15 @@ async def handle_get_services(
     connection.send_result(msg["id"], descriptions)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "get_services/target_info"})
+def handle_get_services_target_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle get services target info command."""
+    connection.send_result(msg["id"], async_get_target_resolution_cache(hass).as_dict())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "get_config"})
 def handle_get_config(
@@ -421,6 +458,17 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/refresh_info"})
+def handle_integration_refresh_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle refresh info command."""
+    connection.send_result(
+        msg["id"], refresh_scheduler.async_get(hass).async_diagnostics()
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -504,6 +552,15 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "render_template/cache_info"})
+def handle_render_template_cache_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle render template cache info command."""
+    connection.send_result(msg["id"], template.async_get_cache_info(hass))
+
+
 @callback
 @decorators.websocket_command(
     {vol.Required("type"): "entity/source", vol.Optional("entity_id"): [cv.entity_id]}
@@ -1,15 +1,17 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
+from contextlib import suppress
 from functools import lru_cache
 import logging
 from typing import Any, Final
 
 import voluptuous as vol
 
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.json import JSON_DUMP, JSON_ENCODE_EXCEPTIONS
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
@@ -39,6 +41,9 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
 
+OLD_STATE_TEMPLATE: Final = "__OLD_STATE__"
+NEW_STATE_TEMPLATE: Final = "__NEW_STATE__"
+
 STATE_DIFF_ADDITIONS = "+"
 STATE_DIFF_REMOVALS = "-"
 
@@ -86,9 +91,49 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
+    if event.event_type == EVENT_STATE_CHANGED:
+        with suppress(*JSON_ENCODE_EXCEPTIONS):
+            if message := _state_changed_event_message_json(event):
+                return message
     return message_to_json(event_message(IDEN_TEMPLATE, event))
 
 
+def _state_changed_event_message_json(event: Event) -> str | None:
+    """Serialize a state_changed event reusing the JSON of its states."""
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
+    if not isinstance(old_state, (State, type(None))) or not isinstance(
+        new_state, (State, type(None))
+    ):
+        return None
+    old_state_json = old_state.as_dict_json().decode() if old_state else "null"
+    new_state_json = new_state.as_dict_json().decode() if new_state else "null"
+    event_dict = event.as_dict()
+    data = {
+        key: value
+        for key, value in event_dict["data"].items()
+        if key not in ("old_state", "new_state")
+    }
+    # The old state template is placed before the new one so the JSON of
+    # the states is spliced into the message in a single pass
+    message = JSON_DUMP(
+        event_message(
+            IDEN_TEMPLATE,
+            {
+                **event_dict,
+                "data": {
+                    **data,
+                    "old_state": OLD_STATE_TEMPLATE,
+                    "new_state": NEW_STATE_TEMPLATE,
+                },
+            },
+        )
+    )
+    before, _, rest = message.partition(f'"{OLD_STATE_TEMPLATE}"')
+    between, _, after = rest.partition(f'"{NEW_STATE_TEMPLATE}"')
+    return "".join((before, old_state_json, between, new_state_json, after))
+
+
 def cached_state_diff_message(iden: int, event: Event) -> str:
     """Return an event message.
 
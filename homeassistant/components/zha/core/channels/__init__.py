@@ -157,7 +157,8 @@ class Channels:
     @callback
     def async_send_signal(self, signal: str, *args: Any) -> None:
         """Send a signal through hass dispatcher."""
-        async_dispatcher_send(self.zha_device.hass, signal, *args)
+        with self.zha_device.async_handle_channel_signal():
+            async_dispatcher_send(self.zha_device.hass, signal, *args)
 
     @callback
     def zha_send_event(self, event_data: dict[str, str | int]) -> None:
@@ -142,6 +142,8 @@ CONF_CONSIDER_UNAVAILABLE_MAINS = "consider_unavailable_mains"
 CONF_DEFAULT_CONSIDER_UNAVAILABLE_MAINS = 60 * 60 * 2  # 2 hours
 CONF_CONSIDER_UNAVAILABLE_BATTERY = "consider_unavailable_battery"
 CONF_DEFAULT_CONSIDER_UNAVAILABLE_BATTERY = 60 * 60 * 6  # 6 hours
+CONF_ATTRIBUTE_REPORT_WINDOW = "attribute_report_window"
+CONF_DEFAULT_ATTRIBUTE_REPORT_WINDOW = 0  # milliseconds, 0 = same loop iteration
 
 CONF_ZHA_OPTIONS_SCHEMA = vol.Schema(
     {
@@ -158,6 +160,10 @@ CONF_ZHA_OPTIONS_SCHEMA = vol.Schema(
             CONF_CONSIDER_UNAVAILABLE_BATTERY,
             default=CONF_DEFAULT_CONSIDER_UNAVAILABLE_BATTERY,
         ): cv.positive_int,
+        vol.Optional(
+            CONF_ATTRIBUTE_REPORT_WINDOW,
+            default=CONF_DEFAULT_ATTRIBUTE_REPORT_WINDOW,
+        ): cv.positive_int,
     }
 )
 
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import timedelta
 from enum import Enum
 from functools import cached_property
@@ -60,8 +61,10 @@ from .const import (
     CLUSTER_COMMANDS_SERVER,
     CLUSTER_TYPE_IN,
     CLUSTER_TYPE_OUT,
+    CONF_ATTRIBUTE_REPORT_WINDOW,
     CONF_CONSIDER_UNAVAILABLE_BATTERY,
     CONF_CONSIDER_UNAVAILABLE_MAINS,
+    CONF_DEFAULT_ATTRIBUTE_REPORT_WINDOW,
     CONF_DEFAULT_CONSIDER_UNAVAILABLE_BATTERY,
     CONF_DEFAULT_CONSIDER_UNAVAILABLE_MAINS,
     CONF_ENABLE_IDENTIFY_ON_JOIN,
@@ -78,6 +81,7 @@ from .helpers import LogMixin, async_get_zha_config_value
 
 if TYPE_CHECKING:
     from ..api import ClusterBinding
+    from ..entity import BaseZhaEntity
     from .gateway import ZHAGateway
 
 _LOGGER = logging.getLogger(__name__)
@@ -134,6 +138,22 @@ class ZHADevice(LogMixin):
                 CONF_DEFAULT_CONSIDER_UNAVAILABLE_BATTERY,
             )
 
+        # State writes of entities caused by channel signals, like attribute
+        # reports, are merged into one write per entity within this window
+        # (milliseconds)
+        self.attribute_report_window: int = async_get_zha_config_value(
+            self._zha_gateway.config_entry,
+            ZHA_OPTIONS,
+            CONF_ATTRIBUTE_REPORT_WINDOW,
+            CONF_DEFAULT_ATTRIBUTE_REPORT_WINDOW,
+        )
+        self._handling_signals = 0
+        self._pending_state_writes: dict[str, BaseZhaEntity] = {}
+        self._flush_state_writes_handle: asyncio.Handle | None = None
+        self.channel_signals = 0
+        self.state_writes = 0
+        self.coalesced_state_writes = 0
+
         keep_alive_interval = random.randint(*_UPDATE_ALIVE_INTERVAL)
         self.unsubs.append(
             async_track_time_interval(
@@ -503,6 +523,74 @@ class ZHADevice(LogMixin):
         """Unsubscribe the dispatchers and timers."""
         for unsubscribe in self.unsubs:
             unsubscribe()
+        if self._flush_state_writes_handle is not None:
+            self._flush_state_writes_handle.cancel()
+            self._flush_state_writes_handle = None
+        self._pending_state_writes.clear()
+
+    @contextmanager
+    def async_handle_channel_signal(self) -> Iterator[None]:
+        """Defer the state writes of entities while a signal is dispatched."""
+        self.channel_signals += 1
+        self._handling_signals += 1
+        try:
+            yield
+        finally:
+            self._handling_signals -= 1
+
+    @callback
+    def async_defer_state_write(self, entity: BaseZhaEntity) -> bool:
+        """Defer the state write of an entity caused by a channel signal.
+
+        Returns False when the state should be written right away.
+        """
+        pending = self._pending_state_writes
+        if not self._handling_signals:
+            # A direct write supersedes a deferred one
+            if pending.pop(entity.unique_id, None) is not None:
+                self.coalesced_state_writes += 1
+            return False
+
+        if entity.unique_id in pending:
+            self.coalesced_state_writes += 1
+            return True
+
+        pending[entity.unique_id] = entity
+        if self._flush_state_writes_handle is None:
+            if window := self.attribute_report_window:
+                self._flush_state_writes_handle = self.hass.loop.call_later(
+                    window / 1000, self._async_flush_state_writes
+                )
+            else:
+                self._flush_state_writes_handle = self.hass.loop.call_soon(
+                    self._async_flush_state_writes
+                )
+        return True
+
+    @callback
+    def async_cancel_state_write(self, entity: BaseZhaEntity) -> None:
+        """Drop the deferred state write of an entity removed from hass."""
+        self._pending_state_writes.pop(entity.unique_id, None)
+
+    @callback
+    def _async_flush_state_writes(self) -> None:
+        """Write the deferred states of entities."""
+        self._flush_state_writes_handle = None
+        pending = self._pending_state_writes
+        self._pending_state_writes = {}
+        for entity in pending.values():
+            self.state_writes += 1
+            entity.async_write_deferred_state()
+
+    @property
+    def state_write_stats(self) -> dict[str, int]:
+        """Return counters of channel signals and the state writes they caused."""
+        return {
+            "channel_signals": self.channel_signals,
+            "state_writes": self.state_writes,
+            "coalesced_state_writes": self.coalesced_state_writes,
+            "attribute_report_window": self.attribute_report_window,
+        }
 
     @property
     def zha_device_info(self) -> dict[str, Any]:
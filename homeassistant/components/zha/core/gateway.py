@@ -80,7 +80,7 @@ from .const import (
     RadioType,
 )
 from .device import DeviceStatus, ZHADevice
-from .group import GroupMember, ZHAGroup
+from .group import GroupFanOut, GroupMember, ZHAGroup
 from .registries import GROUP_ENTITY_DOMAINS
 
 if TYPE_CHECKING:
@@ -143,6 +143,7 @@ class ZHAGateway:
         self.config_entry = config_entry
         self._unsubs: list[Callable[[], None]] = []
         self.initialized: bool = False
+        self.group_fan_out = GroupFanOut(hass, self)
 
     async def async_initialize(self) -> None:
         """Initialize controller and connect radio."""
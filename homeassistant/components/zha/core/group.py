@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
 import logging
 from typing import TYPE_CHECKING, Any, NamedTuple
 
@@ -10,7 +12,7 @@ import zigpy.exceptions
 import zigpy.group
 from zigpy.types.named import EUI64
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_registry import async_entries_for_device
 
 from .helpers import LogMixin
@@ -229,3 +231,125 @@ class ZHAGroup(LogMixin):
         msg = f"[%s](%s): {msg}"
         args = (self.name, self.group_id) + args
         _LOGGER.log(level, msg, *args, **kwargs)
+
+
+@dataclass
+class _PendingGroupCommand:
+    """A command collected for devices within one loop iteration."""
+
+    command: Callable[[zigpy.endpoint.Endpoint], Awaitable[Any]]
+    members: dict[GroupMember, asyncio.Future[Any]] = field(default_factory=dict)
+
+
+class GroupFanOut:
+    """Send a command issued to many devices to their zigbee groups.
+
+    Commands issued with the same key within one loop iteration, like a
+    service call targeting many lights, are sent once to every group that
+    only contains targeted members. Members not covered by a group fall back
+    to unicast.
+    """
+
+    def __init__(self, hass: HomeAssistant, zha_gateway: ZHAGateway) -> None:
+        """Initialize the group fan out."""
+        self.hass = hass
+        self._zha_gateway = zha_gateway
+        self._pending: dict[Hashable, _PendingGroupCommand] = {}
+        self.group_commands = 0
+        self.unicast_commands_saved = 0
+
+    async def async_send(
+        self,
+        key: Hashable,
+        member: GroupMember,
+        command: Callable[[zigpy.endpoint.Endpoint], Awaitable[Any]],
+    ) -> Any | None:
+        """Send a command through a group.
+
+        Returns the result of the group command or None when the command has
+        to be sent to the member itself.
+        """
+        if (pending := self._pending.get(key)) is None:
+            pending = self._pending[key] = _PendingGroupCommand(command)
+            self.hass.loop.call_soon(self._async_plan, key)
+        elif member in pending.members:
+            return None
+        future: asyncio.Future[Any] = self.hass.loop.create_future()
+        pending.members[member] = future
+        return await future
+
+    @callback
+    def _async_plan(self, key: Hashable) -> None:
+        """Map the collected members onto groups."""
+        pending = self._pending.pop(key)
+        remaining = set(pending.members)
+        try:
+            self._async_plan_groups(pending, remaining)
+        finally:
+            for member in remaining:
+                if not (future := pending.members[member]).done():
+                    future.set_result(None)
+
+    @callback
+    def _async_plan_groups(
+        self, pending: _PendingGroupCommand, remaining: set[GroupMember]
+    ) -> None:
+        """Send the command to the groups covering the remaining members."""
+        if len(remaining) > 1:
+            candidates = [
+                (
+                    zha_group,
+                    {
+                        GroupMember(member.device.ieee, member.endpoint_id)
+                        for member in zha_group.members
+                        if not member.device.is_coordinator
+                    },
+                )
+                for zha_group in self._zha_gateway.groups.values()
+            ]
+            # Prefer the largest groups to send as few commands as possible
+            candidates.sort(key=lambda candidate: len(candidate[1]), reverse=True)
+            for zha_group, members in candidates:
+                if len(members) < 2 or not members <= remaining:
+                    continue
+                self.hass.async_create_task(
+                    self._async_send_group_command(
+                        zha_group,
+                        pending.command,
+                        [pending.members[member] for member in members],
+                    )
+                )
+                remaining -= members
+
+    async def _async_send_group_command(
+        self,
+        zha_group: ZHAGroup,
+        command: Callable[[zigpy.endpoint.Endpoint], Awaitable[Any]],
+        futures: list[asyncio.Future[Any]],
+    ) -> None:
+        """Send a command to a group and hand the result to its members.
+
+        The members fall back to unicast when the group command fails.
+        """
+        result = None
+        try:
+            result = await command(zha_group.endpoint)
+        except (zigpy.exceptions.ZigbeeException, asyncio.TimeoutError) as ex:
+            zha_group.debug("failed to send group command: %s", ex)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error sending group command")
+        else:
+            self.group_commands += 1
+            self.unicast_commands_saved += len(futures) - 1
+        finally:
+            for future in futures:
+                if not future.done():
+                    future.set_result(result)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return counters of the commands sent to groups."""
+        return {
+            "group_commands": self.group_commands,
+            "unicast_commands_saved": self.unicast_commands_saved,
+        }
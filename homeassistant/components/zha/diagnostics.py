@@ -50,6 +50,7 @@ KEYS_TO_REDACT = {
 
 ATTRIBUTES = "attributes"
 CLUSTER_DETAILS = "cluster_details"
+STATE_WRITES = "state_writes"
 UNSUPPORTED_ATTRIBUTES = "unsupported_attributes"
 
 
@@ -78,6 +79,8 @@ async def async_get_config_entry_diagnostics(
             "config": config,
             "config_entry": config_entry.as_dict(),
             "application_state": shallow_asdict(gateway.application_controller.state),
+            STATE_WRITES: get_state_write_totals(gateway),
+            "group_fan_out": gateway.group_fan_out.stats,
             "versions": {
                 "bellows": bellows.__version__,
                 "zigpy": zigpy.__version__,
@@ -99,9 +102,19 @@ async def async_get_device_diagnostics(
     zha_device: ZHADevice = async_get_zha_device(hass, device.id)
     device_info: dict[str, Any] = zha_device.zha_device_info
     device_info[CLUSTER_DETAILS] = get_endpoint_cluster_attr_data(zha_device)
+    device_info[STATE_WRITES] = zha_device.state_write_stats
     return async_redact_data(device_info, KEYS_TO_REDACT)
 
 
+def get_state_write_totals(gateway: ZHAGateway) -> dict[str, int]:
+    """Return the state write counters summed over all devices."""
+    totals = {"channel_signals": 0, "state_writes": 0, "coalesced_state_writes": 0}
+    for zha_device in gateway.devices.values():
+        for key in totals:
+            totals[key] += getattr(zha_device, key)
+    return totals
+
+
 def get_endpoint_cluster_attr_data(zha_device: ZHADevice) -> dict:
     """Return endpoint cluster attribute data."""
     cluster_details = {}
@@ -97,6 +97,17 @@ class BaseZhaEntity(LogMixin, entity.Entity):
             via_device=(DOMAIN, self.hass.data[DATA_ZHA][DATA_ZHA_BRIDGE_ID]),
         )
 
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, merging writes caused by channel signals."""
+        if not self._zha_device.async_defer_state_write(self):
+            super().async_write_ha_state()
+
+    @callback
+    def async_write_deferred_state(self) -> None:
+        """Write the state deferred while a channel signal was handled."""
+        super().async_write_ha_state()
+
     @callback
     def async_state_changed(self) -> None:
         """Entity state changed."""
@@ -117,6 +128,7 @@ class BaseZhaEntity(LogMixin, entity.Entity):
         for unsub in self._unsubs[:]:
             unsub()
             self._unsubs.remove(unsub)
+        self._zha_device.async_cancel_state_write(self)
 
     @callback
     def async_accept_signal(
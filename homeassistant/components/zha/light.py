@@ -11,6 +11,7 @@ import logging
 import random
 from typing import TYPE_CHECKING, Any, cast
 
+import zigpy.endpoint
 from zigpy.zcl.clusters.general import Identify, LevelControl, OnOff
 from zigpy.zcl.clusters.lighting import Color
 from zigpy.zcl.foundation import Status
@@ -24,6 +25,7 @@ from homeassistant.components.light import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_SUPPORTED_FEATURES,
+    SERVICE_TURN_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
     Platform,
@@ -52,6 +54,7 @@ from .core.const import (
     SIGNAL_SET_LEVEL,
     ZHA_OPTIONS,
 )
+from .core.group import GroupMember
 from .core.helpers import LogMixin, async_get_zha_config_value
 from .core.registries import ZHA_ENTITIES
 from .entity import ZhaEntity, ZhaGroupEntity
@@ -408,12 +411,11 @@ class BaseLight(LogMixin, light.LightEntity):
 
         # is not none looks odd here but it will override built in bulb transition times if we pass 0 in here
         if transition is not None and supports_level:
-            result = await self._level_channel.move_to_level_with_on_off(
-                level=0,
-                transition_time=(transition * 10 or self._DEFAULT_MIN_TRANSITION_TIME),
+            result = await self._async_turn_off_command(
+                transition * 10 or self._DEFAULT_MIN_TRANSITION_TIME
             )
         else:
-            result = await self._on_off_channel.off()
+            result = await self._async_turn_off_command(None)
 
         # Pause parsing attribute reports until transition is complete
         if self._zha_config_enable_light_transitioning_flag:
@@ -430,6 +432,14 @@ class BaseLight(LogMixin, light.LightEntity):
 
         self.async_write_ha_state()
 
+    async def _async_turn_off_command(self, transition_time: int | None) -> Any:
+        """Send the command turning the light off."""
+        if transition_time is not None:
+            return await self._level_channel.move_to_level_with_on_off(
+                level=0, transition_time=transition_time
+            )
+        return await self._on_off_channel.off()
+
     async def async_handle_color_commands(
         self,
         temperature,
@@ -667,6 +677,33 @@ class Light(BaseLight, ZhaEntity):
             True,
         )
 
+    async def _async_turn_off_command(self, transition_time: int | None) -> Any:
+        """Send the command turning the light off, to a group if possible.
+
+        Lights turned off by the same service call share a single command
+        for every zigbee group that only contains targeted lights.
+        """
+        if self._context is None:
+            return await super()._async_turn_off_command(transition_time)
+
+        async def _async_group_command(endpoint: zigpy.endpoint.Endpoint) -> Any:
+            if transition_time is not None:
+                return await endpoint[
+                    LevelControl.cluster_id
+                ].move_to_level_with_on_off(level=0, transition_time=transition_time)
+            return await endpoint[OnOff.cluster_id].off()
+
+        result = await self.zha_device.gateway.group_fan_out.async_send(
+            (self._context.id, SERVICE_TURN_OFF, transition_time),
+            GroupMember(
+                self.zha_device.ieee, self._on_off_channel.cluster.endpoint.endpoint_id
+            ),
+            _async_group_command,
+        )
+        if result is not None:
+            return result
+        return await super()._async_turn_off_command(transition_time)
+
     @callback
     def async_set_state(self, attr_id, attr_name, value):
         """Set the state."""
@@ -23,6 +23,7 @@ import logging
 import os
 import pathlib
 import re
+import sys
 import threading
 from time import monotonic
 from typing import (
@@ -38,6 +39,7 @@ from typing import (
 )
 from urllib.parse import urlparse
 
+import orjson
 from typing_extensions import ParamSpec
 import voluptuous as vol
 import yarl
@@ -80,6 +82,7 @@ from .util.async_ import (
     run_callback_threadsafe,
     shutdown_run_callback_threadsafe,
 )
+from .util.json import json_encoder_default
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
 from .util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
@@ -1073,6 +1076,13 @@ class EventBus:
             )
 
 
+def _json_bytes(data: Any) -> bytes:
+    """Encode data to JSON bytes like homeassistant.helpers.json.json_bytes."""
+    return orjson.dumps(
+        data, option=orjson.OPT_NON_STR_KEYS, default=json_encoder_default
+    )
+
+
 _StateT = TypeVar("_StateT", bound="State")
 
 
@@ -1099,6 +1109,8 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_attributes_json",
     ]
 
     def __init__(
@@ -1128,12 +1140,19 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # Unchanged attributes are shared with the previous state
+        self.attributes: ReadOnlyDict[str, Any] = (
+            attributes  # type: ignore[assignment]
+            if type(attributes) is ReadOnlyDict  # pylint: disable=unidiomatic-typecheck
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._as_dict_json: bytes | None = None
+        self._attributes_json: bytes | None = None
 
     def __hash__(self) -> int:
         """Make the state hashable.
@@ -1175,6 +1194,26 @@ class State:
             )
         return self._as_dict
 
+    def as_dict_json(self) -> bytes:
+        """Return the JSON encoded dict representation of the State.
+
+        Async friendly.
+
+        Encoded once and shared by everything sending the state as JSON.
+        """
+        if not self._as_dict_json:
+            self._as_dict_json = _json_bytes(self.as_dict())
+        return self._as_dict_json
+
+    def attributes_json(self) -> bytes:
+        """Return the JSON encoded attributes of the State.
+
+        Async friendly.
+        """
+        if not self._attributes_json:
+            self._attributes_json = _json_bytes(self.attributes)
+        return self._attributes_json
+
     @classmethod
     def from_dict(cls: type[_StateT], json_dict: dict[str, Any]) -> _StateT | None:
         """Initialize a state from a dict.
@@ -1199,10 +1238,15 @@ class State:
         if context := json_dict.get("context"):
             context = Context(id=context.get("id"), user_id=context.get("user_id"))
 
+        # Keys of decoded attributes are interned so all restored states
+        # share a single copy of them
+        if attributes := json_dict.get("attributes"):
+            attributes = {sys.intern(key): value for key, value in attributes.items()}
+
         return cls(
             json_dict["entity_id"],
             json_dict["state"],
-            json_dict.get("attributes"),
+            attributes,
             last_changed,
             last_updated,
             context,
@@ -1456,6 +1500,12 @@ class StateMachine:
         if same_state and same_attr:
             return
 
+        attributes_json: bytes | None = None
+        if same_attr:
+            assert old_state is not None
+            attributes = old_state.attributes
+            attributes_json = old_state._attributes_json
+
         now = dt_util.utcnow()
 
         if context is None:
@@ -1469,6 +1519,7 @@ class StateMachine:
             context,
             old_state is None,
         )
+        state._attributes_json = attributes_json
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
@@ -246,6 +246,33 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class DeviceRegistryBatch:
+    """Devices created by one batch of registrations.
+
+    The created devices are saved together when the batch is committed.
+    Updates of devices created by the batch are part of their creation.
+    """
+
+    def __init__(self, registry: DeviceRegistry) -> None:
+        """Initialize the batch."""
+        self._registry = registry
+        self.created: dict[str, None] = {}
+
+    @callback
+    def async_commit(self) -> None:
+        """Schedule one save for the created devices and announce each of them."""
+        if not self.created:
+            return
+        device_ids = list(self.created)
+        self.created = {}
+        self._registry.async_schedule_save()
+        for device_id in device_ids:
+            self._registry.hass.bus.async_fire(
+                EVENT_DEVICE_REGISTRY_UPDATED,
+                {"action": "create", "device_id": device_id},
+            )
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
@@ -285,6 +312,11 @@ class DeviceRegistry:
         """Check if device is deleted."""
         return self.deleted_devices.get_entry(identifiers, connections)
 
+    @callback
+    def async_batch(self) -> DeviceRegistryBatch:
+        """Start a batch of registrations that is saved at once."""
+        return DeviceRegistryBatch(self)
+
     @callback
     def async_get_or_create(
         self,
@@ -306,6 +338,8 @@ class DeviceRegistry:
         suggested_area: str | None | UndefinedType = UNDEFINED,
         sw_version: str | None | UndefinedType = UNDEFINED,
         via_device: tuple[str, str] | None = None,
+        # To save and announce a new device with the rest of a batch
+        batch: DeviceRegistryBatch | None = None,
     ) -> DeviceEntry:
         """Get device. Create if it doesn't exist."""
         if not identifiers and not connections:
@@ -358,6 +392,7 @@ class DeviceRegistry:
 
         device = self.async_update_device(
             device.id,
+            batch=batch,
             add_config_entry_id=config_entry_id,
             configuration_url=configuration_url,
             disabled_by=disabled_by,
@@ -400,6 +435,7 @@ class DeviceRegistry:
         suggested_area: str | None | UndefinedType = UNDEFINED,
         sw_version: str | None | UndefinedType = UNDEFINED,
         via_device_id: str | None | UndefinedType = UNDEFINED,
+        batch: DeviceRegistryBatch | None = None,
     ) -> DeviceEntry | None:
         """Update device attributes."""
         # Circular dep
@@ -506,6 +542,10 @@ class DeviceRegistry:
         if RUNTIME_ONLY_ATTRS.issuperset(new_values):
             return new
 
+        if batch is not None and (old.is_new or device_id in batch.created):
+            batch.created[device_id] = None
+            return new
+
         self.async_schedule_save()
 
         data: dict[str, Any] = {
@@ -40,9 +40,15 @@ from . import (
     entity_registry as ent_reg,
     service,
 )
-from .device_registry import DeviceRegistry
-from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
-from .event import async_call_later, async_track_time_interval
+from .device_registry import DeviceRegistry, DeviceRegistryBatch
+from .entity_registry import (
+    EntityRegistry,
+    EntityRegistryBatch,
+    RegistryEntryDisabler,
+    RegistryEntryHider,
+)
+from .event import async_call_later
+from .refresh_scheduler import async_track_refresh_interval
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -411,21 +417,18 @@ class EntityPlatform:
 
         device_registry = dev_reg.async_get(hass)
         entity_registry = ent_reg.async_get(hass)
-        tasks = [
-            self._async_add_entity(
-                entity, update_before_add, entity_registry, device_registry
-            )
-            for entity in new_entities
-        ]
+        entities = list(new_entities)
 
         # No entities for processing
-        if not tasks:
+        if not entities:
             return
 
-        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(tasks), SLOW_ADD_MIN_TIMEOUT)
+        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(entities), SLOW_ADD_MIN_TIMEOUT)
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
-                await asyncio.gather(*tasks)
+                await self._async_add_entities(
+                    entities, update_before_add, entity_registry, device_registry
+                )
         except asyncio.TimeoutError:
             self.logger.warning(
                 "Timed out adding entities for domain %s with platform %s after %ds",
@@ -448,10 +451,12 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
+        self._async_unsub_polling = async_track_refresh_interval(
             self.hass,
             self._update_entity_states,
             self.scan_interval,
+            domain=self.platform_name,
+            name=f"{self.domain}.{self.platform_name}",
         )
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
@@ -470,14 +475,60 @@ class EntityPlatform:
                 already_exists = True
         return (already_exists, restored)
 
-    async def _async_add_entity(  # noqa: C901
+    async def _async_add_entities(
         self,
-        entity: Entity,
+        entities: list[Entity],
         update_before_add: bool,
         entity_registry: EntityRegistry,
         device_registry: DeviceRegistry,
     ) -> None:
-        """Add an entity to the platform."""
+        """Add entities to the platform.
+
+        The entities are registered in a single pass. The registries save
+        the entries created by the pass at once and announce them before
+        the entities are added to Home Assistant.
+        """
+        errors: list[Exception] = []
+        started: list[Entity] = []
+        for entity in entities:
+            try:
+                self._async_start_adding_entity(entity)
+            except Exception as err:  # pylint: disable=broad-except
+                errors.append(err)
+            else:
+                started.append(entity)
+
+        if update_before_add:
+            updated = await asyncio.gather(
+                *(self._async_update_entity_before_add(entity) for entity in started)
+            )
+            started = [entity for entity, ok in zip(started, updated) if ok]
+
+        entity_registry_batch = entity_registry.async_batch()
+        device_registry_batch = device_registry.async_batch()
+        tasks: list[Coroutine[Any, Any, None]] = []
+        for entity in started:
+            try:
+                if self._async_register_entity(
+                    entity,
+                    entity_registry,
+                    device_registry,
+                    entity_registry_batch,
+                    device_registry_batch,
+                ):
+                    tasks.append(entity.add_to_platform_finish())
+            except Exception as err:  # pylint: disable=broad-except
+                errors.append(err)
+        device_registry_batch.async_commit()
+        entity_registry_batch.async_commit()
+
+        await asyncio.gather(*tasks)
+        if errors:
+            raise errors[0]
+
+    @callback
+    def _async_start_adding_entity(self, entity: Entity) -> None:
+        """Start adding an entity to the platform."""
         if entity is None:
             raise ValueError("Entity cannot be None")
 
@@ -487,15 +538,29 @@ class EntityPlatform:
             self._get_parallel_updates_semaphore(hasattr(entity, "update")),
         )
 
-        # Update properties before we generate the entity_id
-        if update_before_add:
-            try:
-                await entity.async_device_update(warning=False)
-            except Exception:  # pylint: disable=broad-except
-                self.logger.exception("%s: Error on device update!", self.platform_name)
-                entity.add_to_platform_abort()
-                return
+    async def _async_update_entity_before_add(self, entity: Entity) -> bool:
+        """Update properties before we generate the entity_id."""
+        try:
+            await entity.async_device_update(warning=False)
+        except Exception:  # pylint: disable=broad-except
+            self.logger.exception("%s: Error on device update!", self.platform_name)
+            entity.add_to_platform_abort()
+            return False
+        return True
+
+    @callback
+    def _async_register_entity(  # noqa: C901
+        self,
+        entity: Entity,
+        entity_registry: EntityRegistry,
+        device_registry: DeviceRegistry,
+        entity_registry_batch: EntityRegistryBatch,
+        device_registry_batch: DeviceRegistryBatch,
+    ) -> bool:
+        """Register an entity and reserve its entity_id.
 
+        Returns if the entity should be added to Home Assistant.
+        """
         suggested_object_id: str | None = None
         generate_new_entity_id = False
 
@@ -519,7 +584,7 @@ class EntityPlatform:
                         msg += f"ID {entity.unique_id} already exists - ignoring {registered_entity_id}"
                     self.logger.error(msg)
                     entity.add_to_platform_abort()
-                    return
+                    return False
 
             if self.config_entry is not None:
                 config_entry_id: str | None = self.config_entry.entry_id
@@ -570,7 +635,10 @@ class EntityPlatform:
                             )
 
                 try:
-                    device = device_registry.async_get_or_create(**processed_dev_info)  # type: ignore[arg-type]
+                    device = device_registry.async_get_or_create(
+                        **processed_dev_info,  # type: ignore[arg-type]
+                        batch=device_registry_batch,
+                    )
                     device_id = device.id
                 except RequiredParameterMissing:
                     pass
@@ -616,11 +684,14 @@ class EntityPlatform:
                 suggested_object_id=suggested_object_id,
                 supported_features=entity.supported_features,
                 unit_of_measurement=entity.unit_of_measurement,
+                batch=entity_registry_batch,
             )
 
             if device and device.disabled and not entry.disabled:
                 entry = entity_registry.async_update_entity(
-                    entry.entity_id, disabled_by=RegistryEntryDisabler.DEVICE
+                    entry.entity_id,
+                    disabled_by=RegistryEntryDisabler.DEVICE,
+                    batch=entity_registry_batch,
                 )
 
             entity.registry_entry = entry
@@ -659,7 +730,7 @@ class EntityPlatform:
                 f"Entity id already exists - ignoring: {entity.entity_id}"
             )
             entity.add_to_platform_abort()
-            return
+            return False
 
         if entity.registry_entry and entity.registry_entry.disabled:
             self.logger.debug(
@@ -669,7 +740,7 @@ class EntityPlatform:
                 or f'"{self.platform_name} {entity.unique_id}"',
             )
             entity.add_to_platform_abort()
-            return
+            return False
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
@@ -687,8 +758,7 @@ class EntityPlatform:
             self.entities.pop(entity_id)
 
         entity.async_on_remove(remove_entity_cb)
-
-        await entity.add_to_platform_finish()
+        return True
 
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
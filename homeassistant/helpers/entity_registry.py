@@ -276,6 +276,33 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         return self._entry_ids.get(key)
 
 
+class EntityRegistryBatch:
+    """Entities created by one batch of registrations.
+
+    The created entities are saved together when the batch is committed.
+    Updates of entities created by the batch are part of their creation.
+    """
+
+    def __init__(self, registry: EntityRegistry) -> None:
+        """Initialize the batch."""
+        self._registry = registry
+        self.created: dict[str, None] = {}
+
+    @callback
+    def async_commit(self) -> None:
+        """Schedule one save for the created entities and announce each of them."""
+        if not self.created:
+            return
+        entity_ids = list(self.created)
+        self.created = {}
+        self._registry.async_schedule_save()
+        for entity_id in entity_ids:
+            self._registry.hass.bus.async_fire(
+                EVENT_ENTITY_REGISTRY_UPDATED,
+                {"action": "create", "entity_id": entity_id},
+            )
+
+
 class EntityRegistry:
     """Class to hold a registry of entities."""
 
@@ -369,6 +396,11 @@ class EntityRegistry:
 
         return test_string
 
+    @callback
+    def async_batch(self) -> EntityRegistryBatch:
+        """Start a batch of registrations that is saved at once."""
+        return EntityRegistryBatch(self)
+
     @callback
     def async_get_or_create(
         self,
@@ -393,6 +425,8 @@ class EntityRegistry:
         original_name: str | None | UndefinedType = UNDEFINED,
         supported_features: int | None | UndefinedType = UNDEFINED,
         unit_of_measurement: str | None | UndefinedType = UNDEFINED,
+        # To save and announce a new entity with the rest of a batch
+        batch: EntityRegistryBatch | None = None,
     ) -> RegistryEntry:
         """Get entity. Create if it doesn't exist."""
         config_entry_id: str | None | UndefinedType = UNDEFINED
@@ -406,8 +440,9 @@ class EntityRegistry:
         entity_id = self.async_get_entity_id(domain, platform, unique_id)
 
         if entity_id:
-            return self.async_update_entity(
+            return self._async_update_entity(
                 entity_id,
+                batch=batch,
                 capabilities=capabilities,
                 config_entry_id=config_entry_id,
                 device_id=device_id,
@@ -469,6 +504,10 @@ class EntityRegistry:
         )
         self.entities[entity_id] = entry
         _LOGGER.info("Registered new %s.%s entity: %s", domain, platform, entity_id)
+        if batch is not None:
+            batch.created[entity_id] = None
+            return entry
+
         self.async_schedule_save()
 
         self.hass.bus.async_fire(
@@ -556,6 +595,7 @@ class EntityRegistry:
         self,
         entity_id: str,
         *,
+        batch: EntityRegistryBatch | None = None,
         area_id: str | None | UndefinedType = UNDEFINED,
         capabilities: Mapping[str, Any] | None | UndefinedType = UNDEFINED,
         config_entry_id: str | None | UndefinedType = UNDEFINED,
@@ -660,6 +700,9 @@ class EntityRegistry:
 
         new = self.entities[entity_id] = attr.evolve(old, **new_values)
 
+        if batch is not None and entity_id in batch.created:
+            return new
+
         self.async_schedule_save()
 
         data: dict[str, str | dict[str, Any]] = {
@@ -698,10 +741,12 @@ class EntityRegistry:
         original_name: str | None | UndefinedType = UNDEFINED,
         supported_features: int | UndefinedType = UNDEFINED,
         unit_of_measurement: str | None | UndefinedType = UNDEFINED,
+        batch: EntityRegistryBatch | None = None,
     ) -> RegistryEntry:
         """Update properties of an entity."""
         return self._async_update_entity(
             entity_id,
+            batch=batch,
             area_id=area_id,
             capabilities=capabilities,
             config_entry_id=config_entry_id,
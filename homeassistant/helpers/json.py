@@ -1,11 +1,12 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
 import datetime
 import json
-from pathlib import Path
 from typing import Any, Final
 
 import orjson
 
+from homeassistant.util.json import json_encoder_default
+
 JSON_ENCODE_EXCEPTIONS = (TypeError, ValueError)
 JSON_DECODE_EXCEPTIONS = (orjson.JSONDecodeError,)
 
@@ -28,22 +29,6 @@ class JSONEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, o)
 
 
-def json_encoder_default(obj: Any) -> Any:
-    """Convert Home Assistant objects.
-
-    Hand other objects to the original method.
-    """
-    if isinstance(obj, (set, tuple)):
-        return list(obj)
-    if isinstance(obj, float):
-        return float(obj)
-    if hasattr(obj, "as_dict"):
-        return obj.as_dict()
-    if isinstance(obj, Path):
-        return obj.as_posix()
-    raise TypeError
-
-
 class ExtendedJSONEncoder(JSONEncoder):
     """JSONEncoder that supports Home Assistant objects and falls back to repr(o)."""
 
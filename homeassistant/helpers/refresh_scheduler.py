@@ -0,0 +1,219 @@
+"""Helper to spread and limit scheduled refreshes of polling integrations."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+import random
+from time import monotonic
+from typing import Any
+import weakref
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.util.dt import utcnow
+
+from .event import async_track_point_in_utc_time
+from .singleton import singleton
+
+DATA_REFRESH_SCHEDULER = "refresh_scheduler"
+
+# Maximum number of scheduled refreshes of a single integration
+# that are allowed to run at the same time.
+DEFAULT_MAX_CONCURRENT_REFRESHES = 10
+
+# Refreshes that are started together are spread over their interval,
+# but not over more than this.
+MAX_REFRESH_JITTER = timedelta(minutes=5)
+
+_ONE_SECOND = timedelta(seconds=1)
+
+
+class ScheduledRefresh:
+    """A periodic refresh managed by the refresh scheduler.
+
+    The first refresh is brought forward by a random part of the interval,
+    up to MAX_REFRESH_JITTER, so refreshes that are started together are
+    spread across their interval. Later refreshes follow one interval after
+    the previous one on a random sub-second offset. The offset is stable for
+    the lifetime of the object, which keeps the refresh period constant.
+    """
+
+    def __init__(self, scheduler: RefreshScheduler, domain: str, name: str) -> None:
+        """Initialize the scheduled refresh."""
+        self._scheduler = scheduler
+        self.domain = domain
+        self.name = name
+        self.offset = random.randint(0, 999_999)
+        self.jitter = random.random()
+        self._scheduled = False
+        self.refreshes = 0
+        self.overruns = 0
+        self.last_duration: float | None = None
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+
+    @callback
+    def async_next_refresh(self, interval: timedelta, now: datetime) -> datetime:
+        """Return the next point in time this refresh should run.
+
+        The returned time is never later than one interval from now.
+        """
+        if interval < _ONE_SECOND:
+            return now + interval
+        base = now.replace(microsecond=self.offset)
+        if base > now:
+            base -= _ONE_SECOND
+        if self._scheduled:
+            return base + interval
+        self._scheduled = True
+        return max(
+            now, base + interval - min(interval, MAX_REFRESH_JITTER) * self.jitter
+        )
+
+    @callback
+    def async_schedule(
+        self,
+        job: HassJob[[datetime], Coroutine[Any, Any, None] | None],
+        interval: timedelta,
+        now: datetime | None = None,
+    ) -> CALLBACK_TYPE:
+        """Schedule job to run once at the next refresh point."""
+        return async_track_point_in_utc_time(
+            self._scheduler.hass,
+            job,
+            self.async_next_refresh(interval, now or utcnow()),
+        )
+
+    @asynccontextmanager
+    async def async_limit(
+        self, interval: timedelta | None
+    ) -> AsyncGenerator[None, None]:
+        """Run a refresh within the concurrency limit of its integration."""
+        queued = monotonic()
+        async with self._scheduler.async_get_semaphore(self.domain):
+            started = monotonic()
+            try:
+                yield
+            finally:
+                self._async_record(started - queued, monotonic() - started, interval)
+
+    @callback
+    def _async_record(
+        self, wait: float, duration: float, interval: timedelta | None
+    ) -> None:
+        """Record the metrics of a finished refresh."""
+        self.refreshes += 1
+        self.last_wait = wait
+        self.max_wait = max(self.max_wait, wait)
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+        if interval is not None and duration > interval.total_seconds():
+            self.overruns += 1
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "domain": self.domain,
+            "name": self.name,
+            "refreshes": self.refreshes,
+            "overruns": self.overruns,
+            "last_duration": self.last_duration,
+            "max_duration": self.max_duration,
+            "average_duration": (
+                self.total_duration / self.refreshes if self.refreshes else None
+            ),
+            "last_wait": self.last_wait,
+            "max_wait": self.max_wait,
+        }
+
+
+class RefreshScheduler:
+    """Keep track of scheduled refreshes and limit their concurrency."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the refresh scheduler."""
+        self.hass = hass
+        self._limits: dict[str, int] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._refreshes: weakref.WeakSet[ScheduledRefresh] = weakref.WeakSet()
+
+    @callback
+    def async_register(self, domain: str, name: str) -> ScheduledRefresh:
+        """Register a new scheduled refresh for an integration."""
+        refresh = ScheduledRefresh(self, domain, name)
+        self._refreshes.add(refresh)
+        return refresh
+
+    @callback
+    def async_set_max_concurrent_refreshes(self, domain: str, limit: int) -> None:
+        """Set the maximum number of concurrent refreshes for an integration."""
+        self._limits[domain] = limit
+        self._semaphores.pop(domain, None)
+
+    @callback
+    def async_get_semaphore(self, domain: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting the refreshes of an integration."""
+        if (semaphore := self._semaphores.get(domain)) is None:
+            semaphore = self._semaphores[domain] = asyncio.Semaphore(
+                self._limits.get(domain, DEFAULT_MAX_CONCURRENT_REFRESHES)
+            )
+        return semaphore
+
+    @callback
+    def async_diagnostics(self) -> list[dict[str, Any]]:
+        """Return the metrics of all scheduled refreshes."""
+        return [
+            refresh.as_dict()
+            for refresh in sorted(
+                self._refreshes, key=lambda refresh: (refresh.domain, refresh.name)
+            )
+        ]
+
+
+@callback
+@singleton(DATA_REFRESH_SCHEDULER)
+def async_get(hass: HomeAssistant) -> RefreshScheduler:
+    """Get the refresh scheduler."""
+    return RefreshScheduler(hass)
+
+
+@callback
+def async_track_refresh_interval(
+    hass: HomeAssistant,
+    action: Callable[[datetime], Coroutine[Any, Any, None]],
+    interval: timedelta,
+    *,
+    domain: str,
+    name: str,
+) -> CALLBACK_TYPE:
+    """Add a listener that refreshes at every interval through the scheduler."""
+    remove: CALLBACK_TYPE
+    interval_listener_job: HassJob[[datetime], None]
+    refresh = async_get(hass).async_register(domain, name)
+
+    async def _async_run(now: datetime) -> None:
+        """Run the action within the concurrency limit."""
+        async with refresh.async_limit(interval):
+            await action(now)
+
+    @callback
+    def interval_listener(now: datetime) -> None:
+        """Handle elapsed intervals."""
+        nonlocal remove
+        remove = refresh.async_schedule(interval_listener_job, interval)
+        hass.async_create_task(_async_run(now))
+
+    interval_listener_job = HassJob(interval_listener)
+    remove = refresh.async_schedule(interval_listener_job, interval)
+
+    @callback
+    def remove_listener() -> None:
+        """Remove interval listener."""
+        remove()
+
+    return remove_listener
@@ -6,8 +6,10 @@ from collections.abc import Awaitable, Callable, Iterable
 import dataclasses
 from functools import partial, wraps
 import logging
+from time import monotonic
 from typing import TYPE_CHECKING, Any, TypedDict
 
+from lru import LRU  # pylint: disable=no-name-in-module
 from typing_extensions import TypeGuard
 import voluptuous as vol
 
@@ -24,7 +26,7 @@ from homeassistant.const import (
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     TemplateError,
@@ -42,6 +44,7 @@ from . import (
     entity_registry,
     template,
 )
+from .singleton import singleton
 from .typing import ConfigType, TemplateVarsType
 
 if TYPE_CHECKING:
@@ -55,6 +58,12 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+TARGET_RESOLUTION_CACHE = "service_target_resolution_cache"
+
+# Maximum number of resolved device and area targets to keep cached
+MAX_CACHED_TARGETS = 256
+
+ResolvedTarget = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
 
 
 class ServiceParams(TypedDict):
@@ -347,47 +356,151 @@ def async_extract_referenced_entity_ids(
     if not selector.device_ids and not selector.area_ids:
         return selected
 
-    ent_reg = entity_registry.async_get(hass)
-    dev_reg = device_registry.async_get(hass)
-    area_reg = area_registry.async_get(hass)
+    (
+        missing_devices,
+        missing_areas,
+        referenced_devices,
+        indirectly_referenced,
+    ) = async_get_target_resolution_cache(hass).async_resolve(
+        selector.device_ids, selector.area_ids
+    )
+    selected.missing_devices.update(missing_devices)
+    selected.missing_areas.update(missing_areas)
+    selected.referenced_devices.update(referenced_devices)
+    selected.indirectly_referenced.update(indirectly_referenced)
+    return selected
 
-    for device_id in selector.device_ids:
-        if device_id not in dev_reg.devices:
-            selected.missing_devices.add(device_id)
 
-    for area_id in selector.area_ids:
-        if area_id not in area_reg.areas:
-            selected.missing_areas.add(area_id)
+class TargetResolutionCache:
+    """Cache of device and area targets resolved to devices and entities.
 
-    # Find devices for targeted areas
-    selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+    Resolving a device or area target scans the device and entity registries.
+    The results are cached per combination of targeted devices and areas and
+    the cache is cleared whenever one of the registries is updated.
+    """
 
-    if not selector.area_ids and not selected.referenced_devices:
-        return selected
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self.resolve_time = 0.0
+        self.calls = 0
+        self.call_time = 0.0
+        self._registries: tuple[Any, ...] | None = None
+        self._resolved: LRU = LRU(MAX_CACHED_TARGETS)
+        for event_type in (
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        ):
+            hass.bus.async_listen(event_type, self._async_clear, run_immediately=True)
+
+    @callback
+    def _async_clear(self, _event: Event | None = None) -> None:
+        """Drop all resolved targets."""
+        self._resolved.clear()
+
+    @callback
+    def async_resolve(self, device_ids: set[str], area_ids: set[str]) -> ResolvedTarget:
+        """Return missing devices and areas, referenced devices and entities."""
+        ent_reg = entity_registry.async_get(self.hass)
+        dev_reg = device_registry.async_get(self.hass)
+        area_reg = area_registry.async_get(self.hass)
+        registries = (ent_reg, dev_reg, area_reg)
+        if self._registries is None or any(
+            registry is not cached
+            for registry, cached in zip(registries, self._registries)
+        ):
+            self._registries = registries
+            self._async_clear()
+
+        key = (frozenset(device_ids), frozenset(area_ids))
+        if (resolved := self._resolved.get(key)) is not None:
+            self.hits += 1
+            return resolved
+
+        self.misses += 1
+        started = monotonic()
+        resolved = self._resolved[key] = _resolve_device_and_area_ids(
+            ent_reg, dev_reg, area_reg, device_ids, area_ids
+        )
+        self.resolve_time += monotonic() - started
+        return resolved
+
+    @callback
+    def async_record_call(self, duration: float) -> None:
+        """Record the time an entity service call spent resolving its targets."""
+        self.calls += 1
+        self.call_time += duration
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache metrics as a dictionary."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "resolve_time": self.resolve_time,
+            "average_resolve_time": (
+                self.resolve_time / self.misses if self.misses else None
+            ),
+            "entity_service_calls": self.calls,
+            "average_target_time": self.call_time / self.calls if self.calls else None,
+        }
 
-    for ent_entry in ent_reg.entities.values():
-        # Do not add entities which are hidden or which are config or diagnostic entities
-        if ent_entry.entity_category is not None or ent_entry.hidden_by is not None:
-            continue
 
-        if (
-            # The entity's area matches a targeted area
-            ent_entry.area_id in selector.area_ids
-            # The entity's device matches a device referenced by an area and the entity
-            # has no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # The entity's device matches a targeted device
-            or ent_entry.device_id in selector.device_ids
-        ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+@callback
+@singleton(TARGET_RESOLUTION_CACHE)
+def async_get_target_resolution_cache(hass: HomeAssistant) -> TargetResolutionCache:
+    """Return the cache of resolved device and area targets."""
+    return TargetResolutionCache(hass)
+
+
+def _resolve_device_and_area_ids(
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+    device_ids: set[str],
+    area_ids: set[str],
+) -> ResolvedTarget:
+    """Resolve device and area targets by scanning the registries."""
+    missing_devices = {
+        device_id for device_id in device_ids if device_id not in dev_reg.devices
+    }
+    missing_areas = {area_id for area_id in area_ids if area_id not in area_reg.areas}
 
-    return selected
+    # Find devices for targeted areas
+    referenced_devices = set(device_ids)
+    for device_entry in dev_reg.devices.values():
+        if device_entry.area_id in area_ids:
+            referenced_devices.add(device_entry.id)
+
+    indirectly_referenced: set[str] = set()
+    if area_ids or referenced_devices:
+        for ent_entry in ent_reg.entities.values():
+            # Do not add entities which are hidden or which are config or diagnostic entities
+            if ent_entry.entity_category is not None or ent_entry.hidden_by is not None:
+                continue
+
+            if (
+                # The entity's area matches a targeted area
+                ent_entry.area_id in area_ids
+                # The entity's device matches a device referenced by an area and the entity
+                # has no explicitly set area
+                or (not ent_entry.area_id and ent_entry.device_id in referenced_devices)
+                # The entity's device matches a targeted device
+                or ent_entry.device_id in device_ids
+            ):
+                indirectly_referenced.add(ent_entry.entity_id)
+
+    return (
+        frozenset(missing_devices),
+        frozenset(missing_areas),
+        frozenset(referenced_devices),
+        frozenset(indirectly_referenced),
+    )
 
 
 @bind_hass
@@ -557,7 +670,9 @@ async def entity_service_call(  # noqa: C901
         all_referenced: set[str] | None = None
     else:
         # A set of entities we're trying to target.
+        started = monotonic()
         referenced = async_extract_referenced_entity_ids(hass, call, True)
+        async_get_target_resolution_cache(hass).async_record_call(monotonic() - started)
         all_referenced = referenced.referenced | referenced.indirectly_referenced
 
     # If the service function is a string, we'll pass it the service call data
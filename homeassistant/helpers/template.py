@@ -35,10 +35,12 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     LENGTH_METERS,
     STATE_UNKNOWN,
 )
 from homeassistant.core import (
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -59,6 +61,7 @@ from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .json import JSON_DECODE_EXCEPTIONS, json_loads
+from .singleton import singleton
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -71,6 +74,8 @@ _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
+_SORTED_STATES = "template.sorted_states"
+_EXPANDED_GROUPS = "template.expanded_groups"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -100,6 +105,9 @@ DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
 template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "template_cv", default=None
 )
+# Set in the thread async_render_will_timeout renders in, the states
+# shared by templates are only used and updated in the event loop
+_render_thread_cv: ContextVar[bool] = ContextVar("_render_thread_cv", default=False)
 
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
@@ -492,6 +500,7 @@ class Template:
         finish_event = asyncio.Event()
 
         def _render_template() -> None:
+            _render_thread_cv.set(True)
             try:
                 _render_with_context(self.template, compiled, **kwargs)
             except TimeoutError:
@@ -897,15 +906,92 @@ def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
         entity_collect.entities.add(entity_id)
 
 
-@lru_cache(maxsize=CACHED_TEMPLATE_STATES)
-def _template_state_no_collect(hass: HomeAssistant, state: State) -> TemplateState:
-    return TemplateState(hass, state, collect=False)
+class SortedStates:
+    """Sorted template states of the domains iterated by templates.
+
+    Templates iterating the same domain share the sorted states and their
+    template state wrappers. A state changed listener keeps them current:
+    an updated state replaces the old one in place, and adding or removing
+    an entity drops the sorted states of its domain.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the sorted states."""
+        self.hass = hass
+        self.sorts = 0
+        self.wrappers_created = 0
+        self._domains: dict[
+            str | None,
+            tuple[dict[str, int], list[State], list[TemplateState | None]],
+        ] = {}
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Replace an updated state or drop the states of its domain."""
+        if not self._domains:
+            return
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data["new_state"]
+        for domain in (entity_id.partition(".")[0], None):
+            if (sorted_states := self._domains.get(domain)) is None:
+                continue
+            indices, states, wrappers = sorted_states
+            if (
+                new_state is None
+                or (idx := indices.get(entity_id)) is None
+                or self.hass.states.get(entity_id) is not new_state
+            ):
+                del self._domains[domain]
+                continue
+            states[idx] = new_state
+            wrappers[idx] = None
+
+    def async_iter(self, domain: str | None) -> Generator[TemplateState, None, None]:
+        """Iterate the template states of a domain or all states."""
+        if _render_thread_cv.get():
+            for state in sorted(
+                self.hass.states.async_all(domain), key=attrgetter("entity_id")
+            ):
+                yield TemplateState(self.hass, state, collect=False)
+            return
+        if (sorted_states := self._domains.get(domain)) is None:
+            states = sorted(
+                self.hass.states.async_all(domain), key=attrgetter("entity_id")
+            )
+            self.sorts += 1
+            sorted_states = self._domains[domain] = (
+                {state.entity_id: idx for idx, state in enumerate(states)},
+                states,
+                [None] * len(states),
+            )
+        _, states, wrappers = sorted_states
+        for idx, wrapper in enumerate(wrappers):
+            if wrapper is None:
+                wrapper = wrappers[idx] = TemplateState(
+                    self.hass, states[idx], collect=False
+                )
+                self.wrappers_created += 1
+            yield wrapper
+
+    @callback
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters of the sorted states."""
+        return {"sorts": self.sorts, "wrappers_created": self.wrappers_created}
+
+
+@callback
+@singleton(_SORTED_STATES)
+def _async_get_sorted_states(hass: HomeAssistant) -> SortedStates:
+    """Return the sorted states shared by all templates."""
+    return SortedStates(hass)
 
 
 def _state_generator(hass: HomeAssistant, domain: str | None) -> Generator:
     """State generator for a domain or all states."""
-    for state in sorted(hass.states.async_all(domain), key=attrgetter("entity_id")):
-        yield _template_state_no_collect(hass, state)
+    return _async_get_sorted_states(hass).async_iter(domain)
 
 
 def _get_state_if_valid(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
@@ -984,17 +1070,169 @@ def result_as_boolean(template_result: Any | None) -> bool:
     return forgiving_boolean(template_result, default=False)
 
 
-def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
-    """Expand out any groups and zones into entity states."""
+def _expandable_members(
+    hass: HomeAssistant, entity_id: str, state: State
+) -> list[str] | None:
+    """Return the members of a group or zone, None for other entities."""
     # circular import.
     from . import entity as entity_helper  # pylint: disable=import-outside-toplevel
 
+    if entity_id.startswith(_GROUP_DOMAIN_PREFIX) or (
+        (source := entity_helper.entity_sources(hass).get(entity_id))
+        and source["domain"] == "group"
+    ):
+        return state.attributes.get(ATTR_ENTITY_ID) or []
+    if entity_id.startswith(_ZONE_DOMAIN_PREFIX):
+        return state.attributes.get(ATTR_PERSONS) or []
+    return None
+
+
+class ExpandedGroups:
+    """Transitive members of the groups and zones expanded by templates.
+
+    The expansion of a group is kept with the groups, zones and missing
+    entities it passed through. It is dropped when one of those is added,
+    removed or changes its members, or when one of its members is added or
+    removed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the expanded groups."""
+        self.hass = hass
+        self.expansions = 0
+        self._expanded: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+        self._dependents: dict[str, set[str]] = {}
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Drop the expansions depending on a changed entity."""
+        if (dependents := self._dependents.get(event.data["entity_id"])) is None:
+            return
+        old_state: State | None = event.data["old_state"]
+        new_state: State | None = event.data["new_state"]
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.attributes.get(ATTR_ENTITY_ID)
+            == new_state.attributes.get(ATTR_ENTITY_ID)
+            and old_state.attributes.get(ATTR_PERSONS)
+            == new_state.attributes.get(ATTR_PERSONS)
+        ):
+            return
+        for entity_id in list(dependents):
+            self._async_drop(entity_id)
+
+    @callback
+    def _async_drop(self, entity_id: str) -> None:
+        """Drop the expansion of a group or zone."""
+        nodes, members = self._expanded.pop(entity_id)
+        for dependency in (*nodes, *members):
+            dependents = self._dependents[dependency]
+            dependents.discard(entity_id)
+            if not dependents:
+                del self._dependents[dependency]
+
+    @callback
+    def async_get(
+        self, entity_id: str
+    ) -> tuple[tuple[str, ...], tuple[str, ...]] | None:
+        """Return the expansion of a group or zone, None for other entities.
+
+        The expansion is a tuple of the groups, zones and missing entities
+        passed through and a tuple of the member entities. A render in the
+        thread of async_render_will_timeout expands the group for itself.
+        """
+        if _render_thread_cv.get():
+            return self._expand(entity_id)
+        if (expanded := self._expanded.get(entity_id)) is not None:
+            return expanded
+        if (expanded := self._expand(entity_id)) is None:
+            return None
+        self.expansions += 1
+        self._expanded[entity_id] = expanded
+        nodes, members = expanded
+        for dependency in (*nodes, *members):
+            self._dependents.setdefault(dependency, set()).add(entity_id)
+        return expanded
+
+    def _expand(self, entity_id: str) -> tuple[tuple[str, ...], tuple[str, ...]] | None:
+        """Expand a group or zone, None for other entities."""
+        if (state := self.hass.states.get(entity_id)) is not None and (
+            _expandable_members(self.hass, entity_id, state) is None
+        ):
+            return None
+        if state is None and not (
+            entity_id.startswith(_GROUP_DOMAIN_PREFIX)
+            or entity_id.startswith(_ZONE_DOMAIN_PREFIX)
+        ):
+            return None
+
+        nodes: dict[str, None] = {}
+        members: dict[str, None] = {}
+        search = [entity_id]
+        while search:
+            member_id = search.pop()
+            if member_id in nodes or member_id in members:
+                continue
+            if (state := self.hass.states.get(member_id)) is None:
+                nodes[member_id] = None
+            elif (
+                group_members := _expandable_members(self.hass, member_id, state)
+            ) is None:
+                members[member_id] = None
+            else:
+                nodes[member_id] = None
+                search += (
+                    member for member in group_members if isinstance(member, str)
+                )
+
+        return (tuple(nodes), tuple(members))
+
+    @callback
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters of the expanded groups."""
+        return {"expansions": self.expansions, "expanded": len(self._expanded)}
+
+
+@callback
+@singleton(_EXPANDED_GROUPS)
+def _async_get_expanded_groups(hass: HomeAssistant) -> ExpandedGroups:
+    """Return the group expansions shared by all templates."""
+    return ExpandedGroups(hass)
+
+
+@callback
+def async_get_cache_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the counters of the caches shared by templates."""
+    return {
+        "sorted_states": _async_get_sorted_states(hass).as_dict(),
+        "expanded_groups": _async_get_expanded_groups(hass).as_dict(),
+    }
+
+
+def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
+    """Expand out any groups and zones into entity states."""
+    expanded_groups = _async_get_expanded_groups(hass)
     search = list(args)
     found = {}
     while search:
         entity = search.pop()
         if isinstance(entity, str):
             entity_id = entity
+            if (expanded := expanded_groups.async_get(entity_id)) is not None:
+                nodes, members = expanded
+                for node in nodes:
+                    _collect_state(hass, node)
+                for member_id in members:
+                    if member_id not in found and (
+                        state := _get_state(hass, member_id)
+                    ):
+                        _collect_state(hass, member_id)
+                        found[member_id] = state
+                continue
             if (entity := _get_state(hass, entity)) is None:
                 continue
         elif isinstance(entity, State):
@@ -1006,19 +1244,12 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
             # ignore other types
             continue
 
-        if entity_id.startswith(_GROUP_DOMAIN_PREFIX) or (
-            (source := entity_helper.entity_sources(hass).get(entity_id))
-            and source["domain"] == "group"
-        ):
-            # Collect state will be called in here since it's wrapped
-            if group_entities := entity.attributes.get(ATTR_ENTITY_ID):
-                search += group_entities
-        elif entity_id.startswith(_ZONE_DOMAIN_PREFIX):
-            if zone_entities := entity.attributes.get(ATTR_PERSONS):
-                search += zone_entities
-        else:
+        # Collect state will be called in here since it's wrapped
+        if (group_entities := _expandable_members(hass, entity_id, entity)) is None:
             _collect_state(hass, entity_id)
             found[entity_id] = entity
+        else:
+            search += group_entities
 
     return sorted(found.values(), key=lambda a: a.entity_id)
 
@@ -17,7 +17,7 @@ from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.util.dt import utcnow
 
-from . import entity, event
+from . import entity, entity_platform, refresh_scheduler
 from .debounce import Debouncer
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
@@ -53,6 +53,12 @@ class DataUpdateCoordinator(Generic[_T]):
         self.update_method = update_method
         self.update_interval = update_interval
         self.config_entry = config_entries.current_entry.get()
+        # The integration whose refreshes are limited together
+        self._refresh_domain = name
+        if self.config_entry:
+            self._refresh_domain = self.config_entry.domain
+        elif platform := entity_platform.current_platform.get():
+            self._refresh_domain = platform.platform_name
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -64,6 +70,7 @@ class DataUpdateCoordinator(Generic[_T]):
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         self._job = HassJob(self._handle_refresh_interval)
         self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._scheduled_refresh: refresh_scheduler.ScheduledRefresh | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
         self.last_update_success = True
         self.last_exception: Exception | None = None
@@ -135,20 +142,25 @@ class DataUpdateCoordinator(Generic[_T]):
             self._unsub_refresh()
             self._unsub_refresh = None
 
-        # We _floor_ utcnow to create a schedule on a rounded second,
-        # minimizing the time between the point and the real activation.
-        # That way we obtain a constant update frequency,
-        # as long as the update process takes less than a second
-        self._unsub_refresh = event.async_track_point_in_utc_time(
-            self.hass,
-            self._job,
-            utcnow().replace(microsecond=0) + self.update_interval,
+        # The refresh scheduler schedules on a rounded second plus a random
+        # offset that is fixed for this coordinator. That way we obtain a
+        # constant update frequency, as long as the update process takes less
+        # than a second. The first refresh is brought forward by a random part
+        # of the interval so coordinators started together are spread.
+        if self._scheduled_refresh is None:
+            self._scheduled_refresh = refresh_scheduler.async_get(
+                self.hass
+            ).async_register(self._refresh_domain, self.name)
+        self._unsub_refresh = self._scheduled_refresh.async_schedule(
+            self._job, self.update_interval, utcnow()
         )
 
     async def _handle_refresh_interval(self, _now: datetime) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        assert self._scheduled_refresh is not None
+        async with self._scheduled_refresh.async_limit(self.update_interval):
+            await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -8,7 +8,9 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
+import tracemalloc
 from typing import TypeVar
 
 from homeassistant import core
@@ -311,6 +313,244 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def state_memory(hass):
+    """Measure the memory of 10k entities updated ten times."""
+    events = []
+
+    @core.callback
+    def listener(event):
+        """Keep the old and new states alive like listeners do."""
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    tracemalloc.start()
+    start = timer()
+    for update in range(10):
+        for idx in range(10**4):
+            hass.states.async_set(
+                f"sensor.benchmark_{idx}",
+                str(update),
+                {
+                    "friendly_name": f"Benchmark {idx}",
+                    "unit_of_measurement": "W",
+                    "device_class": "power",
+                    "state_class": "measurement",
+                    "icon": "mdi:flash",
+                },
+            )
+        await hass.async_block_till_done()
+        # Listeners only keep the latest events alive
+        del events[: -(10**4)]
+    runtime = timer() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Memory of 10k entities and their last state changes: {current} bytes")
+    return runtime
+
+
+@benchmark
+async def recorder_state_writes(hass):
+    """Record 100k state changes of 1k entities to a SQLite database."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries, loader
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.tasks import CommitTask
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+
+    events_to_write = 10**5
+
+    with TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        hass.data[loader.DATA_CUSTOM_COMPONENTS] = {}
+        recorder_helper.async_initialize_recorder(hass)
+        await async_setup_component(
+            hass,
+            "recorder",
+            {"recorder": {"db_url": f"sqlite:///{tmpdir}/benchmark.db"}},
+        )
+        await hass.async_start()
+        await recorder_helper.async_wait_recorder(hass)
+        instance = get_instance(hass)
+
+        start = timer()
+        for idx in range(events_to_write):
+            hass.states.async_set(
+                f"sensor.benchmark_{idx % 10**3}",
+                str(idx),
+                {"unit_of_measurement": "W", "device_class": "power"},
+            )
+        await instance.async_block_till_done()
+        instance.queue_task(CommitTask())
+        await instance.async_block_till_done()
+        runtime = timer() - start
+        print(f"Recorded {events_to_write / runtime:.0f} state changes per second")
+        await hass.async_stop()
+    return runtime
+
+
+@benchmark
+async def entity_state_writes(hass):
+    """Write 100k states of 1k entities that have a device and customize."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.config import DATA_CUSTOMIZE
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_values import EntityValues
+
+    entity_count = 10**3
+    writes = 10**5
+
+    with TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        device_registry = dr.async_get(hass)
+        entity_registry = er.async_get(hass)
+        hass.data[DATA_CUSTOMIZE] = EntityValues(
+            {f"sensor.benchmark_{idx}": {"custom": "yes"} for idx in range(0, 10, 2)}
+        )
+
+        entities = []
+        for idx in range(entity_count):
+            device = device_registry.async_get_or_create(
+                config_entry_id="benchmark",
+                identifiers={("benchmark", str(idx))},
+                name=f"Device {idx}",
+            )
+            entity = Entity()
+            entity.hass = hass
+            entity.entity_id = f"sensor.benchmark_{idx}"
+            entity.registry_entry = entity_registry.async_get_or_create(
+                "sensor",
+                "benchmark",
+                str(idx),
+                device_id=device.id,
+                suggested_object_id=f"benchmark_{idx}",
+            )
+            entity._attr_has_entity_name = True  # pylint: disable=protected-access
+            entity._attr_name = "Power"  # pylint: disable=protected-access
+            entity._attr_unit_of_measurement = "W"  # pylint: disable=protected-access
+            entities.append(entity)
+
+        start = timer()
+        for idx in range(writes):
+            entity = entities[idx % entity_count]
+            entity._attr_state = idx  # pylint: disable=protected-access
+            entity.async_write_ha_state()
+        runtime = timer() - start
+        print(f"Wrote {writes / runtime:.0f} entity states per second")
+    return runtime
+
+
+# Advertisements captured from real devices, mixed with common
+# advertisements that do not match any integration
+_BLUETOOTH_ADVERTISEMENTS = [
+    (
+        "GVH5075 2762",
+        {60552: b"\x00\x03A\xc2d\x00L\x00\x02\x15INTELLI_ROCKS_HWPu\xf2\xff\x0c"},
+        {},
+        ["0000ec88-0000-1000-8000-00805f9b34fb"],
+    ),
+    (
+        "SensorPush HT.w 0CA1",
+        {11271: b"\xfe\x00\x01"},
+        {},
+        ["ef090000-11d6-42ba-93b8-9dd7ec090ab0"],
+    ),
+    (
+        "LYWSDCGQ",
+        {},
+        {
+            "0000fe95-0000-1000-8000-00805f9b34fb": (
+                b"P \xaa\x01\xda!\x9354-X\r\x10\x04\xfe\x00H\x02"
+            )
+        },
+        ["0000fe95-0000-1000-8000-00805f9b34fb"],
+    ),
+    (
+        "Qingping Motion & Light",
+        {},
+        {
+            "0000fdcd-0000-1000-8000-00805f9b34fb": (
+                b"H\x12\xcd\xd5`4-X\x08\x04\x00\r\x00\x00\x0f\x01\xee"
+            )
+        },
+        [],
+    ),
+    (
+        "ATC 8D18B2",
+        {},
+        {"0000181c-0000-1000-8000-00805f9b34fb": b"#\x02\xca\t\x03\x03\xbf\x13"},
+        ["0000181c-0000-1000-8000-00805f9b34fb"],
+    ),
+    ("TP357 (2142)", {61890: b"\x00\x1d\x02,"}, {}, []),
+    ("Triones:F30200000152C", {}, {}, []),
+    ("LEDnetWF", {}, {}, []),
+    ("Galaxy Buds", {117: b"B\x04\x01\x01"}, {}, []),
+    ("Tile", {}, {"0000feed-0000-1000-8000-00805f9b34fb": b"\x02\x00"}, []),
+    ("[TV] Samsung", {117: b"B\x04\x01\x80"}, {}, []),
+    ("AA:BB:CC:DD:EE:FF", {6: b"\x01\t \x02"}, {}, []),
+    ("AA:BB:CC:DD:EE:FF", {224: b"\x00\x01"}, {}, []),
+    ("AA:BB:CC:DD:EE:FF", {76: b"\x10\x05\x01\x18"}, {}, []),
+]
+
+
+@benchmark
+async def bluetooth_match_advertisements(hass):
+    """Match a million advertisements against the integration matchers."""
+    # pylint: disable=import-outside-toplevel
+    from bleak.backends.device import BLEDevice
+    from bleak.backends.scanner import AdvertisementData
+
+    from homeassistant.components.bluetooth.match import BluetoothMatcherIndex
+    from homeassistant.components.bluetooth.models import BluetoothServiceInfoBleak
+    from homeassistant.generated.bluetooth import BLUETOOTH
+
+    index = BluetoothMatcherIndex()
+    for matcher in BLUETOOTH:
+        index.add(matcher)
+    index.build()
+
+    service_infos = []
+    for (
+        name,
+        manufacturer_data,
+        service_data,
+        service_uuids,
+    ) in _BLUETOOTH_ADVERTISEMENTS:
+        service_infos.append(
+            BluetoothServiceInfoBleak(
+                name=name,
+                address="AA:BB:CC:DD:EE:FF",
+                rssi=-60,
+                manufacturer_data=manufacturer_data,
+                service_data=service_data,
+                service_uuids=service_uuids,
+                source="local",
+                device=BLEDevice("AA:BB:CC:DD:EE:FF", name),
+                advertisement=AdvertisementData(
+                    local_name=name,
+                    manufacturer_data=manufacturer_data,
+                    service_data=service_data,
+                    service_uuids=service_uuids,
+                ),
+                connectable=True,
+                time=0,
+            )
+        )
+    size = len(service_infos)
+
+    start = timer()
+
+    for i in range(10**6):
+        index.match(service_infos[i % size])
+
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -5,16 +5,12 @@ from collections import deque
 from collections.abc import Callable
 import json
 import logging
+from pathlib import Path
 from typing import Any
 
 import orjson
 
-from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.json import (
-    JSONEncoder as DefaultHASSJSONEncoder,
-    json_encoder_default as default_hass_orjson_encoder,
-)
 
 from .file import write_utf8_file, write_utf8_file_atomic
 
@@ -29,6 +25,22 @@ class WriteError(HomeAssistantError):
     """Error writing the data."""
 
 
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects.
+
+    Hand other objects to the original method.
+    """
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    if isinstance(obj, Path):
+        return obj.as_posix()
+    raise TypeError
+
+
 def load_json(filename: str, default: list | dict | None = None) -> list | dict:
     """Load JSON data from a file and return as dict or list.
 
@@ -54,7 +66,7 @@ def _orjson_default_encoder(data: Any) -> str:
     return orjson.dumps(
         data,
         option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
-        default=default_hass_orjson_encoder,
+        default=json_encoder_default,
     ).decode("utf-8")
 
 
@@ -70,6 +82,9 @@ def save_json(
 
     Returns True on success.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.json import JSONEncoder as DefaultHASSJSONEncoder
+
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -109,6 +124,9 @@ def find_paths_unserializable_data(
 
     This method is slow! Only use for error handling.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.core import Event, State
+
     to_process = deque([(bad_data, "$")])
     invalid = {}
 
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 from collections.abc import Callable, Coroutine
 from functools import partial, wraps
 import inspect
 import logging
 import logging.handlers
 import queue
+import time
 import traceback
 from typing import Any, TypeVar, cast, overload
 
@@ -33,7 +35,64 @@ class HideSensitiveDataFilter(logging.Filter):
 
 
 class HomeAssistantQueueHandler(logging.handlers.QueueHandler):
-    """Process the log in another thread."""
+    """Process the log in another thread.
+
+    Debug and info records of loggers over their rate limit are dropped
+    before they are formatted. Warnings and errors are never rate limited.
+    """
+
+    def __init__(self, simple_queue: queue.SimpleQueue[logging.LogRecord]) -> None:
+        """Initialize the queue handler."""
+        super().__init__(simple_queue)
+        self.emitted: defaultdict[str, int] = defaultdict(int)
+        self.dropped: defaultdict[str, int] = defaultdict(int)
+        self._rate_limits: dict[str, float] = {}
+        # Logger name to the configured logger name and rate limit that apply
+        self._logger_rate_limits: dict[str, tuple[str, float] | None] = {}
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def set_rate_limits(self, rate_limits: dict[str, float]) -> None:
+        """Set the maximum debug and info records per second of loggers.
+
+        A rate limit applies to the logger and all of its children.
+        """
+        self._rate_limits = dict(rate_limits)
+        self._logger_rate_limits = {}
+        self._buckets = {}
+
+    def _get_rate_limit(self, name: str) -> tuple[str, float] | None:
+        """Return the configured logger name and rate limit for a logger."""
+        try:
+            return self._logger_rate_limits[name]
+        except KeyError:
+            pass
+        rate_limit: tuple[str, float] | None = None
+        parent = name
+        while parent:
+            if (rate := self._rate_limits.get(parent)) is not None:
+                rate_limit = (parent, rate)
+                break
+            parent = parent.rpartition(".")[0]
+        self._logger_rate_limits[name] = rate_limit
+        return rate_limit
+
+    def _rate_limited(self, name: str) -> bool:
+        """Check if a logger exceeded its rate limit.
+
+        The token buckets are not locked; records logged at the same time
+        from different threads may make the limit slightly inexact.
+        """
+        if (rate_limit := self._get_rate_limit(name)) is None:
+            return False
+        limited_name, rate = rate_limit
+        now = time.monotonic()
+        tokens, last = self._buckets.get(limited_name, (rate, now))
+        tokens = min(rate, tokens + (now - last) * rate)
+        if tokens < 1:
+            self._buckets[limited_name] = (tokens, now)
+            return True
+        self._buckets[limited_name] = (tokens - 1, now)
+        return False
 
     def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
         """Prepare a record for queuing.
@@ -57,11 +116,39 @@ class HomeAssistantQueueHandler(logging.handlers.QueueHandler):
 
         See https://bugs.python.org/issue24645
         """
+        if (
+            self._rate_limits
+            and record.levelno < logging.WARNING
+            and self._rate_limited(record.name)
+        ):
+            self.dropped[record.name] += 1
+            return False
         return_value = self.filter(record)
         if return_value:
+            self.emitted[record.name] += 1
             self.emit(record)
+        else:
+            self.dropped[record.name] += 1
         return return_value
 
+    def diagnostics(self) -> dict[str, dict[str, int]]:
+        """Return the number of emitted and dropped records per logger."""
+        return {
+            name: {
+                "emitted": self.emitted.get(name, 0),
+                "dropped": self.dropped.get(name, 0),
+            }
+            for name in sorted({*self.emitted, *self.dropped})
+        }
+
+
+def get_queue_handler() -> HomeAssistantQueueHandler | None:
+    """Return the active queue handler of the root logger."""
+    for handler in logging.root.handlers:
+        if isinstance(handler, HomeAssistantQueueHandler):
+            return handler
+    return None
+
 
 @callback
 def async_activate_log_queue_handler(hass: HomeAssistant) -> None:
@@ -71,7 +158,7 @@ def async_activate_log_queue_handler(hass: HomeAssistant) -> None:
     This allows us to avoid blocking I/O and formatting messages
     in the event loop as log messages are written in another thread.
     """
-    simple_queue: queue.SimpleQueue[logging.Handler] = queue.SimpleQueue()
+    simple_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
     queue_handler = HomeAssistantQueueHandler(simple_queue)
     logging.root.addHandler(queue_handler)
 
@@ -563,6 +563,54 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_verified_access_token_cache(mock_hass):
+    """Test verified access tokens are cached until revoked."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert not mock_decode.called
+    assert manager.async_access_token_cache_info() == {
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+        "size": 1,
+    }
+
+    # Cached access tokens are verified again once they expired
+    with patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=dt_util.utcnow()
+        + refresh_token.access_token_expiration
+        + timedelta(seconds=11),
+    ), patch("homeassistant.auth.jwt.decode", side_effect=jwt.ExpiredSignatureError):
+        assert await manager.async_validate_access_token(access_token) is None
+    assert manager.async_access_token_cache_info()["misses"] == 2
+    assert manager.async_access_token_cache_info()["size"] == 0
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    await manager.async_remove_refresh_token(refresh_token)
+    assert manager.async_access_token_cache_info()["size"] == 0
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_deactivate_user_forgets_access_tokens(mock_hass):
+    """Test deactivating a user forgets their verified access tokens."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    await manager.async_deactivate_user(user)
+    assert manager.async_access_token_cache_info()["size"] == 0
+    assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_register_revoke_token_callback(mock_hass):
     """Test that a registered revoke token callback is called."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
@@ -463,6 +463,26 @@ async def test_ws_refresh_tokens(hass, hass_ws_client, hass_access_token):
     assert token["auth_provider_type"] == "homeassistant"
 
 
+async def test_ws_access_token_cache_info(hass, hass_ws_client, hass_access_token):
+    """Test fetching the hit rate of the verified access token cache."""
+    assert await async_setup_component(hass, "auth", {"http": {}})
+
+    await hass.auth.async_validate_access_token(hass_access_token)
+    await hass.auth.async_validate_access_token(hass_access_token)
+    ws_client = await hass_ws_client(hass, hass_access_token)
+
+    await ws_client.send_json({"id": 5, "type": "auth/access_token_cache_info"})
+
+    result = await ws_client.receive_json()
+    assert result["success"], result
+    assert result["result"] == {
+        "hits": 2,
+        "misses": 1,
+        "hit_rate": 2 / 3,
+        "size": 1,
+    }
+
+
 async def test_ws_delete_refresh_token(
     hass, hass_admin_user, hass_admin_credential, hass_ws_client, hass_access_token
 ):
@@ -3,10 +3,12 @@
 from unittest.mock import patch
 
 from homeassistant import config_entries
+from homeassistant.components.bluetooth import models
 from homeassistant.components.bluetooth.const import (
     CONF_ADAPTER,
     CONF_DETAILS,
     CONF_PASSIVE,
+    CONF_RSSI_CHANGE_THRESHOLD,
     DEFAULT_ADDRESS,
     DOMAIN,
     AdapterDetails,
@@ -310,6 +312,46 @@ async def test_options_flow_linux(hass, mock_bleak_scanner_start, one_adapter):
     assert result["data"][CONF_PASSIVE] is False
 
 
+async def test_options_flow_rssi_change_threshold(
+    hass, mock_bleak_scanner_start, one_adapter
+):
+    """Test the RSSI change threshold option is applied to the scanner."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={},
+        unique_id="00:00:00:00:00:01",
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert models.MANAGER._rssi_change_thresholds == {}
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_PASSIVE: False, CONF_RSSI_CHANGE_THRESHOLD: 3},
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_RSSI_CHANGE_THRESHOLD] == 3
+    assert models.MANAGER._rssi_change_thresholds == {"hci0": 3}
+
+    # Verify we can clear it again
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={CONF_PASSIVE: False}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert CONF_RSSI_CHANGE_THRESHOLD not in result["data"]
+    assert models.MANAGER._rssi_change_thresholds == {}
+
+
 async def test_options_flow_disabled_macos(
     hass, hass_ws_client, mock_bleak_scanner_start, macos_adapter
 ):
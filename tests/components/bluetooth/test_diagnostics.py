@@ -107,6 +107,7 @@ async def test_diagnostics(
                         "sw_version": "BlueZ 4.63",
                     },
                 },
+                "advertisements": {"processed": 0, "skipped": 0},
                 "connectable_history": [],
                 "history": [],
                 "scanners": [
@@ -484,6 +484,41 @@ async def test_discovery_match_by_local_name(
         assert mock_config_flow.mock_calls[0][1][0] == "switchbot"
 
 
+async def test_discovery_match_by_local_name_prefix(
+    hass, mock_bleak_scanner_start, macos_adapter
+):
+    """Test local_name matchers sharing the first characters only match their prefix."""
+    mock_bt = [
+        {"domain": "led_ble", "local_name": "LEDnet*"},
+        {"domain": "other_led", "local_name": "LEDBLE*"},
+        {"domain": "short_led", "local_name": "LED-?"},
+    ]
+    with patch(
+        "homeassistant.components.bluetooth.async_get_bluetooth", return_value=mock_bt
+    ):
+        await async_setup_with_default_adapter(hass)
+
+    with patch.object(hass.config_entries.flow, "async_init") as mock_config_flow:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        for idx, (name, domains) in enumerate(
+            (
+                ("LEDnetWF", ["led_ble"]),
+                ("LEDBLE-01", ["other_led"]),
+                ("LED-1", ["short_led"]),
+                ("LED-12", []),
+                ("LEDxyz", []),
+            )
+        ):
+            device = BLEDevice(f"44:44:33:11:23:{idx:02X}", name)
+            adv = AdvertisementData(local_name=name, service_uuids=[])
+            inject_advertisement(hass, device, adv)
+            await hass.async_block_till_done()
+            assert _domains_from_mock_config_flow(mock_config_flow) == domains
+            mock_config_flow.reset_mock()
+
+
 async def test_discovery_match_by_manufacturer_id_and_manufacturer_data_start(
     hass, mock_bleak_scanner_start, macos_adapter
 ):
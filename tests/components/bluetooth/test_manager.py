@@ -4,9 +4,13 @@
 from bleak.backends.scanner import AdvertisementData, BLEDevice
 
 from homeassistant.components import bluetooth
-from homeassistant.components.bluetooth.manager import STALE_ADVERTISEMENT_SECONDS
+from homeassistant.components.bluetooth.manager import (
+    STALE_ADVERTISEMENT_SECONDS,
+    UNCHANGED_ADVERTISEMENT_DISPATCH_SECONDS,
+)
 
 from . import (
+    _get_manager,
     inject_advertisement_with_source,
     inject_advertisement_with_time_and_source,
 )
@@ -176,3 +180,60 @@ async def test_switching_adapters_based_on_stale(hass, enable_bluetooth):
         bluetooth.async_ble_device_from_address(hass, address)
         is switchbot_device_poor_signal_hci1
     )
+
+
+async def test_unchanged_advertisements_are_not_dispatched(hass, enable_bluetooth):
+    """Test advertisements with an unchanged payload skip matching and dispatch."""
+    address = "44:44:33:11:23:45"
+    manager = _get_manager()
+    clear_threshold = manager.async_set_rssi_change_threshold("hci0", 3)
+    callbacks = []
+
+    def _fake_subscriber(service_info, change):
+        callbacks.append(service_info)
+
+    cancel = bluetooth.async_register_callback(
+        hass,
+        _fake_subscriber,
+        {"address": address},
+        bluetooth.BluetoothScanningMode.ACTIVE,
+    )
+    start_time_monotonic = 1000.0
+    adv = AdvertisementData(local_name="wohand", manufacturer_data={89: b"\x01"})
+
+    def _inject(rssi, adv, offset=0):
+        device = BLEDevice(address, "wohand", rssi=rssi)
+        inject_advertisement_with_time_and_source(
+            hass, device, adv, start_time_monotonic + offset, "hci0"
+        )
+        return device
+
+    _inject(-60, adv)
+    assert len(callbacks) == 1
+
+    # Small RSSI changes only update the history
+    device = _inject(-62, adv, 1)
+    assert len(callbacks) == 1
+    assert bluetooth.async_ble_device_from_address(hass, address) is device
+
+    # RSSI changes are compared to the last dispatched advertisement
+    _inject(-63, adv, 2)
+    assert len(callbacks) == 2
+
+    changed_adv = AdvertisementData(
+        local_name="wohand", manufacturer_data={89: b"\x02"}
+    )
+    _inject(-63, changed_adv, 3)
+    assert len(callbacks) == 3
+
+    _inject(-63, changed_adv, 3 + UNCHANGED_ADVERTISEMENT_DISPATCH_SECONDS + 1)
+    assert len(callbacks) == 4
+
+    # Unchanged advertisements are dispatched unless a threshold is set
+    clear_threshold()
+    _inject(-63, changed_adv, 3 + UNCHANGED_ADVERTISEMENT_DISPATCH_SECONDS + 2)
+    assert len(callbacks) == 5
+
+    diagnostics = await manager.async_diagnostics()
+    assert diagnostics["advertisements"] == {"processed": 5, "skipped": 1}
+    cancel()
@@ -0,0 +1,143 @@
+"""Test the energy statistics cache."""
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.energy.statistics_cache import (
+    FossilEnergyStatistics,
+    async_get_statistics_cache,
+)
+from homeassistant.components.recorder.const import (
+    SIGNAL_HOURLY_STATISTICS_COMPILED,
+    SIGNAL_STATISTICS_UPDATED,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import dt as dt_util
+
+
+def _mock_fetch(sums):
+    """Return a mock fetching sums from a dict of hourly sums."""
+
+    def _fetch(self, hass, start_time, end_time):
+        return (
+            {
+                hour: sum_
+                for hour, sum_ in sums.items()
+                if hour >= start_time and (end_time is None or hour < end_time)
+            },
+            {},
+        )
+
+    return _fetch
+
+
+async def test_fossil_energy_incremental(hass, recorder_mock):
+    """Test cached totals are extended when an hour was compiled."""
+    hass.config.set_time_zone("UTC")
+    start = dt_util.parse_datetime("2021-09-30 20:00:00+00:00")
+    sums = {start + timedelta(hours=hour): hour * 2.0 for hour in range(6)}
+    fossil_energy = FossilEnergyStatistics(["test:energy"], "test:co2")
+
+    with patch.object(FossilEnergyStatistics, "_fetch", _mock_fetch(sums)):
+        await fossil_energy.async_update(hass, start)
+
+    end = start + timedelta(days=60)
+    assert fossil_energy.async_fossil_energy(start, end, "day") == {
+        "2021-09-30T00:00:00+00:00": 6.0,
+        "2021-10-01T00:00:00+00:00": 4.0,
+    }
+
+    # A new hour is compiled, the last known hour is fetched again
+    sums[start + timedelta(hours=5)] = 11.0
+    sums[start + timedelta(hours=6)] = 13.0
+    fossil_energy.stale = True
+    with patch.object(FossilEnergyStatistics, "_fetch", _mock_fetch(sums)):
+        await fossil_energy.async_update(hass, start)
+    assert not fossil_energy.stale
+
+    assert fossil_energy.async_fossil_energy(start, end, "day") == {
+        "2021-09-30T00:00:00+00:00": 6.0,
+        "2021-10-01T00:00:00+00:00": 7.0,
+    }
+    assert fossil_energy.async_fossil_energy(start, end, "month") == {
+        "2021-09-01T00:00:00+00:00": 6.0,
+        "2021-10-01T00:00:00+00:00": 7.0,
+    }
+    assert fossil_energy.async_fossil_energy(
+        start + timedelta(hours=4), end, "hour"
+    ) == {
+        "2021-10-01T01:00:00+00:00": 3.0,
+        "2021-10-01T02:00:00+00:00": 2.0,
+    }
+
+    # Requesting an earlier window prepends the missing hours
+    earlier = start - timedelta(days=1)
+    sums[earlier] = -10.0
+    with patch.object(FossilEnergyStatistics, "_fetch", _mock_fetch(sums)):
+        await fossil_energy.async_update(hass, earlier)
+    assert fossil_energy.async_fossil_energy(earlier, end, "day") == {
+        "2021-09-30T00:00:00+00:00": 16.0,
+        "2021-10-01T00:00:00+00:00": 7.0,
+    }
+    assert fossil_energy.async_fossil_energy(earlier, end, "month") == {
+        "2021-09-01T00:00:00+00:00": 16.0,
+        "2021-10-01T00:00:00+00:00": 7.0,
+    }
+
+
+@pytest.mark.parametrize(
+    "period,expected",
+    (
+        (
+            "day",
+            {
+                "2021-09-29T00:00:00+00:00": 3.0,
+                "2021-09-30T00:00:00+00:00": 24.0,
+                "2021-10-01T00:00:00+00:00": 24.0,
+                "2021-10-02T00:00:00+00:00": 1.0,
+            },
+        ),
+        (
+            "month",
+            {
+                "2021-09-01T00:00:00+00:00": 27.0,
+                "2021-10-01T00:00:00+00:00": 25.0,
+            },
+        ),
+    ),
+)
+async def test_fossil_energy_edges(hass, recorder_mock, period, expected):
+    """Test partly covered periods are computed from the hourly deltas."""
+    hass.config.set_time_zone("UTC")
+    first = dt_util.parse_datetime("2021-09-29 20:00:00+00:00")
+    sums = {first + timedelta(hours=hour): float(hour) for hour in range(60)}
+    fossil_energy = FossilEnergyStatistics(["test:energy"], "test:co2")
+
+    with patch.object(FossilEnergyStatistics, "_fetch", _mock_fetch(sums)):
+        await fossil_energy.async_update(hass, first)
+
+    start = first
+    end = dt_util.parse_datetime("2021-10-02 01:00:00+00:00")
+    assert fossil_energy.async_fossil_energy(start, end, period) == expected
+
+
+async def test_cache_invalidation(hass, recorder_mock):
+    """Test cached statistics are dropped or marked stale on changes."""
+    cache = async_get_statistics_cache(hass)
+    start = dt_util.utcnow()
+
+    with patch.object(FossilEnergyStatistics, "_fetch", _mock_fetch({})):
+        await cache.async_get_fossil_energy_consumption(
+            start, start, ["test:energy"], "test:co2", "hour"
+        )
+    (fossil_energy,) = cache._fossil_energy.values()
+
+    async_dispatcher_send(hass, SIGNAL_HOURLY_STATISTICS_COMPILED, start)
+    assert fossil_energy.stale
+
+    async_dispatcher_send(hass, SIGNAL_STATISTICS_UPDATED, ["test:other"])
+    assert len(cache._fossil_energy) == 1
+
+    async_dispatcher_send(hass, SIGNAL_STATISTICS_UPDATED, ["test:co2"])
+    assert len(cache._fossil_energy) == 0
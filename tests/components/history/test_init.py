@@ -595,6 +595,31 @@ async def test_fetch_period_api(hass, hass_client, recorder_mock):
     assert response.status == HTTPStatus.OK
 
 
+async def test_fetch_period_api_with_resolution(hass, hass_client, recorder_mock):
+    """Test the fetch period view for history with a resolution."""
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{(dt_util.utcnow() - timedelta(hours=1)).isoformat()}",
+        params={
+            "filter_entity_id": "sensor.power",
+            "minimal_response": "",
+            "resolution": "100",
+        },
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert response_json[0][0]["state"] == "1"
+
+    for resolution in ("0", "cats"):
+        response = await client.get(
+            "/api/history/period", params={"resolution": resolution}
+        )
+        assert response.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_fetch_period_api_with_use_include_order(
     hass, hass_client, recorder_mock
 ):
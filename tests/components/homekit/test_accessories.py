@@ -749,3 +749,33 @@ def test_home_driver():
 
     mock_unpair.assert_called_with("client_uuid")
     mock_show_msg.assert_called_with("hass", "entry_id", "title (any)", pin, "X-HM://0")
+
+
+async def test_home_driver_gathers_events(hass):
+    """Test HomeDriver sends characteristic changes of the bridge together."""
+    with patch("pyhap.accessory_driver.AccessoryDriver.__init__"):
+        driver = HomeDriver(hass, "entry_id", "name", "title")
+    driver.topics = {"1.9": {"client1", "client2"}, "2.9": {"client1"}}
+
+    with patch(
+        "pyhap.accessory_driver.AccessoryDriver.async_send_event"
+    ) as mock_send_event:
+        driver.async_send_event("1.9", {"aid": 1, "iid": 9, "value": 1}, None, False)
+        driver.async_send_event(
+            "2.9", {"aid": 2, "iid": 9, "value": 1}, "client1", False
+        )
+        driver.async_send_event("1.9", {"aid": 1, "iid": 9, "value": 2}, None, False)
+        assert mock_send_event.call_count == 0
+        assert driver._send_events_handle is not None
+
+        # A change that must be sent immediately takes the others along
+        driver.async_send_event("3.9", {"aid": 3, "iid": 9, "value": None}, None, True)
+
+    assert driver._send_events_handle is None
+    assert mock_send_event.call_args_list == [
+        (("1.9", {"aid": 1, "iid": 9, "value": 2}, None, True),),
+        (("2.9", {"aid": 2, "iid": 9, "value": 1}, "client1", True),),
+        (("3.9", {"aid": 3, "iid": 9, "value": None}, None, True),),
+    ]
+    assert driver.events_sent == 3
+    assert driver.notifications_sent == 2
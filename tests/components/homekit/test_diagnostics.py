@@ -1,7 +1,8 @@
 """Test homekit diagnostics."""
 from unittest.mock import ANY, patch
 
-from homeassistant.components.homekit.const import DOMAIN
+from homeassistant.components.homekit.accessories import HomeDriver
+from homeassistant.components.homekit.const import DOMAIN, EVENT_RATE_WINDOW
 from homeassistant.const import CONF_NAME, CONF_PORT, EVENT_HOMEASSISTANT_STARTED
 
 from .util import async_init_integration
@@ -108,6 +109,11 @@ async def test_config_entry_running(hass, hass_client, hk_driver, mock_async_zer
             "version": 1,
         },
         "config_version": 2,
+        "events": {
+            "events_sent": 0,
+            "notifications_sent": 0,
+            "notifications_per_second": 0.0,
+        },
         "pairing_id": ANY,
         "status": 1,
     }
@@ -117,3 +123,36 @@ async def test_config_entry_running(hass, hass_client, hk_driver, mock_async_zer
     ), patch("homeassistant.components.homekit.async_port_is_available"):
         assert await hass.config_entries.async_unload(entry.entry_id)
         await hass.async_block_till_done()
+
+
+async def test_event_stats_notification_rate(hass):
+    """Test the notification rate is computed when the diagnostics are read."""
+    with patch(
+        "homeassistant.components.homekit.accessories.monotonic", return_value=100.0
+    ), patch("pyhap.accessory_driver.AccessoryDriver.__init__"):
+        driver = HomeDriver(hass, "entry_id", "name", "title")
+    driver.topics = {"1.9": {"client1", "client2"}}
+
+    def _stats_at(now: float) -> dict:
+        with patch(
+            "homeassistant.components.homekit.accessories.monotonic", return_value=now
+        ):
+            return driver.event_stats
+
+    def _send_at(now: float) -> None:
+        with patch(
+            "homeassistant.components.homekit.accessories.monotonic", return_value=now
+        ), patch("pyhap.accessory_driver.AccessoryDriver.async_send_event"):
+            driver.async_send_event("1.9", {"aid": 1, "iid": 9, "value": 1}, None, True)
+
+    assert _stats_at(100.0)["notifications_per_second"] == 0.0
+    for _ in range(5):
+        _send_at(101.0)
+    assert _stats_at(102.0) == {
+        "events_sent": 5,
+        "notifications_sent": 10,
+        "notifications_per_second": 5.0,
+    }
+    # The rate drops while nothing is sent
+    assert _stats_at(100.0 + EVENT_RATE_WINDOW)["notifications_per_second"] == 1.0
+    assert _stats_at(100.0 + 3 * EVENT_RATE_WINDOW)["notifications_per_second"] == 0.0
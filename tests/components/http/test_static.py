@@ -0,0 +1,144 @@
+"""The tests for http static files."""
+from http import HTTPStatus
+from pathlib import Path
+
+from aiohttp import hdrs
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.setup import async_setup_component
+
+
+@pytest.fixture
+async def static_client(hass, hass_client, tmp_path):
+    """Return a client for a cached static path in a temporary directory."""
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_static_path("/static_test", str(tmp_path))
+    return await hass_client()
+
+
+async def test_cached_asset_etag(static_client, tmp_path):
+    """Test cached assets are answered with 304 when the ETag matches."""
+    (tmp_path / "app.js").write_text("console.log('hello');")
+
+    resp = await static_client.get(
+        "/static_test/app.js", headers={hdrs.ACCEPT_ENCODING: "identity"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "console.log('hello');"
+    assert resp.headers[hdrs.CACHE_CONTROL] == static.CACHE_HEADERS[hdrs.CACHE_CONTROL]
+    etag = resp.headers[hdrs.ETAG]
+
+    resp = await static_client.get(
+        "/static_test/app.js", headers={hdrs.IF_NONE_MATCH: etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers[hdrs.ETAG] == etag
+
+    resp = await static_client.get(
+        "/static_test/app.js", headers={hdrs.IF_NONE_MATCH: 'W/"other"'}
+    )
+    assert resp.status == HTTPStatus.OK
+
+
+async def test_cached_asset_last_modified(static_client, tmp_path):
+    """Test cached assets are answered with 304 when not modified since."""
+    (tmp_path / "app.js").write_text("console.log('hello');")
+
+    resp = await static_client.get("/static_test/app.js")
+    assert resp.status == HTTPStatus.OK
+    last_modified = resp.headers[hdrs.LAST_MODIFIED]
+
+    resp = await static_client.get(
+        "/static_test/app.js", headers={hdrs.IF_MODIFIED_SINCE: last_modified}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers[hdrs.LAST_MODIFIED] == last_modified
+
+    resp = await static_client.get(
+        "/static_test/app.js",
+        headers={hdrs.IF_MODIFIED_SINCE: "Thu, 01 Jan 1970 00:00:00 GMT"},
+    )
+    assert resp.status == HTTPStatus.OK
+
+    # If-None-Match takes precedence over If-Modified-Since
+    resp = await static_client.get(
+        "/static_test/app.js",
+        headers={
+            hdrs.IF_MODIFIED_SINCE: last_modified,
+            hdrs.IF_NONE_MATCH: 'W/"other"',
+        },
+    )
+    assert resp.status == HTTPStatus.OK
+
+
+async def test_cached_asset_encodings(static_client, tmp_path):
+    """Test precompressed variants are served and gzip is generated lazily."""
+    content = "body { color: red; }\n" * 100
+    (tmp_path / "app.css").write_text(content)
+    (tmp_path / "app.css.br").write_bytes(b"brotli")
+
+    resp = await static_client.get(
+        "/static_test/app.css",
+        headers={hdrs.ACCEPT_ENCODING: "gzip"},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert resp.headers[hdrs.VARY] == hdrs.ACCEPT_ENCODING
+    assert int(resp.headers[hdrs.CONTENT_LENGTH]) < len(content)
+    assert await resp.text() == content
+
+    # Precompressed variants next to the file are kept with the asset
+    asset = static.ASSET_CACHE[tmp_path / "app.css"]
+    assert asset.encoded["br"] == b"brotli"
+
+
+async def test_large_files_are_not_cached(static_client, tmp_path):
+    """Test files larger than the cache limit are streamed from disk."""
+    content = b"x" * (static.MAX_CACHED_ASSET_SIZE + 1)
+    (tmp_path / "large.bin").write_bytes(content)
+
+    resp = await static_client.get("/static_test/large.bin")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == content
+    assert static.ASSET_CACHE[tmp_path / "large.bin"].body is None
+
+
+def test_asset_cache_is_bounded_by_size():
+    """Test the least recently used assets are dropped over the size limit."""
+    cache = static.AssetCache(10)
+
+    def _asset(body: bytes) -> static.StaticAsset:
+        return static.StaticAsset(
+            mtime_ns=0,
+            size=len(body),
+            etag='W/"0-0"',
+            content_type=None,
+            body=body,
+            encoded={},
+            compressible=False,
+            checked=0,
+        )
+
+    first, second = Path("first"), Path("second")
+    cache[first] = _asset(b"1234")
+    cache[second] = _asset(b"1234")
+    assert cache.get(first) is not None
+    cache[Path("third")] = _asset(b"1234")
+    assert cache.get(second) is None
+    assert cache.get(first) is not None
+    assert (len(cache), cache.total_bytes) == (2, 8)
+
+    asset = cache[first]
+    asset.encoded["gzip"] = b"12"
+    cache[first] = asset
+    assert (len(cache), cache.total_bytes) == (2, 10)
+
+    cache[first] = _asset(b"x" * 11)
+    assert (len(cache), cache.total_bytes) == (0, 0)
+
+
+async def test_missing_file(static_client):
+    """Test missing files are not found."""
+    resp = await static_client.get("/static_test/missing.js")
+    assert resp.status == HTTPStatus.NOT_FOUND
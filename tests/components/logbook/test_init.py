@@ -616,6 +616,92 @@ async def test_logbook_view_end_time_entity(hass, hass_client, recorder_mock):
     assert response_json[0]["entity_id"] == entity_id_test
 
 
+async def test_logbook_view_paginated(hass, hass_client, recorder_mock, set_utc):
+    """Test the logbook view with a limit and continuation cursor."""
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+
+    for entity_id in ("switch.one", "switch.two", "switch.three"):
+        hass.states.async_set(entity_id, STATE_OFF)
+        hass.states.async_set(entity_id, STATE_ON)
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}?limit=2")
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert [event["entity_id"] for event in response_json["events"]] == [
+        "switch.one",
+        "switch.two",
+    ]
+    assert (cursor := response_json["next_cursor"])
+
+    response = await client.get(
+        f"/api/logbook/{start_date.isoformat()}?limit=2&cursor={cursor}"
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert [event["entity_id"] for event in response_json["events"]] == ["switch.three"]
+    assert response_json["next_cursor"] is None
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}?limit=3")
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert len(response_json["events"]) == 3
+    assert response_json["next_cursor"] is None
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}?limit=0")
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+    response = await client.get(
+        f"/api/logbook/{start_date.isoformat()}?limit=2&cursor=INVALID"
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
+async def test_logbook_view_paginated_context(
+    hass, hass_client, recorder_mock, set_utc
+):
+    """Test the context of a page entry that started on an earlier page."""
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("switch.one", STATE_OFF)
+    hass.states.async_set("switch.two", STATE_OFF)
+    context = ha.Context()
+    hass.states.async_set("switch.one", STATE_ON, context=context)
+    hass.states.async_set("switch.two", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    assert response.status == HTTPStatus.OK
+    all_events = await response.json()
+    assert all_events[1]["entity_id"] == "switch.two"
+    assert all_events[1]["context_entity_id"] == "switch.one"
+
+    paged_events = []
+    cursor = None
+    for _ in range(2):
+        url = f"/api/logbook/{start_date.isoformat()}?limit=1"
+        if cursor:
+            url = f"{url}&cursor={cursor}"
+        response = await client.get(url)
+        assert response.status == HTTPStatus.OK
+        response_json = await response.json()
+        paged_events.extend(response_json["events"])
+        cursor = response_json["next_cursor"]
+
+    assert cursor is None
+    assert paged_events == all_events
+
+
 async def test_logbook_entity_filter_with_automations(hass, hass_client, recorder_mock):
     """Test the logbook view with end_time and entity with automations and scripts."""
     await asyncio.gather(
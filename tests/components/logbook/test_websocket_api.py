@@ -11,6 +11,7 @@ from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.const import LOGBOOK_LIVE_PIPELINES
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.websocket_api.const import TYPE_RESULT
@@ -241,6 +242,85 @@ async def test_get_events(hass, hass_ws_client, recorder_mock):
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_paginated(hass, hass_ws_client, recorder_mock):
+    """Test logbook get_events with a limit and continuation cursor."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    entity_ids = [f"light.kitchen_{idx}" for idx in range(5)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+    await hass.async_block_till_done()
+    now = dt_util.utcnow()
+    # Rows fired at the same time must be split over pages without duplicates
+    with freeze_time(now):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, STATE_ON)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    msg_id = 0
+    # Entity queries also select rows that only link contexts
+    for extra in ({}, {"entity_ids": entity_ids[1:]}):
+        msg_id += 1
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": (now - timedelta(seconds=1)).isoformat(),
+                **extra,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        all_events = response["result"]
+        assert len(all_events) == 5 - len(extra)
+        assert len({event["when"] for event in all_events}) == 1
+
+        paged_events = []
+        cursor = None
+        for _ in range(3):
+            msg_id += 1
+            request = {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": (now - timedelta(seconds=1)).isoformat(),
+                "limit": 2,
+                **extra,
+            }
+            if cursor:
+                request["cursor"] = cursor
+            await client.send_json(request)
+            response = await client.receive_json()
+            assert response["success"]
+            assert len(response["result"]["events"]) <= 2
+            paged_events.extend(response["result"]["events"])
+            if not (cursor := response["result"]["next_cursor"]):
+                break
+
+        assert cursor is None
+        assert paged_events == all_events
+
+    await client.send_json(
+        {
+            "id": 10,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "limit": 2,
+            "cursor": "INVALID",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+
 async def test_get_events_entities_filtered_away(hass, hass_ws_client, recorder_mock):
     """Test logbook get_events all entities filtered away."""
     now = dt_util.utcnow()
@@ -2195,6 +2275,180 @@ async def test_stream_consumer_stop_processing(hass, recorder_mock, hass_ws_clie
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_streams_with_same_filters_share_pipeline(
+    hass, recorder_mock, hass_ws_client
+):
+    """Test live streams with the same filters humanify events only once."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    hass.states.async_set("light.small", STATE_OFF)
+    await async_wait_recording_done(hass)
+    now = dt_util.utcnow()
+    pipelines = hass.data[LOGBOOK_LIVE_PIPELINES]
+
+    websocket_client = await hass_ws_client()
+    other_websocket_client = await hass_ws_client()
+    after_ws_created_count = sum(hass.bus.async_listeners().values())
+    for client, entity_ids in (
+        (websocket_client, ["light.small", "binary_sensor.is_light"]),
+        (other_websocket_client, ["binary_sensor.is_light", "light.small"]),
+    ):
+        await client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": entity_ids,
+            }
+        )
+        msg = await asyncio.wait_for(client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == TYPE_RESULT
+        assert msg["success"]
+        msg = await asyncio.wait_for(client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["event"]["events"] == []
+
+    assert len(pipelines) == 1
+    (pipeline,) = pipelines.values()
+    assert len(pipeline.streams) == 2
+
+    with patch.object(
+        pipeline.event_processor,
+        "humanify",
+        wraps=pipeline.event_processor.humanify,
+    ) as mock_humanify:
+        hass.states.async_set("light.small", STATE_ON)
+        await hass.async_block_till_done()
+
+        for client in (websocket_client, other_websocket_client):
+            msg = await asyncio.wait_for(client.receive_json(), 2)
+            assert msg["id"] == 7
+            assert msg["type"] == "event"
+            assert msg["event"]["events"] == [
+                {"entity_id": "light.small", "state": "on", "when": ANY}
+            ]
+    assert mock_humanify.call_count == 1
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["success"]
+    assert len(pipeline.streams) == 1
+    assert pipelines
+
+    await other_websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await asyncio.wait_for(other_websocket_client.receive_json(), 2)
+    assert msg["success"]
+
+    # The pipeline is removed with its last stream
+    assert not pipelines
+    assert sum(hass.bus.async_listeners().values()) == after_ws_created_count
+
+
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_streams_of_devices_with_new_entities_get_new_pipeline(
+    hass, recorder_mock, hass_ws_client
+):
+    """Test streams do not share a pipeline when the entities of a device changed."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    devices = await _async_mock_devices_with_logbook_platform(hass)
+    device = devices[0]
+    await async_wait_recording_done(hass)
+    now = dt_util.utcnow()
+    pipelines = hass.data[LOGBOOK_LIVE_PIPELINES]
+
+    async def _subscribe(client):
+        await client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "device_ids": [device.id],
+            }
+        )
+        msg = await asyncio.wait_for(client.receive_json(), 2)
+        assert msg["success"]
+
+    await _subscribe(await hass_ws_client())
+    await _subscribe(await hass_ws_client())
+    assert len(pipelines) == 1
+
+    entity_registry.async_get(hass).async_get_or_create(
+        "light", "test", "1234", device_id=device.id
+    )
+    await _subscribe(await hass_ws_client())
+    assert len(pipelines) == 2
+
+
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_unsubscribe_while_sending_historical_events(
+    hass, recorder_mock, hass_ws_client
+):
+    """Test held back events are not sent after unsubscribing."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    hass.states.async_set("light.small", STATE_OFF)
+    await async_wait_recording_done(hass)
+    now = dt_util.utcnow()
+    pipelines = hass.data[LOGBOOK_LIVE_PIPELINES]
+    send_historical_events = websocket_api._async_send_historical_events
+    unsubscribed = asyncio.Event()
+
+    async def _send_historical_events_and_unsubscribe(
+        hass, connection, msg_id, *args, **kwargs
+    ):
+        """Unsubscribe while a live event is held back."""
+        result = await send_historical_events(hass, connection, msg_id, *args, **kwargs)
+        (pipeline,) = pipelines.values()
+        (live_stream,) = pipeline.streams
+        hass.states.async_set("light.small", STATE_ON)
+        while not live_stream.pending:
+            await asyncio.sleep(0)
+        connection.subscriptions.pop(msg_id)()
+        unsubscribed.set()
+        return result
+
+    websocket_client = await hass_ws_client()
+    with patch.object(
+        websocket_api,
+        "_async_send_historical_events",
+        _send_historical_events_and_unsubscribe,
+    ):
+        await websocket_client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.small"],
+            }
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+        await asyncio.wait_for(unsubscribed.wait(), 2)
+
+    assert not pipelines
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(websocket_client.receive_json(), 0.1)
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_recorder_is_far_behind(hass, recorder_mock, hass_ws_client, caplog):
     """Test we still start live streaming if the recorder is far behind."""
@@ -255,3 +255,16 @@ async def test_can_set_level(hass):
     assert logging.getLogger(CONFIGED_NS).level == logging.WARNING
 
     logging.getLogger("").setLevel(logging.NOTSET)
+
+
+async def test_rate_limits(hass):
+    """Test rate limits are set on the log queue handler."""
+    queue_handler = Mock()
+    with patch(
+        "homeassistant.components.logger.get_queue_handler",
+        return_value=queue_handler,
+    ):
+        assert await async_setup_component(
+            hass, "logger", {"logger": {"rate_limits": {"zigpy": 50}}}
+        )
+    queue_handler.set_rate_limits.assert_called_once_with({"zigpy": 50.0})
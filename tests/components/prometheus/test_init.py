@@ -453,6 +453,73 @@ async def test_counter(client, counter_entities):
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_openmetrics(client, counter_entities):
+    """Test the OpenMetrics exposition format is served when accepted."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={"Accept": "application/openmetrics-text; version=0.0.1"},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"].startswith("application/openmetrics-text")
+    body = (await resp.text()).split("\n")
+    assert body[-2] == "# EOF"
+    assert (
+        'counter_value{domain="counter",'
+        'entity="counter.counter",'
+        'friendly_name="None"} 2.0' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_exposition_cache(hass, client, sensor_entities):
+    """Test the exposition is rendered again after state changes."""
+    with mock.patch.object(
+        prometheus_client, "generate_latest", wraps=prometheus_client.generate_latest
+    ) as mock_generate:
+        resp = await client.get(
+            prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+        )
+        assert resp.headers["content-encoding"] == "gzip"
+        await generate_latest_metrics(client)
+        assert mock_generate.call_count == 1
+
+        hass.states.async_set("sensor.radio_energy", "100", {"friendly_name": "Radio"})
+        await hass.async_block_till_done()
+        body = await generate_latest_metrics(client)
+        assert mock_generate.call_count == 2
+
+    assert (
+        'sensor_state{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio"} 100.0' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize(
+    "accept_encoding,compressed",
+    [
+        ("gzip", True),
+        ("deflate, GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, deflate", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip;q=0, *", False),
+        ("identity", False),
+    ],
+)
+async def test_accept_encoding(client, sensor_entities, accept_encoding, compressed):
+    """Test the exposition is only compressed when gzip is acceptable."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": accept_encoding}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert (resp.headers.get("content-encoding") == "gzip") is compressed
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_renaming_entity_name(
     hass, registry, client, sensor_entities, climate_entities
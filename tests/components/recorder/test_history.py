@@ -17,6 +17,9 @@ from homeassistant.components.recorder.db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    Statistics,
+    StatisticsMeta,
+    StatisticsRuns,
 )
 from homeassistant.components.recorder.models import LazyState, process_timestamp
 from homeassistant.components.recorder.util import session_scope
@@ -414,6 +417,131 @@ def test_get_significant_states_minimal_response(hass_recorder):
     assert states == hist
 
 
+def test_get_significant_states_downsampled(hass_recorder):
+    """Test minimal responses are downsampled from statistics with a resolution."""
+    hass = hass_recorder()
+    temperature = "sensor.temperature"
+    no_statistics = "sensor.no_statistics"
+    attributes = {"unit_of_measurement": "°C"}
+
+    def set_state(entity_id, state, point):
+        """Set the state."""
+        with patch(
+            "homeassistant.components.recorder.core.dt_util.utcnow",
+            return_value=point,
+        ):
+            hass.states.set(entity_id, state, attributes)
+            wait_recording_done(hass)
+
+    zero = (dt_util.utcnow() - timedelta(hours=10)).replace(
+        minute=0, second=0, microsecond=0
+    )
+    set_state(temperature, "10", zero - timedelta(minutes=1))
+    set_state(no_statistics, "1", zero - timedelta(minutes=1))
+    set_state(temperature, "12", zero + timedelta(hours=1))
+    set_state(no_statistics, "2", zero + timedelta(hours=1))
+    set_state(temperature, "30", zero + timedelta(hours=9))
+
+    with session_scope(hass=hass) as session:
+        session.query(StatisticsRuns).delete()
+        session.add(StatisticsRuns(start=zero + timedelta(hours=7, minutes=55)))
+        metadata = StatisticsMeta.from_meta(
+            {
+                "has_mean": True,
+                "has_sum": False,
+                "name": None,
+                "source": "recorder",
+                "statistic_id": temperature,
+                "unit_of_measurement": "°C",
+            }
+        )
+        session.add(metadata)
+        session.flush()
+        for hour in range(8):
+            session.add(
+                Statistics.from_stats(
+                    metadata.id,
+                    {
+                        "start": zero + timedelta(hours=hour),
+                        "mean": hour + 1,
+                        "min": hour,
+                        "max": hour + 2,
+                    },
+                )
+            )
+
+    end = zero + timedelta(hours=10)
+    entity_ids = [temperature, no_statistics]
+    raw = history.get_significant_states(
+        hass, zero, end, entity_ids, minimal_response=True
+    )
+
+    # The bucket width is too small to use statistics
+    assert (
+        history.get_significant_states(
+            hass, zero, end, entity_ids, minimal_response=True, resolution=200
+        )
+        == raw
+    )
+
+    hist = history.get_significant_states(
+        hass, zero, end, entity_ids, minimal_response=True, resolution=5
+    )
+    assert list(hist) == entity_ids
+    assert (
+        hist[no_statistics]
+        == history.get_significant_states(
+            hass, zero, end, [no_statistics], minimal_response=True
+        )[no_statistics]
+    )
+    initial, *buckets, recent = hist[temperature]
+    assert initial.state == "10"
+    assert initial.last_changed == zero
+    assert buckets == [
+        {
+            "state": str(mean),
+            "last_changed": (zero + timedelta(hours=hour)).isoformat(),
+            "min": hour,
+            "max": hour + 3,
+        }
+        for hour, mean in ((0, 1.5), (2, 3.5), (4, 5.5), (6, 7.5))
+    ]
+    # States after the compiled statistics have the format of the buckets
+    assert recent == {
+        "state": "30",
+        "last_changed": (zero + timedelta(hours=9)).isoformat(),
+    }
+
+    compressed = history.get_significant_states(
+        hass,
+        zero,
+        end,
+        entity_ids,
+        minimal_response=True,
+        compressed_state_format=True,
+        resolution=5,
+    )
+    assert compressed[temperature][1] == {
+        "s": "1.5",
+        "lu": zero.timestamp(),
+        "min": 0,
+        "max": 3,
+    }
+    assert compressed[temperature][-1] == {
+        "s": "30",
+        "lu": (zero + timedelta(hours=9)).timestamp(),
+    }
+
+    # Statistics in another unit than the state are not used
+    hass.states.set(temperature, "30", {"unit_of_measurement": "°F"})
+    assert (
+        history.get_significant_states(
+            hass, zero, end, entity_ids, minimal_response=True, resolution=5
+        )
+        == raw
+    )
+
+
 def test_get_significant_states_with_initial(hass_recorder):
     """Test that only significant states are returned.
 
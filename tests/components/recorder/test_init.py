@@ -35,6 +35,7 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsRuns,
 )
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.sampling import RecorderSampler
 from homeassistant.components.recorder.services import (
     SERVICE_DISABLE,
     SERVICE_ENABLE,
@@ -57,6 +58,7 @@ from homeassistant.util import dt as dt_util
 
 from .common import (
     async_block_recorder,
+    async_recorder_block_till_done,
     async_wait_recording_done,
     corrupt_db_file,
     run_information_with_session,
@@ -85,6 +87,7 @@ def _default_recorder(hass):
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_t=[],
         exclude_attributes_by_domain={},
+        sampler=RecorderSampler([]),
     )
 
 
@@ -244,6 +247,54 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_states_in_one_commit(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test states changing more than once in a commit are linked to old states."""
+    await async_setup_recorder_instance(hass, {recorder.CONF_COMMIT_INTERVAL: 1})
+
+    hass.states.async_set("test.one", "1", {"test_attr": 1})
+    hass.states.async_set("test.two", "1")
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("test.one", "2", {"test_attr": 2})
+    hass.states.async_set("test.one", "3", {"test_attr": 1})
+    hass.states.async_set("test.two", "2")
+    hass.states.async_remove("test.two")
+    hass.states.async_set("test.two", "3")
+    hass.bus.async_fire("test_event", {"test_attr": 1})
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(
+            session.query(States).order_by(States.last_updated, States.state_id)
+        )
+        states = {}
+        for db_state in db_states:
+            states.setdefault(db_state.entity_id, []).append(db_state)
+        one = states["test.one"]
+        assert [db_state.state for db_state in one] == ["1", "2", "3"]
+        assert [db_state.old_state_id for db_state in one] == [
+            None,
+            one[0].state_id,
+            one[1].state_id,
+        ]
+        assert one[0].attributes_id == one[2].attributes_id
+        assert one[0].attributes_id != one[1].attributes_id
+        two = states["test.two"]
+        assert [db_state.state for db_state in two] == ["1", "2", None, "3"]
+        assert [db_state.old_state_id for db_state in two] == [
+            None,
+            two[0].state_id,
+            two[1].state_id,
+            None,
+        ]
+        assert session.query(Events).filter_by(event_type="test_event").count() == 1
+
+
 async def test_saving_state_with_intermixed_time_changes(
     hass: HomeAssistant, recorder_mock
 ):
@@ -276,17 +327,12 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with patch("time.sleep"), patch.object(
-        get_instance(hass).event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        get_instance(hass),
+        "_insert_pending_states",
+        side_effect=OperationalError(
+            "insert the state", "fake params", "forced to fail"
+        ),
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -314,17 +360,12 @@ def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with patch("time.sleep"), patch.object(
-        get_instance(hass).event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        get_instance(hass),
+        "_insert_pending_states",
+        side_effect=SQLAlchemyError(
+            "insert the state", "fake params", "forced to fail"
+        ),
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -0,0 +1,121 @@
+"""The tests for recorder sampling policies."""
+from datetime import timedelta
+
+from homeassistant.components.recorder.db_schema import States
+from homeassistant.components.recorder.sampling import RecorderSampler
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from tests.common import SetupRecorderInstanceT
+from tests.components.recorder.common import async_wait_recording_done
+
+
+def _state_changed(entity_id, state, last_updated, attributes=None):
+    """Return a state_changed event."""
+    new_state = State(entity_id, state, attributes, last_updated=last_updated)
+    return Event(EVENT_STATE_CHANGED, {"entity_id": entity_id, "new_state": new_state})
+
+
+def test_deadband():
+    """Test absolute and percent deadbands."""
+    sampler = RecorderSampler(
+        [
+            {"entities": ["sensor.power"], "deadband": 5},
+            {"entity_globs": ["sensor.voltage_*"], "deadband_percent": 1},
+        ]
+    )
+    now = dt_util.utcnow()
+
+    assert sampler.async_should_record(_state_changed("sensor.power", "100", now))
+    assert not sampler.async_should_record(_state_changed("sensor.power", "104", now))
+    assert sampler.async_should_record(_state_changed("sensor.power", "95", now))
+    # Non numeric states and attribute changes are always recorded
+    assert sampler.async_should_record(
+        _state_changed("sensor.power", "unavailable", now)
+    )
+    assert sampler.async_should_record(_state_changed("sensor.power", "95", now))
+    assert sampler.async_should_record(
+        _state_changed("sensor.power", "96", now, {"friendly_name": "Power"})
+    )
+
+    assert sampler.async_should_record(_state_changed("sensor.voltage_a", "230", now))
+    assert not sampler.async_should_record(
+        _state_changed("sensor.voltage_a", "231", now)
+    )
+    assert sampler.async_should_record(_state_changed("sensor.voltage_a", "233", now))
+    # Entities without a policy are not limited
+    assert sampler.async_should_record(_state_changed("sensor.other", "1", now))
+    assert sampler.async_should_record(_state_changed("sensor.other", "1", now))
+
+    assert sampler.suppressed == {
+        "deadband": 2,
+        "max_rows_per_hour": 0,
+        "min_interval": 0,
+    }
+
+
+def test_min_interval_and_max_rows_per_hour():
+    """Test states are limited in time."""
+    sampler = RecorderSampler(
+        [
+            {"entities": ["sensor.power"], "min_interval": timedelta(seconds=10)},
+            {"entities": ["sensor.energy"], "max_rows_per_hour": 2},
+        ]
+    )
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+
+    assert sampler.async_should_record(_state_changed("sensor.power", "1", hour))
+    assert not sampler.async_should_record(
+        _state_changed("sensor.power", "2", hour + timedelta(seconds=5))
+    )
+    assert sampler.async_should_record(
+        _state_changed("sensor.power", "3", hour + timedelta(seconds=10))
+    )
+
+    for minute, expected in ((0, True), (1, True), (2, False), (3, False)):
+        assert (
+            sampler.async_should_record(
+                _state_changed("sensor.energy", "1", hour + timedelta(minutes=minute))
+            )
+            is expected
+        )
+    # The limit starts over with the next hour
+    assert sampler.async_should_record(
+        _state_changed("sensor.energy", "1", hour + timedelta(hours=1))
+    )
+
+    assert sampler.suppressed == {
+        "deadband": 0,
+        "max_rows_per_hour": 2,
+        "min_interval": 1,
+    }
+
+
+async def test_suppressed_states_are_not_recorded(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test suppressed states never reach the database."""
+    instance = await async_setup_recorder_instance(
+        hass, {"sampling": [{"entities": "sensor.power", "deadband": 10}]}
+    )
+
+    for state in ("100", "101", "105", "120", "125"):
+        hass.states.async_set("sensor.power", state)
+    hass.states.async_set("sensor.other", "1")
+    hass.states.async_set("sensor.other", "2")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        recorded = [
+            (state.entity_id, state.state)
+            for state in session.query(States).order_by(States.state_id)
+        ]
+    assert recorded == [
+        ("sensor.power", "100"),
+        ("sensor.power", "120"),
+        ("sensor.other", "1"),
+        ("sensor.other", "2"),
+    ]
+    assert instance.sampler.suppressed["deadband"] == 3
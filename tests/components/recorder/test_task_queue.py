@@ -0,0 +1,138 @@
+"""The tests for the recorder task queue."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.components.recorder import core
+from homeassistant.components.recorder.task_queue import RecorderQueue
+from homeassistant.components.recorder.tasks import (
+    AdjustStatisticsTask,
+    ClearStatisticsTask,
+    CommitTask,
+    EventTask,
+    ImportStatisticsTask,
+    StatisticsTask,
+    StopTask,
+    UpdateStatisticsMetadataTask,
+)
+from homeassistant.core import Event, HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from tests.common import SetupRecorderInstanceT, async_fire_time_changed
+from tests.components.recorder.common import (
+    async_recorder_block_till_done,
+    async_wait_recording_done,
+)
+
+
+def test_priority_lane():
+    """Test priority tasks are processed before queued events."""
+    task_queue = RecorderQueue()
+    events = [EventTask(Event("test")) for _ in range(3)]
+    statistics_task = StatisticsTask(dt_util.utcnow())
+    import_task = ImportStatisticsTask({}, [])
+    commit_task = CommitTask()
+
+    for task in (*events, statistics_task, import_task, commit_task):
+        task_queue.put(task)
+
+    assert task_queue.qsize() == 6
+    stats = task_queue.stats()
+    assert stats["depth"] == {
+        "CommitTask": 1,
+        "EventTask": 3,
+        "ImportStatisticsTask": 1,
+        "StatisticsTask": 1,
+    }
+    assert stats["oldest_task_age"] >= 0
+
+    assert [task_queue.get() for _ in range(6)] == [
+        import_task,
+        commit_task,
+        *events,
+        statistics_task,
+    ]
+    assert task_queue.stats() == {"depth": {}, "oldest_task_age": None}
+
+
+def test_statistics_changes_keep_their_order():
+    """Test tasks changing statistics are processed in the order they are queued."""
+    task_queue = RecorderQueue()
+    event = EventTask(Event("test"))
+    clear_task = ClearStatisticsTask(["sensor.test"])
+    import_task = ImportStatisticsTask({}, [])
+    update_task = UpdateStatisticsMetadataTask("sensor.test", "sensor.new", "kWh")
+    adjust_task = AdjustStatisticsTask("sensor.new", dt_util.utcnow(), 1.0)
+
+    for task in (event, clear_task, import_task, update_task, adjust_task):
+        task_queue.put(task)
+
+    assert [task_queue.get() for _ in range(5)] == [
+        clear_task,
+        import_task,
+        update_task,
+        adjust_task,
+        event,
+    ]
+
+
+def test_clear():
+    """Test clearing the queue."""
+    task_queue = RecorderQueue()
+    task_queue.put(EventTask(Event("test")))
+    task_queue.put(CommitTask())
+
+    task_queue.clear()
+    assert task_queue.qsize() == 0
+    assert task_queue.stats() == {"depth": {}, "oldest_task_age": None}
+
+    stop_task = StopTask()
+    task_queue.put(stop_task)
+    assert task_queue.get() is stop_task
+
+
+async def test_commit_interval_follows_backlog(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test commits are spread out while there is a backlog."""
+    instance = await async_setup_recorder_instance(hass, {"commit_interval": 1})
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    assert instance.queue_stats["commit_interval"] == 1
+    assert instance.queue_stats["commit_latency"] is not None
+
+    with patch.object(core, "COMMIT_BACKLOG_STEP", 1), patch.object(
+        instance, "_event_session_has_pending_writes", return_value=True
+    ), patch.object(instance, "queue_task") as queue_task, patch.object(
+        instance._queue, "qsize", return_value=2
+    ):
+        assert instance.commit_interval_factor == 3
+        assert instance.queue_stats["commit_interval"] == 3
+        for seconds in range(1, 7):
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+            await hass.async_block_till_done()
+
+    commits = [
+        call for call in queue_task.mock_calls if isinstance(call.args[0], CommitTask)
+    ]
+    assert len(commits) == 2
+
+
+async def test_zero_commit_interval_commits_backlog_in_batches(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a backlog is committed in batches without a commit interval."""
+    instance = await async_setup_recorder_instance(hass, {"commit_interval": 0})
+    await async_wait_recording_done(hass)
+
+    with patch.object(core, "COMMIT_BACKLOG_STEP", 2), patch.object(
+        instance._queue, "qsize", return_value=10
+    ), patch.object(
+        instance,
+        "_commit_event_session_or_retry",
+        wraps=instance._commit_event_session_or_retry,
+    ) as commit:
+        for state in range(5):
+            hass.states.async_set("sensor.test", str(state))
+        await async_recorder_block_till_done(hass)
+
+    assert commit.call_count == 2
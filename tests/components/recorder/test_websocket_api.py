@@ -2,7 +2,7 @@
 # pylint: disable=protected-access,invalid-name
 from datetime import timedelta
 import threading
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 import pytest
@@ -627,7 +627,18 @@ async def test_recorder_info(hass, hass_ws_client, recorder_mock):
         "max_backlog": 40000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "queue": {
+            "commit_interval": 0,
+            "commit_latency": ANY,
+            "depth": {},
+            "oldest_task_age": None,
+        },
         "recording": True,
+        "suppressed_states": {
+            "deadband": 0,
+            "max_rows_per_hour": 0,
+            "min_interval": 0,
+        },
         "thread_running": True,
     }
 
@@ -714,6 +725,8 @@ async def test_recorder_info_migration_queue_exhausted(hass, hass_ws_client):
         assert response["result"]["migration_in_progress"] is True
         assert response["result"]["recording"] is False
         assert response["result"]["thread_running"] is True
+        assert response["result"]["queue"]["depth"]["EventTask"] > 0
+        assert response["result"]["queue"]["oldest_task_age"] > 0
 
     # Let migration finish
     migration_done.set()
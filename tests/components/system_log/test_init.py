@@ -367,3 +367,31 @@ async def test_config_path(hass, hass_ws_client):
         )
         log = (await get_error_log(hass_ws_client))[0]
     assert log["source"] == ["custom_component/test.py", 5]
+
+
+async def test_logger_stats(hass, hass_ws_client):
+    """Test listing the emitted and dropped records per logger."""
+    await async_setup_component(hass, system_log.DOMAIN, BASIC_CONFIG)
+    client = await hass_ws_client()
+    queue_handler = MagicMock(
+        diagnostics=MagicMock(
+            return_value={"test_logger": {"emitted": 2, "dropped": 1}}
+        )
+    )
+
+    with patch(
+        "homeassistant.components.system_log.get_queue_handler",
+        return_value=queue_handler,
+    ):
+        await client.send_json({"id": 5, "type": "system_log/logger_stats"})
+        msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"test_logger": {"emitted": 2, "dropped": 1}}
+
+    with patch(
+        "homeassistant.components.system_log.get_queue_handler", return_value=None
+    ):
+        await client.send_json({"id": 6, "type": "system_log/logger_stats"})
+        msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {}
@@ -15,15 +15,22 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATONS
-from homeassistant.core import Context, HomeAssistant, State, callback
+from homeassistant.core import Context, HomeAssistant, ServiceCall, State, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity,
+    refresh_scheduler,
+    service,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.json import json_loads
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
     MockModule,
@@ -520,6 +527,29 @@ async def test_get_services(hass, websocket_client):
     assert msg["result"] == hass.services.async_services()
 
 
+async def test_get_services_target_info(hass, websocket_client):
+    """Test the target resolution cache metrics are reported."""
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=MockConfigEntry().entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    for _ in range(2):
+        service.async_extract_referenced_entity_ids(
+            hass, ServiceCall("test", "test_service", {"device_id": device.id})
+        )
+
+    await websocket_client.send_json({"id": 5, "type": "get_services/target_info"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["hits"] == 1
+    assert msg["result"]["misses"] == 1
+    assert msg["result"]["hit_rate"] == 0.5
+    assert msg["result"]["entity_service_calls"] == 0
+
+
 async def test_get_config(hass, websocket_client):
     """Test get_config command."""
     await websocket_client.send_json({"id": 5, "type": "get_config"})
@@ -1701,6 +1731,55 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
     ]
 
 
+async def test_render_template_cache_info(hass, websocket_client):
+    """Test the counters of the caches shared by templates are reported."""
+    hass.states.async_set("light.a", "on")
+    template.Template(
+        "{% for state in states.light %}{{ state.state }}{% endfor %}", hass
+    ).async_render()
+
+    await websocket_client.send_json({"id": 5, "type": "render_template/cache_info"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {
+        "sorted_states": {"sorts": 1, "wrappers_created": 1},
+        "expanded_groups": {"expansions": 0, "expanded": 0},
+    }
+
+
+async def test_integration_refresh_info(hass, websocket_client):
+    """Test the metrics of the scheduled refreshes are reported."""
+    refresh = refresh_scheduler.async_get(hass).async_register("demo", "Demo data")
+    with patch(
+        "homeassistant.helpers.refresh_scheduler.monotonic", side_effect=[0, 1, 3]
+    ):
+        async with refresh.async_limit(datetime.timedelta(seconds=1)):
+            pass
+
+    await websocket_client.send_json({"id": 7, "type": "integration/refresh_info"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "domain": "demo",
+            "name": "Demo data",
+            "refreshes": 1,
+            "overruns": 1,
+            "last_duration": 2,
+            "max_duration": 2,
+            "average_duration": 2,
+            "last_wait": 1,
+            "max_wait": 1,
+        }
+    ]
+
+
 @pytest.mark.parametrize(
     "key,config",
     (
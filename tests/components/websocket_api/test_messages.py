@@ -3,10 +3,12 @@
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     cached_event_message,
+    event_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import callback
+from homeassistant.helpers.json import json_loads
 
 
 async def test_cached_event_message(hass):
@@ -78,6 +80,51 @@ async def test_cached_event_message_with_different_idens(hass):
     assert cache_info.currsize == 1
 
 
+async def test_cached_state_changed_event_message(hass):
+    """Test state changed event messages reuse the JSON of their states."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.window", "off", {"brightness": 100})
+    await hass.async_block_till_done()
+
+    state = hass.states.get("light.window")
+    as_dict_json = state.as_dict_json()
+    lru_event_cache.cache_clear()
+    for event in events:
+        assert json_loads(cached_event_message(2, event)) == json_loads(
+            message_to_json(event_message(2, event))
+        )
+    assert state.as_dict_json() is as_dict_json
+
+
+async def test_cached_state_changed_event_message_with_templates(hass):
+    """Test states containing the message templates are sent unchanged."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("sensor.template", "__NEW_STATE__", {"x": '"__NEW_STATE__"'})
+    hass.states.async_set("sensor.template", "__OLD_STATE__", {"x": '"__OLD_STATE__"'})
+    await hass.async_block_till_done()
+
+    lru_event_cache.cache_clear()
+    for event in events:
+        assert json_loads(cached_event_message(2, event)) == json_loads(
+            message_to_json(event_message(2, event))
+        )
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
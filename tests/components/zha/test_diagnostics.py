@@ -25,6 +25,8 @@ CONFIG_ENTRY_DIAGNOSTICS_KEYS = [
     "config",
     "config_entry",
     "application_state",
+    "state_writes",
+    "group_fan_out",
     "versions",
 ]
 
@@ -96,3 +98,4 @@ async def test_diagnostics_for_device(
             assert key in diagnostics_data
         else:
             assert diagnostics_data[key] == REDACTED
+    assert diagnostics_data["state_writes"] == zha_device.state_write_stats
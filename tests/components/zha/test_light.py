@@ -1628,3 +1628,80 @@ async def test_zha_group_light_entity(
     await zha_gateway.async_remove_zigpy_group(zha_group.group_id)
     assert hass.states.get(group_entity_id) is None
     assert zha_gateway.ha_entity_registry.async_get(group_entity_id) is None
+
+
+async def test_turn_off_lights_through_group(
+    hass, device_light_1, device_light_2, device_light_3, coordinator
+):
+    """Test lights turned off together share a command to their group."""
+    zha_gateway = get_zha_gateway(hass)
+    assert zha_gateway is not None
+    zha_gateway.coordinator_zha_device = coordinator
+    coordinator._zha_gateway = zha_gateway
+    device_light_1._zha_gateway = zha_gateway
+    device_light_2._zha_gateway = zha_gateway
+    members = [GroupMember(device_light_1.ieee, 1), GroupMember(device_light_2.ieee, 1)]
+
+    zha_group = await zha_gateway.async_create_zigpy_group("Test Group", members)
+    await hass.async_block_till_done()
+
+    entity_ids = [
+        await find_entity_id(Platform.LIGHT, zha_device, hass)
+        for zha_device in (device_light_1, device_light_2, device_light_3)
+    ]
+    await async_enable_traffic(hass, [device_light_1, device_light_2, device_light_3])
+    await async_wait_for_updates(hass)
+
+    group_cluster_on_off = zha_group.endpoint[general.OnOff.cluster_id]
+    clusters_on_off = [
+        zha_device.device.endpoints[1].on_off
+        for zha_device in (device_light_1, device_light_2, device_light_3)
+    ]
+    for cluster in (group_cluster_on_off, *clusters_on_off):
+        cluster.request = AsyncMock(return_value=[sentinel.data, zcl_f.Status.SUCCESS])
+
+    await hass.services.async_call(
+        LIGHT_DOMAIN, "turn_off", {"entity_id": entity_ids}, blocking=True
+    )
+
+    # The grouped lights are turned off with one command to the group
+    assert group_cluster_on_off.request.call_count == 1
+    assert group_cluster_on_off.request.call_args == call(
+        False,
+        group_cluster_on_off.commands_by_name["off"].id,
+        group_cluster_on_off.commands_by_name["off"].schema,
+        expect_reply=True,
+        manufacturer=None,
+        tries=1,
+        tsn=None,
+    )
+    assert clusters_on_off[0].request.call_count == 0
+    assert clusters_on_off[1].request.call_count == 0
+    assert clusters_on_off[2].request.call_count == 1
+    for entity_id in entity_ids:
+        assert hass.states.get(entity_id).state == STATE_OFF
+    assert zha_gateway.group_fan_out.stats == {
+        "group_commands": 1,
+        "unicast_commands_saved": 1,
+    }
+
+    # A single light is turned off by itself
+    group_cluster_on_off.request.reset_mock()
+    await hass.services.async_call(
+        LIGHT_DOMAIN, "turn_off", {"entity_id": entity_ids[0]}, blocking=True
+    )
+    assert group_cluster_on_off.request.call_count == 0
+    assert clusters_on_off[0].request.call_count == 1
+
+    # An unexpected error sending to the group falls back to unicast
+    group_cluster_on_off.request.side_effect = RuntimeError
+    for cluster in clusters_on_off:
+        cluster.request.reset_mock()
+    await hass.services.async_call(
+        LIGHT_DOMAIN, "turn_off", {"entity_id": entity_ids[:2]}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert group_cluster_on_off.request.call_count == 1
+    assert clusters_on_off[0].request.call_count == 1
+    assert clusters_on_off[1].request.call_count == 1
+    assert zha_gateway.group_fan_out.stats["group_commands"] == 1
@@ -1,4 +1,5 @@
 """Test zha sensor."""
+from datetime import timedelta
 import math
 from unittest.mock import patch
 
@@ -48,6 +49,8 @@ from .common import (
 )
 from .conftest import SIG_EP_INPUT, SIG_EP_OUTPUT, SIG_EP_PROFILE, SIG_EP_TYPE
 
+from tests.common import async_fire_time_changed
+
 ENTITY_ID_PREFIX = "sensor.fakemanufacturer_fakemodel_{}"
 
 
@@ -969,3 +972,57 @@ async def test_elec_measurement_skip_unsupported_attribute(
         a for call in cluster.read_attributes.call_args_list for a in call[0][0]
     }
     assert read_attrs == supported_attributes
+
+
+async def test_elec_measurement_coalesced_state_writes(hass, elec_measurement_zha_dev):
+    """Test state writes caused by one attribute report are merged."""
+
+    entity_id = ENTITY_ID_PREFIX.format("electricalmeasurement")
+    zha_dev = elec_measurement_zha_dev
+    cluster = zha_dev.device.endpoints[1].electrical_measurement
+    await send_attributes_report(hass, cluster, {"ac_power_divisor": 1})
+
+    channel_signals = zha_dev.channel_signals
+    state_writes = zha_dev.state_writes
+    coalesced_state_writes = zha_dev.coalesced_state_writes
+
+    await send_attributes_report(hass, cluster, {0: 1, 1291: 100, 10: 1000})
+    assert_state(hass, entity_id, "100", POWER_WATT)
+
+    # Every entity of the channel is written once for the three attributes
+    assert zha_dev.channel_signals == channel_signals + 3
+    writes = zha_dev.state_writes - state_writes
+    assert writes > 0
+    assert zha_dev.coalesced_state_writes - coalesced_state_writes == 2 * writes
+
+    # State writes outside of channel signals are not deferred
+    entity = hass.data["sensor"].get_entity(entity_id)
+    entity.async_write_ha_state()
+    assert zha_dev.state_writes - state_writes == writes
+    assert not zha_dev._pending_state_writes
+
+
+async def test_elec_measurement_deferred_write_of_removed_entity(
+    hass, elec_measurement_zha_dev
+):
+    """Test deferred state writes are dropped when the entity is removed."""
+
+    entity_id = ENTITY_ID_PREFIX.format("electricalmeasurement")
+    zha_dev = elec_measurement_zha_dev
+    zha_dev.attribute_report_window = 1000
+    cluster = zha_dev.device.endpoints[1].electrical_measurement
+    await send_attributes_report(hass, cluster, {"ac_power_divisor": 1})
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    await send_attributes_report(hass, cluster, {0: 1, 1291: 100, 10: 1000})
+    entity = hass.data["sensor"].get_entity(entity_id)
+    assert entity.unique_id in zha_dev._pending_state_writes
+
+    await entity.async_remove()
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+    assert entity.unique_id not in zha_dev._pending_state_writes
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import AsyncGenerator, Callable, Generator
 from contextlib import asynccontextmanager
+from datetime import timedelta
 import functools
 from json import JSONDecoder, loads
 import logging
@@ -197,6 +198,15 @@ def bcrypt_cost():
     bcrypt.gensalt = gensalt_orig
 
 
+@pytest.fixture(autouse=True)
+def refresh_jitter():
+    """Run the first scheduled refreshes one interval after setup."""
+    with patch(
+        "homeassistant.helpers.refresh_scheduler.MAX_REFRESH_JITTER", timedelta(0)
+    ):
+        yield
+
+
 @pytest.fixture
 def hass_storage():
     """Fixture to mock storage."""
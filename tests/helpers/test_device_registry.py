@@ -862,6 +862,38 @@ async def test_no_unnecessary_changes(registry):
     assert len(mock_save.mock_calls) == 0
 
 
+async def test_batch_saves_and_announces_once(hass, registry, update_events):
+    """Test devices created in a batch are saved together."""
+    batch = registry.async_batch()
+    with patch.object(registry, "async_schedule_save") as mock_schedule_save:
+        entry1 = registry.async_get_or_create(
+            config_entry_id="1234", identifiers={("hue", "456")}, batch=batch
+        )
+        entry2 = registry.async_get_or_create(
+            config_entry_id="1234", identifiers={("hue", "789")}, batch=batch
+        )
+        # Updates of devices created by the batch are part of their creation
+        registry.async_get_or_create(
+            config_entry_id="1234",
+            identifiers={("hue", "456")},
+            sw_version="1.0",
+            batch=batch,
+        )
+        await hass.async_block_till_done()
+        assert len(mock_schedule_save.mock_calls) == 0
+        assert update_events == []
+
+        batch.async_commit()
+        await hass.async_block_till_done()
+
+    assert len(mock_schedule_save.mock_calls) == 1
+    assert update_events == [
+        {"action": "create", "device_id": entry1.id},
+        {"action": "create", "device_id": entry2.id},
+    ]
+    assert registry.async_get(entry1.id).sw_version == "1.0"
+
+
 async def test_format_mac(registry):
     """Make sure we normalize mac addresses."""
     entry = registry.async_get_or_create(
@@ -30,6 +30,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockPlatform,
+    async_capture_events,
     async_fire_time_changed,
     mock_entity_platform,
     mock_registry,
@@ -154,7 +155,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.async_track_refresh_interval")
 async def test_set_scan_interval_via_platform(mock_track, hass):
     """Test the setting of the scan interval via platform."""
 
@@ -584,6 +585,40 @@ async def test_registry_respect_entity_disabled(hass):
     assert hass.states.async_entity_ids() == []
 
 
+async def test_adding_entities_registers_them_in_one_batch(hass):
+    """Test entities added together are saved as one batch."""
+    registry = mock_registry(hass)
+    device_registry = dr.async_get(hass)
+    platform = MockEntityPlatform(hass)
+    platform.config_entry = MockConfigEntry(entry_id="super-mock-id")
+    entity_events = async_capture_events(hass, er.EVENT_ENTITY_REGISTRY_UPDATED)
+    device_events = async_capture_events(hass, dr.EVENT_DEVICE_REGISTRY_UPDATED)
+    entities = [
+        MockEntity(
+            name=f"Entity {idx}",
+            unique_id=str(idx),
+            device_info={"identifiers": {("hue", str(idx // 2))}},
+        )
+        for idx in range(4)
+    ]
+
+    with patch.object(
+        registry, "async_schedule_save"
+    ) as mock_schedule_save, patch.object(
+        device_registry, "async_schedule_save"
+    ) as mock_device_schedule_save:
+        await platform.async_add_entities(entities)
+        await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 4
+    assert len(mock_schedule_save.mock_calls) == 1
+    assert len(mock_device_schedule_save.mock_calls) == 1
+    assert [event.data for event in entity_events] == [
+        {"action": "create", "entity_id": entity.entity_id} for entity in entities
+    ]
+    assert [event.data["action"] for event in device_events] == ["create", "create"]
+
+
 async def test_unique_id_conflict_has_priority_over_disabled_entity(hass, caplog):
     """Test that an entity that is not unique has priority over a disabled entity."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
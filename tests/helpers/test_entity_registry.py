@@ -222,6 +222,50 @@ def test_create_triggers_save(hass, registry):
     assert len(mock_schedule_save.mock_calls) == 1
 
 
+async def test_batch_saves_and_announces_once(hass, registry, update_events):
+    """Test entities created in a batch are saved together."""
+    batch = registry.async_batch()
+    with patch.object(registry, "async_schedule_save") as mock_schedule_save:
+        entry = registry.async_get_or_create("light", "hue", "1234", batch=batch)
+        registry.async_get_or_create("light", "hue", "5678", batch=batch)
+        # Updates of entities created by the batch are part of their creation
+        registry.async_update_entity(
+            entry.entity_id,
+            disabled_by=er.RegistryEntryDisabler.DEVICE,
+            batch=batch,
+        )
+        await hass.async_block_till_done()
+        assert len(mock_schedule_save.mock_calls) == 0
+        assert update_events == []
+
+        batch.async_commit()
+        await hass.async_block_till_done()
+
+    assert len(mock_schedule_save.mock_calls) == 1
+    assert update_events == [
+        {"action": "create", "entity_id": "light.hue_1234"},
+        {"action": "create", "entity_id": "light.hue_5678"},
+    ]
+    assert (
+        registry.async_get("light.hue_1234").disabled_by
+        is er.RegistryEntryDisabler.DEVICE
+    )
+
+    # Updates of existing entities are not deferred by a batch
+    batch = registry.async_batch()
+    registry.async_get_or_create(
+        "light", "hue", "1234", original_name="Hue", batch=batch
+    )
+    registry.async_get_or_create("light", "hue", "9012", batch=batch)
+    await hass.async_block_till_done()
+    assert update_events[2]["action"] == "update"
+    assert update_events[2]["entity_id"] == "light.hue_1234"
+
+    batch.async_commit()
+    await hass.async_block_till_done()
+    assert update_events[3] == {"action": "create", "entity_id": "light.hue_9012"}
+
+
 async def test_loading_saving_data(hass, registry):
     """Test that we load/save data correctly."""
     mock_config = MockConfigEntry(domain="light")
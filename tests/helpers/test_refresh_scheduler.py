@@ -0,0 +1,213 @@
+"""Tests for the refresh scheduler helper."""
+import asyncio
+from datetime import timedelta
+import logging
+from unittest.mock import patch
+
+from homeassistant.core import HassJob, callback
+from homeassistant.helpers import entity_platform, refresh_scheduler, update_coordinator
+from homeassistant.util.dt import utcnow
+
+from tests.common import MockEntityPlatform, async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_next_refresh_is_spread_within_interval(hass):
+    """Test the next refresh is offset but never later than one interval."""
+    scheduler = refresh_scheduler.async_get(hass)
+    assert scheduler is refresh_scheduler.async_get(hass)
+
+    interval = timedelta(seconds=30)
+    now = utcnow().replace(microsecond=500_000)
+    refresh = scheduler.async_register("test", "early")
+    refresh.offset = 250_000
+    assert (
+        refresh.async_next_refresh(interval, now)
+        == now.replace(microsecond=250_000) + interval
+    )
+
+    refresh.offset = 750_000
+    assert refresh.async_next_refresh(interval, now) == now.replace(
+        microsecond=750_000
+    ) + interval - timedelta(seconds=1)
+
+    short_interval = timedelta(milliseconds=100)
+    assert refresh.async_next_refresh(short_interval, now) == now + short_interval
+
+
+async def test_first_refresh_is_spread_across_interval(hass):
+    """Test refreshes started together are spread across their interval."""
+    scheduler = refresh_scheduler.async_get(hass)
+    now = utcnow().replace(microsecond=0)
+    interval = timedelta(seconds=60)
+
+    with patch(
+        "homeassistant.helpers.refresh_scheduler.MAX_REFRESH_JITTER",
+        timedelta(minutes=5),
+    ), patch(
+        "homeassistant.helpers.refresh_scheduler.random.random",
+        side_effect=[0.25, 0.75, 1],
+    ), patch(
+        "homeassistant.helpers.refresh_scheduler.random.randint", return_value=0
+    ):
+        first = scheduler.async_register("test", "first")
+        second = scheduler.async_register("test", "second")
+        assert first.async_next_refresh(interval, now) == now + timedelta(seconds=45)
+        assert second.async_next_refresh(interval, now) == now + timedelta(seconds=15)
+
+        # Later refreshes keep the period
+        later = now + timedelta(seconds=45)
+        assert first.async_next_refresh(interval, later) == later + interval
+
+        # The spread of long intervals is limited
+        third = scheduler.async_register("test", "third")
+        assert third.async_next_refresh(timedelta(hours=1), now) == now + timedelta(
+            minutes=55
+        )
+
+
+async def test_concurrency_limit_per_integration(hass):
+    """Test scheduled refreshes of an integration are limited."""
+    scheduler = refresh_scheduler.async_get(hass)
+    scheduler.async_set_max_concurrent_refreshes("test", 1)
+    first = scheduler.async_register("test", "first")
+    second = scheduler.async_register("test", "second")
+    other = scheduler.async_register("other", "other")
+
+    release = asyncio.Event()
+    running = []
+
+    async def _refresh(refresh):
+        async with refresh.async_limit(timedelta(seconds=30)):
+            running.append(refresh.name)
+            await release.wait()
+
+    tasks = [
+        hass.async_create_task(_refresh(refresh)) for refresh in (first, second, other)
+    ]
+    await asyncio.sleep(0)
+    assert running == ["first", "other"]
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert running == ["first", "other", "second"]
+    assert second.refreshes == 1
+    assert second.last_wait > 0
+
+
+async def test_overrun_metrics(hass):
+    """Test refreshes taking longer than their interval are counted."""
+    scheduler = refresh_scheduler.async_get(hass)
+    refresh = scheduler.async_register("test", "slow")
+
+    with patch(
+        "homeassistant.helpers.refresh_scheduler.monotonic",
+        side_effect=[0, 0, 10],
+    ):
+        async with refresh.async_limit(timedelta(seconds=5)):
+            pass
+
+    assert refresh.as_dict() == {
+        "domain": "test",
+        "name": "slow",
+        "refreshes": 1,
+        "overruns": 1,
+        "last_duration": 10,
+        "max_duration": 10,
+        "average_duration": 10,
+        "last_wait": 0,
+        "max_wait": 0,
+    }
+    assert scheduler.async_diagnostics() == [refresh.as_dict()]
+
+
+async def test_schedule_runs_job(hass):
+    """Test a scheduled refresh fires within the interval."""
+    calls = []
+
+    @callback
+    def _refresh(now):
+        calls.append(now)
+
+    refresh = refresh_scheduler.async_get(hass).async_register("test", "job")
+    refresh.async_schedule(HassJob(_refresh), timedelta(seconds=10))
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
+async def test_track_refresh_interval(hass):
+    """Test tracking a refresh interval through the scheduler."""
+    calls = []
+
+    async def _refresh(now):
+        calls.append(now)
+
+    interval = timedelta(seconds=10)
+    unsub = refresh_scheduler.async_track_refresh_interval(
+        hass, _refresh, interval, domain="test", name="sensor.test"
+    )
+
+    async_fire_time_changed(hass, utcnow() + interval)
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    async_fire_time_changed(hass, utcnow() + interval * 2)
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    diagnostics = refresh_scheduler.async_get(hass).async_diagnostics()
+    assert diagnostics[0]["name"] == "sensor.test"
+    assert diagnostics[0]["refreshes"] == 2
+
+    unsub()
+    async_fire_time_changed(hass, utcnow() + interval * 3)
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_coordinator_reports_metrics(hass):
+    """Test a coordinator reports scheduled refreshes to the scheduler."""
+
+    async def _update():
+        return 1
+
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=_update,
+        update_interval=timedelta(seconds=10),
+    )
+    unsub = crd.async_add_listener(lambda: None)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert crd.data == 1
+
+    diagnostics = refresh_scheduler.async_get(hass).async_diagnostics()
+    assert len(diagnostics) == 1
+    # Without a config entry or platform the coordinator is limited on its own
+    assert diagnostics[0]["domain"] == "test"
+    assert diagnostics[0]["name"] == "test"
+    assert diagnostics[0]["refreshes"] == 1
+    assert diagnostics[0]["overruns"] == 0
+    unsub()
+
+
+async def test_coordinator_domain_from_platform(hass):
+    """Test a coordinator created by a platform is limited with its integration."""
+    platform = MockEntityPlatform(hass, platform_name="demo")
+    token = entity_platform.current_platform.set(platform)
+    try:
+        crd = update_coordinator.DataUpdateCoordinator[int](
+            hass, _LOGGER, name="test", update_interval=timedelta(seconds=10)
+        )
+    finally:
+        entity_platform.current_platform.reset(token)
+
+    crd.async_add_listener(lambda: None)()
+    diagnostics = refresh_scheduler.async_get(hass).async_diagnostics()
+    assert diagnostics[0]["domain"] == "demo"
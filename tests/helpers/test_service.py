@@ -527,6 +527,33 @@ async def test_extract_entity_ids_from_devices(hass, area_mock):
     )
 
 
+async def test_extract_entity_ids_target_resolution_cache(hass, area_mock):
+    """Test resolved area and device targets are cached until registries change."""
+    cache = service.async_get_target_resolution_cache(hass)
+    call = ha.ServiceCall("light", "turn_on", {"area_id": "test-area"})
+
+    for _ in range(2):
+        assert await service.async_extract_entity_ids(hass, call) == {
+            "light.in_area",
+            "light.assigned_to_area",
+        }
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+    ent_reg.async_get(hass).async_update_entity(
+        "light.in_own_area", area_id="test-area"
+    )
+    await hass.async_block_till_done()
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_area",
+        "light.assigned_to_area",
+        "light.in_own_area",
+    }
+    assert cache.hits == 1
+    assert cache.misses == 2
+    assert cache.as_dict()["hit_rate"] == 1 / 3
+
+
 async def test_async_get_all_descriptions(hass):
     """Test async_get_all_descriptions."""
     group = hass.components.group
@@ -217,6 +217,57 @@ def test_iterating_domain_states(hass):
     )
 
 
+def test_iterating_domain_states_sorted_states(hass):
+    """Test iterated domain states are shared and kept up to date."""
+    tmpl = template.Template(
+        "{% for state in states.sensor %}{{ state.state }}{% endfor %}", hass
+    )
+    hass.states.async_set("sensor.b", "one")
+    hass.states.async_set("sensor.a", "two")
+    hass.states.async_set("test.object", "happy")
+    sorted_states = template._async_get_sorted_states(hass)
+
+    assert tmpl.async_render() == "twoone"
+    assert tmpl.async_render() == "twoone"
+    assert sorted_states.sorts == 1
+    assert sorted_states.wrappers_created == 2
+
+    # Updating a state only wraps the updated state again
+    hass.states.async_set("sensor.b", "three")
+    hass.states.async_set("test.object", "sad")
+    assert tmpl.async_render() == "twothree"
+    assert sorted_states.sorts == 1
+    assert sorted_states.wrappers_created == 3
+
+    # Adding and removing entities sorts the domain again
+    hass.states.async_set("sensor.c", "four")
+    assert tmpl.async_render() == "twothreefour"
+    assert sorted_states.sorts == 2
+
+    hass.states.async_remove("sensor.a")
+    assert tmpl.async_render() == "threefour"
+    assert sorted_states.sorts == 3
+
+
+async def test_sorted_states_not_shared_with_render_thread(hass):
+    """Test a render in another thread does not use the shared sorted states."""
+    tmpl = template.Template(
+        "{% for state in states.sensor %}{{ state.state }}{% endfor %}", hass
+    )
+    hass.states.async_set("sensor.b", "one")
+    hass.states.async_set("sensor.a", "two")
+    sorted_states = template._async_get_sorted_states(hass)
+
+    assert not await tmpl.async_render_will_timeout(5)
+    assert sorted_states.as_dict() == {"sorts": 0, "wrappers_created": 0}
+
+    assert tmpl.async_render() == "twoone"
+    assert template.async_get_cache_info(hass)["sorted_states"] == {
+        "sorts": 1,
+        "wrappers_created": 2,
+    }
+
+
 def test_float_function(hass):
     """Test float function."""
     hass.states.async_set("sensor.temperature", "12")
@@ -2308,6 +2359,82 @@ async def test_expand(hass):
     )
 
 
+async def test_expanded_groups_not_shared_with_render_thread(hass):
+    """Test a render in another thread does not use the shared expansions."""
+    hass.states.async_set("light.a", "on")
+    hass.states.async_set("group.lights", "on", {"entity_id": ["light.a"]})
+    tmpl = template.Template(
+        "{{ expand('group.lights') | map(attribute='entity_id') | join(', ') }}",
+        hass,
+    )
+    expanded_groups = template._async_get_expanded_groups(hass)
+
+    assert not await tmpl.async_render_will_timeout(5)
+    assert expanded_groups.as_dict() == {"expansions": 0, "expanded": 0}
+
+    assert tmpl.async_render() == "light.a"
+    assert template.async_get_cache_info(hass)["expanded_groups"] == {
+        "expansions": 1,
+        "expanded": 1,
+    }
+
+
+async def test_expand_nested_groups(hass):
+    """Test expanded nested groups are kept until their members change."""
+    expanded_groups = template._async_get_expanded_groups(hass)
+    hass.states.async_set("light.a", "on")
+    hass.states.async_set("light.b", "off")
+    hass.states.async_set("group.inner", "on", {"entity_id": ["light.b", "light.c"]})
+    hass.states.async_set(
+        "group.outer", "on", {"entity_id": ["light.a", "group.inner", "group.outer"]}
+    )
+    tmpl_str = "{{ expand('group.outer') | map(attribute='entity_id') | join(', ') }}"
+
+    info = render_to_info(hass, tmpl_str)
+    assert_result_info(
+        info,
+        "light.a, light.b",
+        ["group.outer", "group.inner", "light.a", "light.b", "light.c"],
+    )
+    assert expanded_groups.expansions == 1
+
+    # State changes of members do not expand the group again
+    hass.states.async_set("light.a", "off")
+    hass.states.async_set("group.inner", "off", {"entity_id": ["light.b", "light.c"]})
+    info = render_to_info(hass, tmpl_str)
+    assert_result_info(
+        info,
+        "light.a, light.b",
+        ["group.outer", "group.inner", "light.a", "light.b", "light.c"],
+    )
+    assert expanded_groups.expansions == 1
+
+    # Adding a missing member expands the group again
+    hass.states.async_set("light.c", "on")
+    info = render_to_info(hass, tmpl_str)
+    assert_result_info(
+        info,
+        "light.a, light.b, light.c",
+        ["group.outer", "group.inner", "light.a", "light.b", "light.c"],
+    )
+    assert expanded_groups.expansions == 2
+
+    # Changing the members of a nested group expands the group again
+    hass.states.async_set("group.inner", "off", {"entity_id": ["light.c"]})
+    info = render_to_info(hass, tmpl_str)
+    assert_result_info(
+        info, "light.a, light.c", ["group.outer", "group.inner", "light.a", "light.c"]
+    )
+    assert expanded_groups.expansions == 3
+
+    hass.states.async_remove("light.a")
+    info = render_to_info(hass, tmpl_str)
+    assert_result_info(
+        info, "light.c", ["group.outer", "group.inner", "light.a", "light.c"]
+    )
+    assert expanded_groups.expansions == 4
+
+
 async def test_device_entities(hass):
     """Test device_entities function."""
     config_entry = MockConfigEntry(domain="light")
@@ -9,6 +9,8 @@ import functools
 import gc
 import logging
 import os
+from pathlib import Path
+import sys
 from tempfile import TemporaryDirectory
 from typing import Any
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
@@ -40,6 +42,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import json_bytes
 import homeassistant.util.dt as dt_util
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
@@ -637,6 +640,17 @@ def test_state_dict_conversion():
     assert state == ha.State.from_dict(state.as_dict())
 
 
+def test_state_dict_conversion_interns_attribute_keys():
+    """Test attribute keys of states converted from dicts are interned."""
+    key = "".join(["some_", "attribute"])
+    state = ha.State.from_dict(
+        {"entity_id": "light.kitchen", "state": "on", "attributes": {key: 1}}
+    )
+    (state_key,) = state.attributes
+    assert state_key == key
+    assert state_key is sys.intern(key)
+
+
 def test_state_dict_conversion_with_wrong_data():
     """Test conversion with wrong data."""
     assert ha.State.from_dict(None) is None
@@ -763,6 +777,50 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_shares_unchanged_attributes(hass):
+    """Test unchanged attributes are shared between consecutive states."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    first = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    second = hass.states.get("light.bowl")
+    assert second.attributes is first.attributes
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    third = hass.states.get("light.bowl")
+    assert third.attributes == {"brightness": 50}
+    assert second.attributes == {"brightness": 100}
+
+
+async def test_state_json_is_cached(hass):
+    """Test the JSON of a state is encoded once and shared when unchanged."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    first = hass.states.get("light.bowl")
+    assert first.as_dict_json() == json_bytes(first.as_dict())
+    assert first.as_dict_json() is first.as_dict_json()
+    assert first.attributes_json() == b'{"brightness":100}'
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    second = hass.states.get("light.bowl")
+    assert second.attributes_json() is first.attributes_json()
+    assert second.as_dict_json() == json_bytes(second.as_dict())
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    assert hass.states.get("light.bowl").attributes_json() == b'{"brightness":50}'
+
+
+async def test_state_json_matches_helpers_encoding(hass):
+    """Test states are encoded like the JSON helpers encode them."""
+    hass.states.async_set(
+        "light.bowl",
+        "on",
+        {"rgb_color": (255, 0, 0), "effect_list": {"rainbow"}, "file": Path("/x")},
+    )
+    state = hass.states.get("light.bowl")
+    assert state.as_dict_json() == json_bytes(state.as_dict())
+    assert state.attributes_json() == json_bytes(state.attributes)
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -63,6 +63,60 @@ async def test_logging_with_queue_handler():
     assert simple_queue.empty()
 
 
+async def test_queue_handler_drops_records_before_queueing():
+    """Test records over the rate limit are dropped before queueing."""
+    simple_queue = queue.SimpleQueue()  # type: ignore
+    handler = logging_util.HomeAssistantQueueHandler(simple_queue)
+
+    def _record(name, levelno):
+        return logging.makeLogRecord({"name": name, "levelno": levelno, "msg": "x"})
+
+    assert handler.handle(_record("noisy.lib", logging.INFO))
+    assert simple_queue.qsize() == 1
+
+    handler.set_rate_limits({"noisy": 2})
+    with patch("homeassistant.util.logging.time.monotonic", return_value=100):
+        assert handler.handle(_record("noisy.lib", logging.INFO))
+        assert handler.handle(_record("noisy.lib.sub", logging.INFO))
+        # The bucket is shared with the children of the limited logger
+        assert not handler.handle(_record("noisy.lib", logging.INFO))
+        # Warnings and other loggers are never limited
+        assert handler.handle(_record("noisy.lib", logging.WARNING))
+        assert handler.handle(_record("quiet", logging.INFO))
+    with patch("homeassistant.util.logging.time.monotonic", return_value=100.5):
+        assert handler.handle(_record("noisy.lib", logging.INFO))
+        assert not handler.handle(_record("noisy.lib", logging.INFO))
+
+    assert handler.diagnostics() == {
+        "noisy.lib": {"emitted": 4, "dropped": 2},
+        "noisy.lib.sub": {"emitted": 1, "dropped": 0},
+        "quiet": {"emitted": 1, "dropped": 0},
+    }
+    handler.close()
+
+
+async def test_migrated_log_handler_drops_records(hass):
+    """Test records over the rate limit are dropped with the migrated handlers."""
+    logging_util.async_activate_log_queue_handler(hass)
+    queue_handler = logging_util.get_queue_handler()
+    queue_handler.set_rate_limits({f"{__name__}.noisy": 5})
+    logger = logging.getLogger(f"{__name__}.noisy.lib")
+    logger.setLevel(logging.DEBUG)
+
+    with patch("homeassistant.util.logging.time.monotonic", return_value=100):
+        for _ in range(10):
+            logger.debug("Noisy record")
+
+    assert queue_handler.diagnostics()[f"{__name__}.noisy.lib"] == {
+        "emitted": 5,
+        "dropped": 5,
+    }
+
+    logger.setLevel(logging.NOTSET)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+
 async def test_migrate_log_handler(hass):
     """Test migrating log handlers."""
 
@@ -72,11 +126,13 @@ async def test_migrate_log_handler(hass):
 
     assert len(logging.root.handlers) == 1
     assert isinstance(logging.root.handlers[0], logging_util.HomeAssistantQueueHandler)
+    assert logging_util.get_queue_handler() is logging.root.handlers[0]
 
     hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
     await hass.async_block_till_done()
 
     assert logging.root.handlers == original_handlers
+    assert logging_util.get_queue_handler() is None
 
 
 @pytest.mark.no_fail_on_log_exception